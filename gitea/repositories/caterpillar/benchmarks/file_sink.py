@@ -0,0 +1,46 @@
+"""Number of lines per second written to a file sink, depending on its options.
+
+Run with: PYTHONPATH=. python benchmarks/file_sink.py
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from loguru import logger
+
+CONFIGS = [
+    ("default", {}),
+    ("rotation", {"rotation": "100 MB"}),
+    ("block buffering", {"buffering": 65536}),
+    ("block buffering + rotation", {"buffering": 65536, "rotation": "100 MB"}),
+    (
+        "block buffering + rotation + flush",
+        {"buffering": 65536, "rotation": "100 MB", "flush_interval": 1},
+    ),
+]
+
+
+def main(number=200000):
+    logger.remove()
+    directory = tempfile.mkdtemp()
+    try:
+        for name, options in CONFIGS:
+            path = os.path.join(directory, "%s.log" % name.replace(" ", "_"))
+            try:
+                handler_id = logger.add(path, format="{message}", **options)
+            except TypeError:
+                print("%-36s unsupported" % name)
+                continue
+            start = time.perf_counter()
+            for _ in range(number):
+                logger.info("A line of text of a reasonable length for a log message")
+            logger.remove(handler_id)
+            seconds = time.perf_counter() - start
+            print("%-36s %10.0f lines/s" % (name, number / seconds))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Time taken to log a message to a sink serializing the records to JSON.
+
+Run with: PYTHONPATH=. python benchmarks/serialize.py
+"""
+import timeit
+
+from loguru import logger
+
+CONFIGS = [
+    ("text only", {}),
+    ("serialize=True", {"serialize": True}),
+    (
+        "serialize=[time, level, message, extra]",
+        {"serialize": ["time.timestamp", "level.name", "message", "extra"]},
+    ),
+]
+
+
+class NullSink:
+    def write(self, message):
+        pass
+
+
+def main(number=100000):
+    logger.remove()
+    for name, options in CONFIGS:
+        handler_id = logger.add(NullSink(), **options)
+        seconds = timeit.timeit(lambda: logger.info("Message"), number=number)
+        logger.remove(handler_id)
+        print("%-40s %8.2f us" % (name, seconds / number * 1000000))
+
+
+if __name__ == "__main__":
+    main()
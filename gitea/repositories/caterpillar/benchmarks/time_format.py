@@ -0,0 +1,20 @@
+"""Time taken to format the time of a log record with the default format of loguru.
+
+Run with: PYTHONPATH=. python benchmarks/time_format.py
+"""
+import timeit
+
+from loguru._datetime import aware_now
+
+SPECS = ["YYYY-MM-DD HH:mm:ss.SSS", "YYYY-MM-DD HH:mm:ss.SSS Z", "HH:mm:ss", ""]
+
+
+def main(number=200000):
+    now = aware_now()
+    for spec in SPECS:
+        seconds = timeit.timeit(lambda: format(now, spec), number=number)
+        print("%-30r %8.2f us" % (spec, seconds / number * 1000000))
+
+
+if __name__ == "__main__":
+    main()
@@ -126,9 +126,9 @@ else:
     from typing_extensions import ContextManager
 
 if sys.version_info >= (3, 8):
-    from typing import Protocol, TypedDict
+    from typing import Literal, Protocol, TypedDict
 else:
-    from typing_extensions import Protocol, TypedDict
+    from typing_extensions import Literal, Protocol, TypedDict
 
 _T = TypeVar("_T")
 _F = TypeVar("_F", bound=Callable[..., Any])
@@ -203,6 +203,8 @@ PatcherFunction = Callable[[Record], None]
 RotationFunction = Callable[[Message, TextIO], bool]
 RetentionFunction = Callable[[List[str]], None]
 CompressionFunction = Callable[[str], None]
+SerializeFields = Union[bool, Sequence[str], Dict[str, str]]
+JsonEncoder = Callable[[Dict[str, Any]], str]
 
 # Actually unusable because TypedDict can't allow extra keys: python/mypy#4617
 class _HandlerConfig(TypedDict, total=False):
@@ -213,11 +215,16 @@ class _HandlerConfig(TypedDict, total=False):
     format: Union[str, FormatFunction]
     filter: Optional[Union[str, FilterFunction, FilterDict]]
     colorize: Optional[bool]
-    serialize: bool
+    serialize: SerializeFields
     backtrace: bool
     diagnose: bool
-    enqueue: bool
+    enqueue: Union[bool, Literal["batch"]]
+    capacity: Optional[int]
+    overflow: Literal["block", "drop"]
+    batch_size: int
+    json_encoder: Optional[JsonEncoder]
     catch: bool
+    dedup_tracebacks: Optional[Union[float, timedelta]]
 
 class LevelConfig(TypedDict, total=False):
     name: str
@@ -237,27 +244,43 @@ class Logger:
         format: Union[str, FormatFunction] = ...,
         filter: Optional[Union[str, FilterFunction, FilterDict]] = ...,
         colorize: Optional[bool] = ...,
-        serialize: bool = ...,
+        serialize: SerializeFields = ...,
         backtrace: bool = ...,
         diagnose: bool = ...,
-        enqueue: bool = ...,
-        catch: bool = ...
+        enqueue: Union[bool, Literal["batch"]] = ...,
+        capacity: Optional[int] = ...,
+        overflow: Literal["block", "drop"] = ...,
+        batch_size: int = ...,
+        json_encoder: Optional[JsonEncoder] = ...,
+        catch: bool = ...,
+        dedup_tracebacks: Optional[Union[float, timedelta]] = ...
     ) -> int: ...
     @overload
     def add(
         self,
-        sink: Callable[[Message], Awaitable[None]],
+        sink: Union[
+            Callable[[Message], Awaitable[None]],
+            Callable[[List[Message]], Awaitable[None]],
+        ],
         *,
         level: Union[str, int] = ...,
         format: Union[str, FormatFunction] = ...,
         filter: Optional[Union[str, FilterFunction, FilterDict]] = ...,
         colorize: Optional[bool] = ...,
-        serialize: bool = ...,
+        serialize: SerializeFields = ...,
         backtrace: bool = ...,
         diagnose: bool = ...,
-        enqueue: bool = ...,
+        enqueue: Union[bool, Literal["batch"]] = ...,
+        capacity: Optional[int] = ...,
+        overflow: Literal["block", "drop"] = ...,
+        batch_size: int = ...,
+        json_encoder: Optional[JsonEncoder] = ...,
         catch: bool = ...,
-        loop: Optional[AbstractEventLoop] = ...
+        dedup_tracebacks: Optional[Union[float, timedelta]] = ...,
+        loop: Optional[AbstractEventLoop] = ...,
+        queue_size: Optional[int] = ...,
+        queue_overflow: Literal["block", "drop_oldest", "drop_new"] = ...,
+        queue_batch_size: Optional[int] = ...
     ) -> int: ...
     @overload
     def add(
@@ -268,15 +291,23 @@ class Logger:
         format: Union[str, FormatFunction] = ...,
         filter: Optional[Union[str, FilterFunction, FilterDict]] = ...,
         colorize: Optional[bool] = ...,
-        serialize: bool = ...,
+        serialize: SerializeFields = ...,
         backtrace: bool = ...,
         diagnose: bool = ...,
-        enqueue: bool = ...,
+        enqueue: Union[bool, Literal["batch"]] = ...,
+        capacity: Optional[int] = ...,
+        overflow: Literal["block", "drop"] = ...,
+        batch_size: int = ...,
+        json_encoder: Optional[JsonEncoder] = ...,
         catch: bool = ...,
+        dedup_tracebacks: Optional[Union[float, timedelta]] = ...,
         rotation: Optional[Union[str, int, time, timedelta, RotationFunction]] = ...,
         retention: Optional[Union[str, int, timedelta, RetentionFunction]] = ...,
         compression: Optional[Union[str, CompressionFunction]] = ...,
         delay: bool = ...,
+        background: bool = ...,
+        flush_interval: Optional[Union[str, float, timedelta]] = ...,
+        shared: bool = ...,
         mode: str = ...,
         buffering: int = ...,
         encoding: str = ...,
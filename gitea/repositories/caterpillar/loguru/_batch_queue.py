@@ -0,0 +1,141 @@
+import threading
+from collections import deque
+
+from ._locks_machinery import create_handler_lock
+
+
+class BatchQueue:
+    """Queue of formatted messages written to the sink by a worker thread, several at a time.
+
+    Messages are appended to a deque by the logging threads, nothing is pickled nor locked unless
+    the queue is full (with ``overflow="block"``) or the worker thread is waiting for messages.
+    """
+
+    def __init__(self, sink, error_interceptor, *, name, capacity, overflow, batch_size):
+        self._sink = sink
+        self._error_interceptor = error_interceptor
+        self._capacity = capacity
+        self._block = overflow == "block"
+        self._batch_size = batch_size
+        self._write_batch = sink.write_batch if getattr(sink, "batchable", False) else None
+        self._flush = sink.flush if getattr(sink, "buffered", False) else None
+
+        self._deque = deque()
+        self._stopped = False
+        self._idle = False
+        self._wakeup = threading.Event()
+        self._blocked = 0
+        self._not_full = threading.Condition(threading.Lock())
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._worker, daemon=True, name=name)
+        self._thread.start()
+
+    def put(self, message):
+        if self._capacity is not None and len(self._deque) >= self._capacity:
+            if not self._block:
+                self.dropped += 1
+                return
+            with self._not_full:
+                self._blocked += 1
+                try:
+                    while len(self._deque) >= self._capacity and not self._stopped:
+                        self._not_full.wait()
+                finally:
+                    self._blocked -= 1
+        self._push(message)
+
+    def complete(self):
+        event = threading.Event()
+        self._push(event)
+        event.wait()
+
+    def stop(self):
+        self._stopped = True
+        self._push(None)
+        self._thread.join()
+        with self._not_full:
+            self._not_full.notify_all()
+
+    def _push(self, item):
+        self._deque.append(item)
+        if self._idle:
+            self._wakeup.set()
+
+    def _pop_batch(self):
+        batch = []
+        popleft = self._deque.popleft
+
+        while len(batch) < self._batch_size:
+            try:
+                item = popleft()
+            except IndexError:
+                break
+            batch.append(item)
+            if not isinstance(item, str):
+                break
+
+        if self._blocked:
+            with self._not_full:
+                self._not_full.notify_all()
+
+        return batch
+
+    def _wait(self):
+        # The deque is checked again after setting the flag, so that a message pushed in between
+        # is either seen here or wakes up the worker.
+        self._idle = True
+        if not self._deque:
+            self._wakeup.wait()
+        self._wakeup.clear()
+        self._idle = False
+
+    def _worker(self):
+        # We need to use a lock to protect sink during fork.
+        # Particularly, writing to stderr may lead to deadlock in child process.
+        lock = create_handler_lock()
+
+        while True:
+            batch = self._pop_batch()
+
+            if not batch:
+                self._wait()
+                continue
+
+            item = batch[-1]
+            if not isinstance(item, str):
+                batch.pop()
+
+            if batch:
+                with lock:
+                    self._write(batch)
+
+            if item is None:
+                break
+
+            if isinstance(item, threading.Event):
+                if self._flush is not None:
+                    with lock:
+                        try:
+                            self._flush()
+                        except Exception:
+                            self._error_interceptor.print(None)
+                item.set()
+
+    def _write(self, messages):
+        if self._write_batch is not None:
+            try:
+                self._write_batch(messages)
+            except Exception:
+                if not self._error_interceptor.should_catch():
+                    raise
+                self._error_interceptor.print(messages[0].record)
+            return
+
+        for message in messages:
+            try:
+                self._sink.write(message)
+            except Exception:
+                if not self._error_interceptor.should_catch():
+                    raise
+                self._error_interceptor.print(message.record)
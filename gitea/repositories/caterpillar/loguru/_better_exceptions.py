@@ -1,4 +1,5 @@
 import builtins
+import functools
 import inspect
 import io
 import keyword
@@ -7,9 +8,12 @@ import os
 import re
 import sys
 import sysconfig
+import time
 import tokenize
 import traceback
 
+from ._locks_machinery import create_handler_lock
+
 
 class SyntaxHighlighter:
 
@@ -30,15 +34,33 @@ class SyntaxHighlighter:
     _constants = {"True", "False", "None"}
     _punctation = {"(", ")", "[", "]", "{", "}", ":", ",", ";"}
 
+    _cache_size = 1024
+
     def __init__(self, style=None):
         self._style = style or self._default_style
+        self._cache = {}
 
     def highlight(self, source):
+        # The same lines are often highlighted again, each time the same error happens
+        try:
+            return self._cache[source]
+        except KeyError:
+            pass
+
+        output = self._highlight(source)
+
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[source] = output
+
+        return output
+
+    def _highlight(self, source):
         style = self._style
         row, column = 0, 0
         output = ""
 
-        for token in self.tokenize(source):
+        for token in self.tokens(source):
             type_, string, start, end, line = token
 
             if type_ == tokenize.NAME:
@@ -81,6 +103,11 @@ class SyntaxHighlighter:
 
         return output
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def tokens(source):
+        return tuple(SyntaxHighlighter.tokenize(source))
+
     @staticmethod
     def tokenize(source):
         # Worth reading: https://www.asmeurer.com/brown-water-python/
@@ -120,6 +147,7 @@ class ExceptionFormatter:
         encoding="ascii",
         hidden_frames_filename=None,
         prefix="",
+        dedup_interval=None,
     ):
         self._colorize = colorize
         self._diagnose = diagnose
@@ -130,11 +158,25 @@ class ExceptionFormatter:
         self._encoding = encoding
         self._hidden_frames_filename = hidden_frames_filename
         self._prefix = prefix
+        self._dedup_interval = dedup_interval
+        self._tracebacks = {}
+        # Exceptions are formatted outside the handler lock
+        self._tracebacks_lock = create_handler_lock()
         self._lib_dirs = self._get_lib_dirs()
+        self._files_mine = {}
         self._pipe_char = self._get_char("\u2502", "|")
         self._cap_char = self._get_char("\u2514", "->")
         self._catch_point_identifier = " <Loguru catch point here>"
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tracebacks_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._tracebacks_lock = create_handler_lock()
+
     @staticmethod
     def _get_lib_dirs():
         schemes = sysconfig.get_scheme_names()
@@ -155,10 +197,22 @@ class ExceptionFormatter:
             return char
 
     def _is_file_mine(self, file):
+        try:
+            return self._files_mine[file]
+        except KeyError:
+            pass
+
         filepath = os.path.abspath(file).lower()
         if not filepath.endswith(".py"):
-            return False
-        return not any(filepath.startswith(d) for d in self._lib_dirs)
+            is_mine = False
+        else:
+            is_mine = not any(filepath.startswith(d) for d in self._lib_dirs)
+
+        if len(self._files_mine) >= 1024:
+            self._files_mine.clear()
+        self._files_mine[file] = is_mine
+
+        return is_mine
 
     def _extract_frames(self, tb, is_first, *, limit=None, from_decorator=False):
         frames, final_source = [], None
@@ -233,7 +287,7 @@ class ExceptionFormatter:
         is_valid_value = False
         is_assignment = True
 
-        for token in self._syntax_highlighter.tokenize(source):
+        for token in self._syntax_highlighter.tokens(source):
             type_, string, (_, col), *_ = token
 
             if pending is not None:
@@ -415,13 +469,7 @@ class ExceptionFormatter:
         error_message = exception_only[-1][:-1]  # Remove last new line temporarily
 
         if self._colorize:
-            if ":" in error_message:
-                exception_type, exception_value = error_message.split(":", 1)
-                exception_type = self._theme["exception_type"].format(exception_type)
-                exception_value = self._theme["exception_value"].format(exception_value)
-                error_message = exception_type + ":" + exception_value
-            else:
-                error_message = self._theme["exception_type"].format(error_message)
+            error_message = self._colorize_error_message(error_message)
 
         if self._diagnose and frames:
             if (
@@ -456,7 +504,82 @@ class ExceptionFormatter:
 
         yield "".join(frames_lines)
 
+    def _colorize_error_message(self, error_message):
+        if ":" in error_message:
+            exception_type, exception_value = error_message.split(":", 1)
+            exception_type = self._theme["exception_type"].format(exception_type)
+            exception_value = self._theme["exception_value"].format(exception_value)
+            return exception_type + ":" + exception_value
+        return self._theme["exception_type"].format(error_message)
+
+    @staticmethod
+    def _get_traceback_key(value, tb, from_decorator):
+        # The types and locations of the chained exceptions, as strings so the handler is picklable
+        key = [from_decorator]
+        seen = set()
+
+        while True:
+            seen.add(id(value))
+            locations = []
+            while tb is not None:
+                locations.append((tb.tb_frame.f_code.co_filename, tb.tb_lineno))
+                tb = tb.tb_next
+            type_ = type(value)
+            key.append((type_.__module__, type_.__qualname__, tuple(locations)))
+
+            if value.__cause__ is not None:
+                value = value.__cause__
+            elif value.__context__ is not None and not value.__suppress_context__:
+                value = value.__context__
+            else:
+                break
+
+            if id(value) in seen:
+                break
+            tb = value.__traceback__
+
+        return tuple(key)
+
+    def _format_repeated_exception(self, value, tb, from_decorator):
+        key = self._get_traceback_key(value, tb, from_decorator)
+
+        with self._tracebacks_lock:
+            now = time.monotonic()
+            occurrence = self._tracebacks.get(key)
+
+            if occurrence is None or now - occurrence[0] >= self._dedup_interval:
+                if len(self._tracebacks) >= 1024:
+                    self._tracebacks = {
+                        k: v
+                        for k, v in self._tracebacks.items()
+                        if now - v[0] < self._dedup_interval
+                    }
+                self._tracebacks[key] = [now, 0]
+                return None
+
+            occurrence[1] += 1
+            first_seen, repeated = occurrence
+
+        introduction = "Traceback (same as %.1f seconds ago, repeated %d time%s since)" % (
+            now - first_seen,
+            repeated,
+            "s" * (repeated > 1),
+        )
+        error_message = traceback.format_exception_only(type(value), value)[-1][:-1]
+
+        if self._colorize:
+            introduction = self._theme["introduction"].format(introduction)
+            error_message = self._colorize_error_message(error_message)
+
+        return self._prefix + introduction + "\n" + error_message + "\n"
+
     def format_exception(self, type_, value, tb, *, from_decorator=False):
+        if self._dedup_interval is not None and value is not None:
+            repeated = self._format_repeated_exception(value, tb, from_decorator)
+            if repeated is not None:
+                yield repeated
+                return
+
         yield from self._format_exception(
             value, tb, is_first=True, from_decorator=from_decorator
         )
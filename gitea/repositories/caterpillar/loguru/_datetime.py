@@ -1,7 +1,9 @@
+import functools
 import re
 from calendar import day_abbr, day_name, month_abbr, month_name
 from datetime import datetime as datetime_
 from datetime import timedelta, timezone
+from operator import attrgetter, methodcaller
 from time import localtime, strftime
 
 tokens = r"H{1,2}|h{1,2}|m{1,2}|s{1,2}|S{1,6}|YYYY|YY|M{1,4}|D{1,4}|Z{1,2}|zz|A|X|x|E|Q|dddd|ddd|d"
@@ -9,6 +11,135 @@ tokens = r"H{1,2}|h{1,2}|m{1,2}|s{1,2}|S{1,6}|YYYY|YY|M{1,4}|D{1,4}|Z{1,2}|zz|A|
 pattern = re.compile(r"(?:{0})|\[(?:{0}|!UTC)\]".format(tokens))
 
 
+def _get_offset(dt):
+    tzinfo = dt.tzinfo or timezone(timedelta(seconds=0))
+    offset = tzinfo.utcoffset(dt).total_seconds()
+    sign = ("-", "+")[offset >= 0]
+    h, m = divmod(abs(offset // 60), 60)
+    return sign, h, m
+
+
+def _get_timestamp(dt):
+    return dt.timestamp()
+
+
+# Each token is rendered with a "%" conversion of the value returned by its getter
+renderers = {
+    "YYYY": ("%04d", attrgetter("year")),
+    "YY": ("%02d", lambda dt: dt.year % 100),
+    "Q": ("%d", lambda dt: (dt.month - 1) // 3 + 1),
+    "MMMM": ("%s", lambda dt: month_name[dt.month]),
+    "MMM": ("%s", lambda dt: month_abbr[dt.month]),
+    "MM": ("%02d", attrgetter("month")),
+    "M": ("%d", attrgetter("month")),
+    "DDDD": ("%03d", lambda dt: dt.timetuple().tm_yday),
+    "DDD": ("%d", lambda dt: dt.timetuple().tm_yday),
+    "DD": ("%02d", attrgetter("day")),
+    "D": ("%d", attrgetter("day")),
+    "dddd": ("%s", lambda dt: day_name[dt.weekday()]),
+    "ddd": ("%s", lambda dt: day_abbr[dt.weekday()]),
+    "d": ("%d", methodcaller("weekday")),
+    "E": ("%d", methodcaller("isoweekday")),
+    "HH": ("%02d", attrgetter("hour")),
+    "H": ("%d", attrgetter("hour")),
+    "hh": ("%02d", lambda dt: (dt.hour - 1) % 12 + 1),
+    "h": ("%d", lambda dt: (dt.hour - 1) % 12 + 1),
+    "mm": ("%02d", attrgetter("minute")),
+    "m": ("%d", attrgetter("minute")),
+    "ss": ("%02d", attrgetter("second")),
+    "s": ("%d", attrgetter("second")),
+    "S": ("%d", lambda dt: dt.microsecond // 100000),
+    "SS": ("%02d", lambda dt: dt.microsecond // 10000),
+    "SSS": ("%03d", lambda dt: dt.microsecond // 1000),
+    "SSSS": ("%04d", lambda dt: dt.microsecond // 100),
+    "SSSSS": ("%05d", lambda dt: dt.microsecond // 10),
+    "SSSSSS": ("%06d", attrgetter("microsecond")),
+    "A": ("%s", lambda dt: ("AM", "PM")[dt.hour // 12]),
+    "Z": ("%s", lambda dt: "%s%02d:%02d" % _get_offset(dt)),
+    "ZZ": ("%s", lambda dt: "%s%02d%02d" % _get_offset(dt)),
+    "zz": (
+        "%s",
+        lambda dt: (dt.tzinfo or timezone(timedelta(seconds=0))).tzname(dt) or "",
+    ),
+    "X": ("%d", _get_timestamp),
+    "x": ("%d", lambda dt: int(dt.timestamp()) * 1000000 + dt.microsecond),
+}
+
+
+# Tokens depending on more than the date and time to the second, not rendered in the cached prefix
+uncached_tokens = {
+    "S",
+    "SS",
+    "SSS",
+    "SSSS",
+    "SSSSS",
+    "SSSSSS",
+    "Z",
+    "ZZ",
+    "zz",
+    "X",
+    "x",
+}
+
+
+class CompiledFormat:
+    """A time format split into "%" templates and the getters of the values of their tokens.
+
+    The text up to the first token that changes more often than every second (or that depends on
+    the timezone) is cached, as consecutive messages are most often logged in the same second.
+    """
+
+    def __init__(self, prefix_template, prefix_getters, template, getters):
+        self._prefix_template = prefix_template
+        self._prefix_getters = prefix_getters
+        self._template = template
+        self._getters = getters
+        self._cache = (None, None)
+
+    def format(self, dt):
+        key = (dt.second, dt.minute, dt.hour, dt.day, dt.month, dt.year)
+        cached_key, prefix = self._cache
+
+        if key != cached_key:
+            prefix = self._prefix_template % tuple([getter(dt) for getter in self._prefix_getters])
+            self._cache = (key, prefix)
+
+        if not self._getters:
+            return prefix
+
+        return prefix + self._template % tuple([getter(dt) for getter in self._getters])
+
+
+@functools.lru_cache(maxsize=128)
+def compile_format(spec):
+    templates = ([], [])
+    getters = ([], [])
+    part = 0
+    position = 0
+
+    for match in pattern.finditer(spec):
+        templates[part].append(spec[position : match.start()].replace("%", "%%"))
+        position = match.end()
+        token = match.group(0)
+        if token in renderers:
+            if token in uncached_tokens:
+                part = 1
+            conversion, getter = renderers[token]
+            templates[part].append(conversion)
+            getters[part].append(getter)
+        else:
+            templates[part].append(token[1:-1].replace("%", "%%"))
+
+    templates[part].append(spec[position:].replace("%", "%%"))
+
+    return CompiledFormat(
+        "".join(templates[0]),
+        tuple(getters[0]),
+        "".join(templates[1]),
+        tuple(getters[1]),
+    )
+
+
 class datetime(datetime_):
     def __format__(self, spec):
         if spec.endswith("!UTC"):
@@ -23,59 +154,7 @@ class datetime(datetime_):
         if "%" in spec:
             return datetime_.__format__(dt, spec)
 
-        year, month, day, hour, minute, second, weekday, yearday, _ = dt.timetuple()
-        microsecond = dt.microsecond
-        timestamp = dt.timestamp()
-        tzinfo = dt.tzinfo or timezone(timedelta(seconds=0))
-        offset = tzinfo.utcoffset(dt).total_seconds()
-        sign = ("-", "+")[offset >= 0]
-        h, m = divmod(abs(offset // 60), 60)
-
-        rep = {
-            "YYYY": "%04d" % year,
-            "YY": "%02d" % (year % 100),
-            "Q": "%d" % ((month - 1) // 3 + 1),
-            "MMMM": month_name[month],
-            "MMM": month_abbr[month],
-            "MM": "%02d" % month,
-            "M": "%d" % month,
-            "DDDD": "%03d" % yearday,
-            "DDD": "%d" % yearday,
-            "DD": "%02d" % day,
-            "D": "%d" % day,
-            "dddd": day_name[weekday],
-            "ddd": day_abbr[weekday],
-            "d": "%d" % weekday,
-            "E": "%d" % (weekday + 1),
-            "HH": "%02d" % hour,
-            "H": "%d" % hour,
-            "hh": "%02d" % ((hour - 1) % 12 + 1),
-            "h": "%d" % ((hour - 1) % 12 + 1),
-            "mm": "%02d" % minute,
-            "m": "%d" % minute,
-            "ss": "%02d" % second,
-            "s": "%d" % second,
-            "S": "%d" % (microsecond // 100000),
-            "SS": "%02d" % (microsecond // 10000),
-            "SSS": "%03d" % (microsecond // 1000),
-            "SSSS": "%04d" % (microsecond // 100),
-            "SSSSS": "%05d" % (microsecond // 10),
-            "SSSSSS": "%06d" % microsecond,
-            "A": ("AM", "PM")[hour // 12],
-            "Z": "%s%02d:%02d" % (sign, h, m),
-            "ZZ": "%s%02d%02d" % (sign, h, m),
-            "zz": tzinfo.tzname(dt) or "",
-            "X": "%d" % timestamp,
-            "x": "%d" % (int(timestamp) * 1000000 + microsecond),
-        }
-
-        def get(m):
-            try:
-                return rep[m.group(0)]
-            except KeyError:
-                return m.group(0)[1:-1]
-
-        return pattern.sub(get, spec)
+        return compile_format(spec).format(dt)
 
 
 def aware_now():
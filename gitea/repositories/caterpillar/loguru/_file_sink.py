@@ -1,17 +1,26 @@
+import contextlib
 import datetime as datetime_
 import decimal
 import glob
 import locale
 import numbers
 import os
+import queue
 import shutil
 import string
+import threading
 from functools import partial
+from time import monotonic
 
 from . import _string_parsers as string_parsers
 from ._ctime_functions import get_ctime, set_ctime
 from ._datetime import aware_now, datetime
 
+if os.name == "nt":
+    fcntl = None
+else:
+    import fcntl
+
 
 def generate_rename_path(root, ext, creation_time):
     creation_datetime = datetime.fromtimestamp(creation_time)
@@ -100,10 +109,30 @@ class Rotation:
     def forward_interval(t, interval):
         return t + interval
 
-    @staticmethod
-    def rotation_size(message, file, size_limit):
-        file.seek(0, 2)
-        return file.tell() + len(message) > size_limit
+    class RotationSize:
+        def __init__(self, size_limit, shared=False):
+            self._size_limit = size_limit
+            self._shared = shared
+            self._file = None
+            self._size = 0
+
+        def __call__(self, message, file):
+            # The size is read once per file and then updated with each message, rather than
+            # seeking to the end of the file which would flush it every time. A shared file is
+            # also appended to by other processes, but it is never buffered: its size is read
+            # every time.
+            if self._shared:
+                self._size = os.fstat(file.fileno()).st_size
+            elif file is not self._file:
+                file.flush()
+                self._file = file
+                self._size = os.fstat(file.fileno()).st_size
+
+            size = len(message.encode(file.encoding, file.errors))
+            if self._size + size > self._size_limit:
+                return True
+            self._size += size
+            return False
 
     class RotationTime:
         def __init__(self, step_forward, time_init=None):
@@ -136,15 +165,79 @@ class Rotation:
             return False
 
 
+class BackgroundTasks:
+    """Worker thread compressing and cleaning up the closed files, in the order they were closed.
+
+    The queue is bounded so that the logging threads wait for the worker rather than piling up
+    files to compress if rotations happen faster than compressions.
+    """
+
+    capacity = 8
+
+    def __init__(self, error_interceptor):
+        self._error_interceptor = error_interceptor
+        self._queue = None
+        self._thread = None
+        self._owner_process_pid = None
+
+    def put(self, task):
+        if self._thread is None or self._owner_process_pid != os.getpid():
+            # The worker thread does not survive a fork, the child process needs its own
+            self._queue = queue.Queue(self.capacity)
+            self._owner_process_pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._worker, daemon=True, name="loguru-file-tasks"
+            )
+            self._thread.start()
+        self._queue.put(task)
+
+    def join(self):
+        if self._thread is not None and self._owner_process_pid == os.getpid():
+            self._queue.join()
+
+    def stop(self):
+        if self._thread is not None and self._owner_process_pid == os.getpid():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+
+    def _worker(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    break
+                task()
+            except Exception:
+                # There is no caller to propagate the error to, it is always printed
+                self._error_interceptor.print(None)
+            finally:
+                self._queue.task_done()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_queue"] = None
+        state["_thread"] = None
+        state["_owner_process_pid"] = None
+        return state
+
+
 class FileSink:
+    compression_marker = ".compressing"
+    lock_suffix = ".lock"
+
     def __init__(
         self,
         path,
+        error_interceptor,
         *,
         rotation=None,
         retention=None,
         compression=None,
         delay=False,
+        background=False,
+        flush_interval=None,
+        shared=False,
         mode="a",
         buffering=1,
         encoding=None,
@@ -162,18 +255,56 @@ class FileSink:
         }
         self._path = str(path)
 
+        if shared:
+            if fcntl is None:
+                raise ValueError("The 'shared' option is not supported on this platform")
+            if mode != "a":
+                raise ValueError(
+                    "Invalid mode, it should be 'a' if the file is shared, not: '%s'" % mode
+                )
+
         self._glob_patterns = self._make_glob_patterns(self._path)
-        self._rotation_function = self._make_rotation_function(rotation)
+        self._rotation_function = self._make_rotation_function(rotation, shared)
         self._retention_function = self._make_retention_function(retention)
         self._compression_function = self._make_compression_function(compression)
+        self._flush_interval = self._make_flush_interval(flush_interval)
 
         self._file = None
         self._file_path = None
+        self._next_flush = 0.0
+        self.batchable = True
+        self.buffered = buffering not in (0, 1) and not shared
+
+        # The processes sharing the file agree on which one is the current file through the lock
+        # file, which contains a generation number incremented at each rotation and the path.
+        self._shared = shared
+        self._lock_path = os.path.abspath(self._path) + self.lock_suffix
+        self._lock_fd = None
+        self._lock_pid = None
+        self._state = None
+
+        if background:
+            self._tasks = BackgroundTasks(error_interceptor)
+            # The files which must not be removed by the retention: the current one and the ones
+            # waiting for their turn to be compressed.
+            self._reserved_paths = set()
+            self._reserved_paths_lock = threading.Lock()
+        else:
+            self._tasks = None
+        self.has_background_tasks = background
 
         if not delay:
             self._initialize_file()
 
+        # The markers of a shared file may belong to the compressions of other processes
+        if background and not shared and self._compression_function is not None:
+            self._resume_compressions()
+
     def write(self, message):
+        if self._shared:
+            self._write_shared(message)
+            return
+
         if self._file is None:
             self._initialize_file()
 
@@ -184,6 +315,37 @@ class FileSink:
 
         self._file.write(message)
 
+        if self._flush_interval is not None:
+            self._flush_periodically()
+
+    def write_batch(self, messages):
+        if self._rotation_function is not None:
+            for message in messages:
+                self.write(message)
+            return
+
+        if self._file is None:
+            self._initialize_file()
+
+        if self._shared:
+            self._append("".join(messages))
+            return
+
+        self._file.write("".join(messages))
+
+        if self._flush_interval is not None:
+            self._flush_periodically()
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def _flush_periodically(self):
+        now = monotonic()
+        if now >= self._next_flush:
+            self._file.flush()
+            self._next_flush = now + self._flush_interval
+
     def _prepare_new_path(self):
         path = self._path.format_map({"time": FileDateFormatter()})
         path = os.path.abspath(path)
@@ -191,8 +353,92 @@ class FileSink:
         os.makedirs(dirname, exist_ok=True)
         return path
 
+    def _write_shared(self, message):
+        if self._file is None:
+            self._initialize_file()
+
+        if self._rotation_function is not None:
+            if self._read_state() != self._state:
+                # Another process rotated the file, the rotation function is still called so that
+                # its own state (like the next rotation time) follows the new file.
+                with self._locked():
+                    self._open_shared_file()
+                self._rotation_function(message, self._file)
+            elif self._rotation_function(message, self._file):
+                with self._locked():
+                    if self._read_state() == self._state:
+                        self._terminate_file(is_rotating=True)
+                        generation = int(self._state.partition("\n")[0]) + 1
+                        self._write_state("%d\n%s" % (generation, self._file_path))
+                    else:
+                        self._open_shared_file()
+
+        self._append(message)
+
+    def _append(self, text):
+        # The file is opened with "O_APPEND" and never buffered, so that each record is added
+        # at the end of the file at once, even if other processes write to it concurrently.
+        data = text.encode(self._file.encoding, self._file.errors)
+        fd = self._file.fileno()
+        while data:
+            data = data[os.write(fd, data) :]
+
+    def _open_shared_file(self):
+        # The lock must be held: the file named in the lock file is opened, unless it no longer
+        # exists and a new one is started.
+        state = self._read_state()
+        generation, _, path = state.partition("\n")
+        if not path or not os.path.isfile(path):
+            path = self._prepare_new_path()
+            generation = int(generation) if generation.isdigit() else 0
+            state = self._write_state("%d\n%s" % (generation + 1, path))
+
+        if self._file is not None:
+            self._file.close()
+
+        self._file = open(path, **self._kwargs)
+        self._file_path = path
+        self._state = state
+
+    @contextlib.contextmanager
+    def _locked(self):
+        fd = self._get_lock_fd()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _get_lock_fd(self):
+        # The lock belongs to the open file description, which a forked process shares with its
+        # parent: each process opens the lock file again.
+        if self._lock_pid != os.getpid():
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+            os.makedirs(os.path.dirname(self._lock_path), exist_ok=True)
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._lock_pid = os.getpid()
+        return self._lock_fd
+
+    def _read_state(self):
+        return os.fsdecode(os.pread(self._get_lock_fd(), 4096, 0))
+
+    def _write_state(self, state):
+        data = os.fsencode(state)
+        fd = self._get_lock_fd()
+        os.pwrite(fd, data, 0)
+        os.ftruncate(fd, len(data))
+        self._state = state
+        return state
+
     def _initialize_file(self):
+        if self._shared:
+            with self._locked():
+                self._open_shared_file()
+            return
+
         path = self._prepare_new_path()
+        self._reserve_path(path)
         self._file = open(path, **self._kwargs)
         self._file_path = path
 
@@ -212,34 +458,114 @@ class FileSink:
                 root, ext = os.path.splitext(old_path)
                 renamed_path = generate_rename_path(root, ext, creation_time)
                 os.rename(old_path, renamed_path)
+                self._reserve_path(renamed_path, old_path)
                 old_path = renamed_path
 
-        if is_rotating or self._rotation_function is None:
-            if self._compression_function is not None and old_path is not None:
-                self._compression_function(old_path)
-
-            if self._retention_function is not None:
-                logs = {
-                    file
-                    for pattern in self._glob_patterns
-                    for file in glob.glob(pattern)
-                    if os.path.isfile(file)
-                }
-                self._retention_function(list(logs))
+        # The other processes may still be writing to a shared file which is not rotated
+        if is_rotating or (self._rotation_function is None and not self._shared):
+            if self._tasks is None:
+                self._finalize_file(old_path)
+            else:
+                if self._compression_function is not None and old_path is not None:
+                    open(old_path + self.compression_marker, "w").close()
+                self._tasks.put(partial(self._finalize_file, old_path))
 
         if is_rotating:
+            self._reserve_path(new_path)
             file = open(new_path, **self._kwargs)
             set_ctime(new_path, datetime.now().timestamp())
 
             self._file_path = new_path
             self._file = file
 
+    def _finalize_file(self, path):
+        if self._compression_function is not None and path is not None:
+            self._compression_function(path)
+            if self._tasks is not None:
+                os.remove(path + self.compression_marker)
+
+        if self._tasks is not None:
+            self._release_path(path)
+
+        if self._retention_function is not None:
+            logs = {
+                file
+                for pattern in self._glob_patterns
+                for file in glob.glob(pattern)
+                if os.path.isfile(file) and not file.endswith(self.compression_marker)
+            }
+            if self._shared:
+                logs = {log for log in logs if os.path.abspath(log) != self._lock_path}
+            if self._tasks is not None:
+                with self._reserved_paths_lock:
+                    reserved_paths = self._reserved_paths.copy()
+                logs = {log for log in logs if os.path.abspath(log) not in reserved_paths}
+            self._retention_function(list(logs))
+
+    def _reserve_path(self, path, replaced_path=None):
+        if self._tasks is None:
+            return
+        with self._reserved_paths_lock:
+            self._reserved_paths.discard(replaced_path)
+            self._reserved_paths.add(path)
+
+    def _release_path(self, path):
+        with self._reserved_paths_lock:
+            self._reserved_paths.discard(path)
+
+    def _resume_compressions(self):
+        # A marker is left next to each file whose compression has not been completed, possibly
+        # because the previous process was killed while compressing it.
+        current_path = os.path.abspath(self._path)
+        markers = {
+            file
+            for pattern in self._glob_patterns
+            for file in glob.glob(pattern)
+            if file.endswith(self.compression_marker)
+        }
+        for marker in sorted(markers):
+            path = os.path.abspath(marker[: -len(self.compression_marker)])
+            if os.path.isfile(path) and path != current_path:
+                self._reserve_path(path)
+                self._tasks.put(partial(self._finalize_file, path))
+            else:
+                os.remove(marker)
+
+    def complete_background_tasks(self):
+        self._tasks.join()
+
     def stop(self):
         self._terminate_file(is_rotating=False)
+        if self._tasks is not None:
+            self._tasks.stop()
+        if self._lock_fd is not None and self._lock_pid == os.getpid():
+            os.close(self._lock_fd)
+            self._lock_fd = None
+            self._lock_pid = None
 
     async def complete(self):
         pass
 
+    def __getstate__(self):
+        if not self._shared:
+            return self.__dict__
+        # A shared file can be used by spawned processes too, which open it again
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_file_path"] = None
+        state["_state"] = None
+        state["_lock_fd"] = None
+        state["_lock_pid"] = None
+        if self._tasks is not None:
+            state["_reserved_paths"] = set()
+            state["_reserved_paths_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._tasks is not None:
+            self._reserved_paths_lock = threading.Lock()
+
     @staticmethod
     def _make_glob_patterns(path):
         formatter = string.Formatter()
@@ -256,16 +582,16 @@ class FileSink:
         return [escaped, escaped + ".*", root + ".*" + ext, root + ".*" + ext + ".*"]
 
     @staticmethod
-    def _make_rotation_function(rotation):
+    def _make_rotation_function(rotation, shared=False):
         if rotation is None:
             return None
         elif isinstance(rotation, str):
             size = string_parsers.parse_size(rotation)
             if size is not None:
-                return FileSink._make_rotation_function(size)
+                return FileSink._make_rotation_function(size, shared)
             interval = string_parsers.parse_duration(rotation)
             if interval is not None:
-                return FileSink._make_rotation_function(interval)
+                return FileSink._make_rotation_function(interval, shared)
             frequency = string_parsers.parse_frequency(rotation)
             if frequency is not None:
                 return Rotation.RotationTime(frequency)
@@ -273,14 +599,14 @@ class FileSink:
             if daytime is not None:
                 day, time = daytime
                 if day is None:
-                    return FileSink._make_rotation_function(time)
+                    return FileSink._make_rotation_function(time, shared)
                 if time is None:
                     time = datetime_.time(0, 0, 0)
                 step_forward = partial(Rotation.forward_weekday, weekday=day)
                 return Rotation.RotationTime(step_forward, time)
             raise ValueError("Cannot parse rotation from: '%s'" % rotation)
         elif isinstance(rotation, (numbers.Real, decimal.Decimal)):
-            return partial(Rotation.rotation_size, size_limit=rotation)
+            return Rotation.RotationSize(rotation, shared)
         elif isinstance(rotation, datetime_.time):
             return Rotation.RotationTime(Rotation.forward_day, rotation)
         elif isinstance(rotation, datetime_.timedelta):
@@ -315,6 +641,25 @@ class FileSink:
                 % type(retention).__name__
             )
 
+    @staticmethod
+    def _make_flush_interval(flush_interval):
+        if flush_interval is None:
+            return None
+        elif isinstance(flush_interval, str):
+            interval = string_parsers.parse_duration(flush_interval)
+            if interval is None:
+                raise ValueError("Cannot parse flush interval from: '%s'" % flush_interval)
+            return interval.total_seconds()
+        elif isinstance(flush_interval, datetime_.timedelta):
+            return flush_interval.total_seconds()
+        elif isinstance(flush_interval, numbers.Real) and not isinstance(flush_interval, bool):
+            return float(flush_interval)
+        else:
+            raise TypeError(
+                "Cannot infer flush interval for objects of type: '%s'"
+                % type(flush_interval).__name__
+            )
+
     @staticmethod
     def _make_compression_function(compression):
         if compression is None:
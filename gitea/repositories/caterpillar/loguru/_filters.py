@@ -22,3 +22,32 @@ def filter_by_level(record, level_per_module):
             return True
         index = name.rfind(".")
         name = name[:index] if index != -1 else ""
+
+
+# The functions below give the minimum level a module's messages must have to pass the filter of a
+# handler, or infinity if the filter rejects all of them. They must mirror the filters above.
+
+
+def levelno_none(name, levelno):
+    if name is None:
+        return float("inf")
+    return levelno
+
+
+def levelno_by_name(name, levelno, parent, length):
+    if name is None or (name + ".")[:length] != parent:
+        return float("inf")
+    return levelno
+
+
+def levelno_by_level(name, levelno, level_per_module):
+    while True:
+        level = level_per_module.get(name, None)
+        if level is False:
+            return float("inf")
+        if level is not None:
+            return max(levelno, level)
+        if not name:
+            return levelno
+        index = name.rfind(".")
+        name = name[:index] if index != -1 else ""
@@ -1,9 +1,9 @@
 import functools
-import json
 import multiprocessing
 import os
 from threading import Thread
 
+from ._batch_queue import BatchQueue
 from ._colorizer import Colorizer
 from ._locks_machinery import create_handler_lock
 
@@ -36,9 +36,13 @@ class Handler:
         formatter,
         is_formatter_dynamic,
         filter_,
+        module_levelno,
         colorize,
         serialize,
+        serializer,
+        json_encoder,
         enqueue,
+        batch_options,
         error_interceptor,
         exception_formatter,
         id_,
@@ -50,8 +54,11 @@ class Handler:
         self._formatter = formatter
         self._is_formatter_dynamic = is_formatter_dynamic
         self._filter = filter_
+        self._module_levelno = module_levelno
         self._colorize = colorize
         self._serialize = serialize
+        self._serializer = serializer
+        self._json_encoder = json_encoder
         self._enqueue = enqueue
         self._error_interceptor = error_interceptor
         self._exception_formatter = exception_formatter
@@ -71,6 +78,7 @@ class Handler:
         self._confirmation_lock = None
         self._owner_process_pid = None
         self._thread = None
+        self._batch_queue = None
 
         if self._is_formatter_dynamic:
             if self._colorize:
@@ -84,7 +92,14 @@ class Handler:
             else:
                 self._decolorized_format = self._formatter.strip()
 
-        if self._enqueue:
+        if self._enqueue == "batch":
+            self._batch_queue = BatchQueue(
+                self._sink,
+                self._error_interceptor,
+                name="loguru-writer-%d" % self._id,
+                **batch_options
+            )
+        elif self._enqueue:
             self._queue = multiprocessing.SimpleQueue()
             self._confirmation_event = multiprocessing.Event()
             self._confirmation_lock = multiprocessing.Lock()
@@ -108,88 +123,38 @@ class Handler:
                 if not self._filter(record):
                     return
 
-            if self._is_formatter_dynamic:
-                dynamic_format = self._formatter(record)
-
-            formatter_record = record.copy()
-
-            if not record["exception"]:
-                formatter_record["exception"] = ""
+            if self._serializer is not None and not self._serializer.needs_text:
+                formatted = self._serializer.serialize(None, record)
             else:
-                type_, value, tb = record["exception"]
-                formatter = self._exception_formatter
-                lines = formatter.format_exception(
-                    type_, value, tb, from_decorator=from_decorator
+                formatted = self._format(
+                    record, level_id, from_decorator, is_raw, colored_message
                 )
-                formatter_record["exception"] = "".join(lines)
-
-            if (
-                colored_message is not None
-                and colored_message.stripped != record["message"]
-            ):
-                colored_message = None
-
-            if is_raw:
-                if colored_message is None or not self._colorize:
-                    formatted = record["message"]
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    formatted = colored_message.colorize(ansi_level)
-            elif self._is_formatter_dynamic:
-                if not self._colorize:
-                    precomputed_format = self._memoize_dynamic_format(dynamic_format)
-                    formatted = precomputed_format.format_map(formatter_record)
-                elif colored_message is None:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    _, precomputed_format = self._memoize_dynamic_format(
-                        dynamic_format, ansi_level
-                    )
-                    formatted = precomputed_format.format_map(formatter_record)
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    formatter, precomputed_format = self._memoize_dynamic_format(
-                        dynamic_format, ansi_level
-                    )
-                    coloring_message = formatter.make_coloring_message(
-                        record["message"],
-                        ansi_level=ansi_level,
-                        colored_message=colored_message,
-                    )
-                    formatter_record["message"] = coloring_message
-                    formatted = precomputed_format.format_map(formatter_record)
-
-            else:
-                if not self._colorize:
-                    precomputed_format = self._decolorized_format
-                    formatted = precomputed_format.format_map(formatter_record)
-                elif colored_message is None:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    precomputed_format = self._precolorized_formats[level_id]
-                    formatted = precomputed_format.format_map(formatter_record)
-                else:
-                    ansi_level = self._levels_ansi_codes[level_id]
-                    precomputed_format = self._precolorized_formats[level_id]
-                    coloring_message = self._formatter.make_coloring_message(
-                        record["message"],
-                        ansi_level=ansi_level,
-                        colored_message=colored_message,
+                if self._serializer is not None:
+                    formatted = self._serializer.serialize(formatted, record)
+                elif self._serialize:
+                    formatted = self._serialize_record(
+                        formatted, record, self._json_encoder
                     )
-                    formatter_record["message"] = coloring_message
-                    formatted = precomputed_format.format_map(formatter_record)
-
-            if self._serialize:
-                formatted = self._serialize_record(formatted, record)
 
             str_record = Message(formatted)
             str_record.record = record
 
+            if self._batch_queue is not None:
+                if not self._stopped:
+                    self._batch_queue.put(str_record)
+                return
+
             with self._lock:
                 if self._stopped:
                     return
                 if self._enqueue:
                     self._queue.put(str_record)
-                else:
-                    self._sink.write(str_record)
+                    return
+                self._sink.write(str_record)
+
+            # Not while holding the lock, the event loop may need it before making some room
+            if getattr(self._sink, "waits_for_room", False):
+                self._sink.wait_for_room()
 
         except Exception:
             if not self._error_interceptor.should_catch():
@@ -199,7 +164,9 @@ class Handler:
     def stop(self):
         with self._lock:
             self._stopped = True
-            if self._enqueue:
+            if self._batch_queue is not None:
+                self._batch_queue.stop()
+            elif self._enqueue:
                 if self._owner_process_pid != os.getpid():
                     return
                 self._queue.put(None)
@@ -210,21 +177,92 @@ class Handler:
             self._sink.stop()
 
     def complete_queue(self):
-        if not self._enqueue:
-            return
+        if self._batch_queue is not None:
+            self._batch_queue.complete()
+        elif self._enqueue:
+            with self._confirmation_lock:
+                self._queue.put(True)
+                self._confirmation_event.wait()
+                self._confirmation_event.clear()
+        elif getattr(self._sink, "buffered", False):
+            with self._lock:
+                self._sink.flush()
 
-        with self._confirmation_lock:
-            self._queue.put(True)
-            self._confirmation_event.wait()
-            self._confirmation_event.clear()
+        if getattr(self._sink, "has_background_tasks", False):
+            self._sink.complete_background_tasks()
 
     async def complete_async(self):
-        if self._enqueue and self._owner_process_pid != os.getpid():
+        if self._enqueue and self._batch_queue is None and self._owner_process_pid != os.getpid():
             return
 
         with self._lock:
             await self._sink.complete()
 
+    def _format(self, record, level_id, from_decorator, is_raw, colored_message):
+        if self._is_formatter_dynamic:
+            dynamic_format = self._formatter(record)
+
+        formatter_record = record.copy()
+
+        if not record["exception"]:
+            formatter_record["exception"] = ""
+        else:
+            type_, value, tb = record["exception"]
+            formatter = self._exception_formatter
+            lines = formatter.format_exception(type_, value, tb, from_decorator=from_decorator)
+            formatter_record["exception"] = "".join(lines)
+
+        if colored_message is not None and colored_message.stripped != record["message"]:
+            colored_message = None
+
+        if is_raw:
+            if colored_message is None or not self._colorize:
+                formatted = record["message"]
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                formatted = colored_message.colorize(ansi_level)
+        elif self._is_formatter_dynamic:
+            if not self._colorize:
+                precomputed_format = self._memoize_dynamic_format(dynamic_format)
+                formatted = precomputed_format.format_map(formatter_record)
+            elif colored_message is None:
+                ansi_level = self._levels_ansi_codes[level_id]
+                _, precomputed_format = self._memoize_dynamic_format(dynamic_format, ansi_level)
+                formatted = precomputed_format.format_map(formatter_record)
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                formatter, precomputed_format = self._memoize_dynamic_format(
+                    dynamic_format, ansi_level
+                )
+                coloring_message = formatter.make_coloring_message(
+                    record["message"],
+                    ansi_level=ansi_level,
+                    colored_message=colored_message,
+                )
+                formatter_record["message"] = coloring_message
+                formatted = precomputed_format.format_map(formatter_record)
+
+        else:
+            if not self._colorize:
+                precomputed_format = self._decolorized_format
+                formatted = precomputed_format.format_map(formatter_record)
+            elif colored_message is None:
+                ansi_level = self._levels_ansi_codes[level_id]
+                precomputed_format = self._precolorized_formats[level_id]
+                formatted = precomputed_format.format_map(formatter_record)
+            else:
+                ansi_level = self._levels_ansi_codes[level_id]
+                precomputed_format = self._precolorized_formats[level_id]
+                coloring_message = self._formatter.make_coloring_message(
+                    record["message"],
+                    ansi_level=ansi_level,
+                    colored_message=colored_message,
+                )
+                formatter_record["message"] = coloring_message
+                formatted = precomputed_format.format_map(formatter_record)
+
+        return formatted
+
     def update_format(self, level_id):
         if not self._colorize or self._is_formatter_dynamic:
             return
@@ -235,8 +273,14 @@ class Handler:
     def levelno(self):
         return self._levelno
 
+    def levelno_for_module(self, name):
+        # Callable filters can't be checked without the record, only the handler level is known
+        if self._module_levelno is None:
+            return self._levelno
+        return self._module_levelno(name, self._levelno)
+
     @staticmethod
-    def _serialize_record(text, record):
+    def _serialize_record(text, record, encoder):
         exception = record["exception"]
 
         if exception is not None:
@@ -275,7 +319,7 @@ class Handler:
             },
         }
 
-        return json.dumps(serializable, default=str) + "\n"
+        return encoder(serializable) + "\n"
 
     def _queued_writer(self):
         message = None
@@ -299,6 +343,12 @@ class Handler:
                 break
 
             if message is True:
+                if getattr(self._sink, "buffered", False):
+                    with lock:
+                        try:
+                            self._sink.flush()
+                        except Exception:
+                            self._error_interceptor.print(None)
                 self._confirmation_event.set()
                 continue
 
@@ -314,7 +364,11 @@ class Handler:
         state = self.__dict__.copy()
         state["_lock"] = None
         state["_memoize_dynamic_format"] = None
-        if self._enqueue:
+        if self._batch_queue is not None:
+            # The worker thread only exists in this process, others write to the sink directly
+            state["_enqueue"] = False
+            state["_batch_queue"] = None
+        elif self._enqueue:
             state["_sink"] = None
             state["_thread"] = None
             state["_owner_process"] = None
@@ -18,11 +18,13 @@
 
 .. |str| replace:: :class:`str`
 .. |int| replace:: :class:`int`
+.. |float| replace:: :class:`float`
 .. |bool| replace:: :class:`bool`
 .. |tuple| replace:: :class:`tuple`
 .. |namedtuple| replace:: :func:`namedtuple<collections.namedtuple>`
 .. |list| replace:: :class:`list`
 .. |dict| replace:: :class:`dict`
+.. |json.dumps| replace:: :func:`json.dumps`
 .. |str.format| replace:: :meth:`str.format()`
 .. |Path| replace:: :class:`pathlib.Path`
 .. |match.groupdict| replace:: :meth:`re.Match.groupdict()`
@@ -83,12 +85,13 @@ import re
 import sys
 import warnings
 from collections import namedtuple
+from datetime import timedelta
 from inspect import isclass, iscoroutinefunction, isgeneratorfunction
 from multiprocessing import current_process
 from os.path import basename, splitext
 from threading import current_thread
 
-from . import _colorama, _defaults, _filters
+from . import _colorama, _defaults, _filters, _serializer
 from ._better_exceptions import ExceptionFormatter
 from ._colorizer import Colorizer
 from ._datetime import aware_now
@@ -104,7 +107,7 @@ from ._recattrs import (
     RecordProcess,
     RecordThread,
 )
-from ._simple_sinks import AsyncSink, CallableSink, StandardSink, StreamSink
+from ._simple_sinks import AsyncSink, CallableSink, QueuedAsyncSink, StandardSink, StreamSink
 
 if sys.version_info >= (3, 6):
     from os import PathLike
@@ -126,6 +129,12 @@ start_time = aware_now()
 context = ContextVar("loguru_context", default={})
 
 
+@functools.lru_cache(maxsize=1024)
+def get_file_attributes(file_path):
+    file_name = basename(file_path)
+    return file_name, splitext(file_name)[0]
+
+
 class Core:
     def __init__(self):
         levels = [
@@ -185,12 +194,47 @@ class Core:
         self.patcher = None
 
         self.min_level = float("inf")
-        self.enabled = {}
+        self.min_levels = {}
+        self.enabled_min_levels = {}
         self.activation_list = []
         self.activation_none = True
 
         self.lock = create_logger_lock()
 
+    def clear_min_levels(self):
+        self.min_levels = {}
+        self.enabled_min_levels = {}
+
+    def is_enabled(self, name):
+        if name is None:
+            return self.activation_none
+        dotted_name = name + "."
+        for dotted_module_name, status in self.activation_list:
+            if dotted_name[: len(dotted_module_name)] == dotted_module_name:
+                return status
+        return True
+
+    def compute_min_level(self, name):
+        # The minimum level of the messages of this module that at least one handler may emit,
+        # cached until the handlers or the activations change.
+        min_levels = self.min_levels
+
+        if self.is_enabled(name):
+            levelnos = (h.levelno_for_module(name) for h in self.handlers.values())
+            min_level = min(levelnos, default=float("inf"))
+        else:
+            min_level = float("inf")
+
+        min_levels[name] = min_level
+        return min_level
+
+    def compute_enabled_min_level(self, name):
+        # Same, but regardless of the filters of the handlers, which see the patched record whose
+        # module name may be another one.
+        min_level = self.min_level if self.is_enabled(name) else float("inf")
+        self.enabled_min_levels[name] = min_level
+        return min_level
+
     def __getstate__(self):
         state = self.__dict__.copy()
         state["lock"] = None
@@ -256,6 +300,7 @@ class Logger:
         diagnose=_defaults.LOGURU_DIAGNOSE,
         enqueue=_defaults.LOGURU_ENQUEUE,
         catch=_defaults.LOGURU_CATCH,
+        dedup_tracebacks=None,
         **kwargs
     ):
         r"""Add a handler sending log messages to a sink adequately configured.
@@ -276,35 +321,82 @@ class Logger:
             Whether the color markups contained in the formatted message should be converted to ansi
             codes for terminal coloration, or stripped otherwise. If ``None``, the choice is
             automatically made based on the sink being a tty or not.
-        serialize : |bool|, optional
+        serialize : |bool|, |list| or |dict|, optional
             Whether the logged message and its records should be first converted to a JSON string
-            before being sent to the sink.
+            before being sent to the sink. If it is a |list| of fields (such as ``"time.repr"``,
+            ``"level.name"``, ``"message"`` or ``"text"`` for the formatted message), only these
+            ones are serialized, the message is not formatted unless ``"text"`` is one of them. A
+            |dict| additionally maps the keys of the JSON object to the fields.
         backtrace : |bool|, optional
             Whether the exception trace formatted should be extended upward, beyond the catching
             point, to show the full stacktrace which generated the error.
         diagnose : |bool|, optional
             Whether the exception trace should display the variables values to eases the debugging.
             This should be set to ``False`` in production to avoid leaking sensitive data.
-        enqueue : |bool|, optional
+        enqueue : |bool| or |str|, optional
             Whether the messages to be logged should first pass through a multiprocess-safe queue
             before reaching the sink. This is useful while logging to a file through multiple
-            processes. This also has the advantage of making logging calls non-blocking.
+            processes. This also has the advantage of making logging calls non-blocking. If
+            ``"batch"``, the messages pass through a faster queue which is only safe to use from the
+            threads of the current process, and are written to the sink several at a time.
         catch : |bool|, optional
             Whether errors occurring while sink handles logs messages should be automatically
             caught. If ``True``, an exception message is displayed on |sys.stderr| but the exception
             is not propagated to the caller, preventing your app to crash.
+        dedup_tracebacks : |float| or |timedelta|, optional
+            If set, an exception with the same traceback as one formatted less than this number of
+            seconds ago is not formatted again: a single line refers to the previous one, with the
+            number of repetitions. This saves both time and space if an error is repeatedly logged.
         **kwargs
             Additional parameters that are only valid to configure a coroutine or file sink (see
             below).
 
 
-        If and only if the sink is a coroutine function, the following parameter applies:
+        If and only if the sink is a coroutine function, the following parameters apply:
 
         Parameters
         ----------
         loop : |AbstractEventLoop|, optional
             The event loop in which the asynchronous logging task will be scheduled and executed. If
             ``None``, the loop returned by |asyncio.get_event_loop| is used.
+        queue_size : |int|, optional
+            If set, the messages are put in a queue of this size and awaited one after the other by
+            a single task, instead of scheduling a task for each message.
+        queue_overflow : |str|, optional
+            What to do with new messages when the queue is full: ``"block"`` (the default) waits
+            for some room, ``"drop_oldest"`` discards the oldest message of the queue and
+            ``"drop_new"`` discards the new one. The logging calls made from the event loop itself
+            can't wait, with ``"block"`` their messages are kept aside, in order, until there is
+            some room.
+        queue_batch_size : |int|, optional
+            If set, the messages are also queued (without size limit unless ``queue_size`` is
+            set) and the sink receives a |list| of up to this number of messages at once, all the
+            messages waiting in the queue.
+
+
+        If and only if ``enqueue`` is ``"batch"``, the following parameters apply:
+
+        Parameters
+        ----------
+        capacity : |int|, optional
+            The maximum number of messages waiting to be written to the sink. If ``None`` (the
+            default), the queue is unbounded.
+        overflow : |str|, optional
+            What to do with new messages when the queue is full: ``"block"`` (the default) waits
+            for the sink to catch up, ``"drop"`` discards them.
+        batch_size : |int|, optional
+            The maximum number of messages written to the sink at once. It defaults to ``512``.
+
+
+        If and only if ``serialize`` is not ``False``, the following parameter applies:
+
+        Parameters
+        ----------
+        json_encoder : |callable|_, optional
+            The function converting the serialized object to a JSON string, for example one based
+            on a faster third-party library. It defaults to |json.dumps| with ``default=str``. When
+            ``serialize`` is a list of fields, the values bound to ``extra`` are already converted
+            to strings if they are not of a JSON type.
 
 
         If and only if the sink is a file path, the following parameters apply:
@@ -322,12 +414,24 @@ class Logger:
         delay : |bool|, optional
             Whether the file should be created as soon as the sink is configured, or delayed until
             first logged message. It defaults to ``False``.
+        background : |bool|, optional
+            Whether the compression and the retention should run in a background thread, so that
+            logging is not blocked while the closed file is compressed. It defaults to ``False``.
+        flush_interval : |str|, |float| or |timedelta|, optional
+            With a ``buffering`` other than ``1``, the maximum number of seconds between two
+            flushes of the file, checked each time a message is written. If ``None`` (the
+            default), the file is only flushed when its buffer is full.
+        shared : |bool|, optional
+            Whether several processes may log to the same file, each of them adding the sink
+            independently. It defaults to ``False``. See below for details.
         mode : |str|, optional
             The opening mode as for built-in |open| function. It defaults to ``"a"`` (open the
             file in appending mode).
         buffering : |int|, optional
             The buffering policy as for built-in |open| function. It defaults to ``1`` (line
-            buffered file).
+            buffered file). For high volumes, a block buffered file (e.g. ``buffering=65536``)
+            saves a system call per message, it is flushed once its buffer is full, according to
+            ``flush_interval`` and by |complete|.
         encoding : |str|, optional
             The file encoding as for built-in |open| function. If ``None``, it defaults to
             |locale.getpreferredencoding|.
@@ -634,6 +738,26 @@ class Logger:
         very careful not to use the ``logger`` within your function. Otherwise, there is a risk that
         your program hang because of a deadlock.
 
+        With ``background=True``, the new file is opened as soon as the rotation happens while the
+        compression of the previous file and the retention are performed by a worker thread, in the
+        same order. The logging threads only wait if several files are already waiting to be
+        compressed. Use |complete| to wait until the pending tasks are done, they are also waited
+        for when the handler is removed. A marker file with the ``".compressing"`` suffix is kept
+        next to each file until its compression ends, so that the compressions interrupted by the
+        end of the process are resumed when the sink is added again. The errors raised by these
+        tasks are always printed on |sys.stderr|.
+
+        With ``shared=True``, each process writes each message at once at the end of the file,
+        bypassing the buffering, so that the lines are kept intact without having to send the
+        messages to a single process like with ``enqueue=True``. The processes do not need to be
+        forked from each other: they can all add the sink, and a sink pickled to a spawned process
+        opens the file again. A lock file with the ``".lock"`` suffix is created next to the log
+        file, it is only locked while the file is opened or rotated and it tells the other
+        processes which file is the current one. Consequently, a rotation happening in one process
+        is followed by all the others, while the compression and the retention are performed by
+        the process which rotated the file. The file is neither compressed nor cleaned up at sink
+        stop, as other processes may still be using it. This is not supported on Windows.
+
         .. _color:
 
         .. rubric:: The color markups
@@ -771,6 +895,29 @@ class Logger:
 
         error_interceptor = ErrorInterceptor(catch, handler_id)
 
+        if enqueue == "batch":
+            batch_options = {
+                "capacity": kwargs.pop("capacity", None),
+                "overflow": kwargs.pop("overflow", "block"),
+                "batch_size": kwargs.pop("batch_size", 512),
+            }
+        elif isinstance(enqueue, str):
+            raise ValueError(
+                "Invalid enqueue, it should be a boolean or 'batch', not: '%s'" % enqueue
+            )
+        else:
+            batch_options = None
+
+        if isinstance(serialize, (list, tuple, dict)):
+            json_encoder = kwargs.pop("json_encoder", None) or _serializer.dumps
+            serializer = _serializer.Serializer(serialize, json_encoder)
+        elif serialize:
+            json_encoder = kwargs.pop("json_encoder", None) or _serializer.dumps
+            serializer = None
+        else:
+            json_encoder = None
+            serializer = None
+
         if colorize is None and serialize:
             colorize = False
 
@@ -781,7 +928,7 @@ class Logger:
             if colorize is None:
                 colorize = False
 
-            wrapped_sink = FileSink(path, **kwargs)
+            wrapped_sink = FileSink(path, error_interceptor, **kwargs)
             kwargs = {}
             encoding = wrapped_sink.encoding
             terminator = "\n"
@@ -829,8 +976,36 @@ class Logger:
             if enqueue and loop is None:
                 loop = asyncio.get_event_loop()
 
+            queue_options = {
+                "size": kwargs.pop("queue_size", None),
+                "overflow": kwargs.pop("queue_overflow", "block"),
+                "batch_size": kwargs.pop("queue_batch_size", None),
+            }
+            if queue_options["size"] is not None and (
+                not isinstance(queue_options["size"], int) or queue_options["size"] < 1
+            ):
+                raise ValueError(
+                    "Invalid queue_size, it should be a positive integer, not: '%s'"
+                    % (queue_options["size"],)
+                )
+            if queue_options["overflow"] not in ("block", "drop_oldest", "drop_new"):
+                raise ValueError(
+                    "Invalid queue_overflow, it should be 'block', 'drop_oldest' or 'drop_new', "
+                    "not: '%s'" % (queue_options["overflow"],)
+                )
+            if queue_options["batch_size"] is not None and (
+                not isinstance(queue_options["batch_size"], int) or queue_options["batch_size"] < 1
+            ):
+                raise ValueError(
+                    "Invalid queue_batch_size, it should be a positive integer, not: '%s'"
+                    % (queue_options["batch_size"],)
+                )
+
             coro = sink if iscoroutinefunction(sink) else sink.__call__
-            wrapped_sink = AsyncSink(coro, loop, error_interceptor)
+            if queue_options["size"] is None and queue_options["batch_size"] is None:
+                wrapped_sink = AsyncSink(coro, loop, error_interceptor)
+            else:
+                wrapped_sink = QueuedAsyncSink(coro, loop, error_interceptor, **queue_options)
             encoding = "utf8"
             terminator = "\n"
             exception_prefix = ""
@@ -852,16 +1027,39 @@ class Logger:
                 "add() got an unexpected keyword argument '%s'" % next(iter(kwargs))
             )
 
+        if batch_options is not None:
+            capacity = batch_options["capacity"]
+            if capacity is not None and (not isinstance(capacity, int) or capacity < 1):
+                raise ValueError(
+                    "Invalid capacity, it should be a positive integer or None, not: '%s'"
+                    % (capacity,)
+                )
+            if batch_options["overflow"] not in ("block", "drop"):
+                raise ValueError(
+                    "Invalid overflow, it should be 'block' or 'drop', not: '%s'"
+                    % (batch_options["overflow"],)
+                )
+            batch_size = batch_options["batch_size"]
+            if not isinstance(batch_size, int) or batch_size < 1:
+                raise ValueError(
+                    "Invalid batch_size, it should be a positive integer, not: '%s'" % (batch_size,)
+                )
+
         if filter is None:
             filter_func = None
+            module_levelno = None
         elif filter == "":
             filter_func = _filters.filter_none
+            module_levelno = _filters.levelno_none
         elif isinstance(filter, str):
             parent = filter + "."
             length = len(parent)
             filter_func = functools.partial(
                 _filters.filter_by_name, parent=parent, length=length
             )
+            module_levelno = functools.partial(
+                _filters.levelno_by_name, parent=parent, length=length
+            )
         elif isinstance(filter, dict):
             level_per_module = {}
             for module, level_ in filter.items():
@@ -901,6 +1099,9 @@ class Logger:
             filter_func = functools.partial(
                 _filters.filter_by_level, level_per_module=level_per_module
             )
+            module_levelno = functools.partial(
+                _filters.levelno_by_level, level_per_module=level_per_module
+            )
         elif callable(filter):
             if filter == builtins.filter:
                 raise ValueError(
@@ -909,6 +1110,7 @@ class Logger:
                     "to 'logger.add()')."
                 )
             filter_func = filter
+            module_levelno = None
         else:
             raise TypeError(
                 "Invalid filter, it should be a function, a string or a dict, not: '%s'"
@@ -959,6 +1161,18 @@ class Logger:
         if not isinstance(encoding, str):
             encoding = "ascii"
 
+        if dedup_tracebacks is None:
+            dedup_interval = None
+        elif isinstance(dedup_tracebacks, timedelta):
+            dedup_interval = dedup_tracebacks.total_seconds()
+        elif isinstance(dedup_tracebacks, (int, float)) and not isinstance(dedup_tracebacks, bool):
+            dedup_interval = dedup_tracebacks
+        else:
+            raise TypeError(
+                "Invalid dedup_tracebacks, it should be a number of seconds or a timedelta, "
+                "not: '%s'" % type(dedup_tracebacks).__name__
+            )
+
         with self._core.lock:
             exception_formatter = ExceptionFormatter(
                 colorize=colorize,
@@ -967,6 +1181,7 @@ class Logger:
                 backtrace=backtrace,
                 hidden_frames_filename=self.catch.__code__.co_filename,
                 prefix=exception_prefix,
+                dedup_interval=dedup_interval,
             )
 
             handler = Handler(
@@ -976,9 +1191,13 @@ class Logger:
                 formatter=formatter,
                 is_formatter_dynamic=is_formatter_dynamic,
                 filter_=filter_func,
+                module_levelno=module_levelno,
                 colorize=colorize,
-                serialize=serialize,
+                serialize=bool(serialize),
+                serializer=serializer,
+                json_encoder=json_encoder,
                 enqueue=enqueue,
+                batch_options=batch_options,
                 id_=handler_id,
                 error_interceptor=error_interceptor,
                 exception_formatter=exception_formatter,
@@ -990,6 +1209,7 @@ class Logger:
 
             self._core.min_level = min(self._core.min_level, levelno)
             self._core.handlers = handlers
+            self._core.clear_min_levels()
 
         return handler_id
 
@@ -1041,6 +1261,7 @@ class Logger:
                 levelnos = (h.levelno for h in handlers.values())
                 self._core.min_level = min(levelnos, default=float("inf"))
                 self._core.handlers = handlers
+                self._core.clear_min_levels()
 
                 handler.stop()
 
@@ -1048,7 +1269,8 @@ class Logger:
         """Wait for the end of enqueued messages and asynchronous tasks scheduled by handlers.
 
         This method proceeds in two steps: first it waits for all logging messages added to handlers
-        with ``enqueue=True`` to be processed, then it returns an object that can be awaited to
+        with ``enqueue=True`` to be processed, as well as the compression and retention tasks of
+        file sinks with ``background=True``, then it returns an object that can be awaited to
         finalize all logging tasks added to the event loop by coroutine sinks.
 
         It can be called from non-asynchronous code. This is especially recommended when the
@@ -1749,14 +1971,9 @@ class Logger:
             )
 
         with self._core.lock:
-            enabled = self._core.enabled.copy()
-
             if name is None:
-                for n in enabled:
-                    if n is None:
-                        enabled[n] = status
                 self._core.activation_none = status
-                self._core.enabled = enabled
+                self._core.clear_min_levels()
                 return
 
             if name != "":
@@ -1777,12 +1994,8 @@ class Logger:
 
                 activation_list.sort(key=modules_depth, reverse=True)
 
-            for n in enabled:
-                if n is not None and (n + ".")[: len(name)] == name:
-                    enabled[n] = status
-
             self._core.activation_list = activation_list
-            self._core.enabled = enabled
+            self._core.clear_min_levels()
 
     @staticmethod
     def parse(file, pattern, *, cast={}, chunk=2**16):
@@ -1903,6 +2116,19 @@ class Logger:
         if not core.handlers:
             return
 
+        if level_id is None:
+            level_icon = " "
+            level_no = static_level_no
+            level_name = "Level %d" % level_no
+        else:
+            try:
+                level_name, level_no, _, level_icon = core.levels[level_id]
+            except KeyError:
+                raise ValueError("Level '%s' does not exist" % level_id) from None
+
+        if level_no < core.min_level:
+            return
+
         (exception, depth, record, lazy, colors, raw, capture, patcher, extra) = options
 
         frame = get_frame(depth + 2)
@@ -1912,44 +2138,26 @@ class Logger:
         except KeyError:
             name = None
 
-        try:
-            if not core.enabled[name]:
-                return
-        except KeyError:
-            enabled = core.enabled
-            if name is None:
-                status = core.activation_none
-                enabled[name] = status
-                if not status:
-                    return
-            else:
-                dotted_name = name + "."
-                for dotted_module_name, status in core.activation_list:
-                    if dotted_name[: len(dotted_module_name)] == dotted_module_name:
-                        if status:
-                            break
-                        enabled[name] = False
-                        return
-                enabled[name] = True
-
-        current_datetime = aware_now()
-
-        if level_id is None:
-            level_icon = " "
-            level_no = static_level_no
-            level_name = "Level %d" % level_no
+        if core.patcher or patcher:
+            # The handlers filter on the patched record, its "name" may not be this one
+            try:
+                min_level = core.enabled_min_levels[name]
+            except KeyError:
+                min_level = core.compute_enabled_min_level(name)
         else:
             try:
-                level_name, level_no, _, level_icon = core.levels[level_id]
+                min_level = core.min_levels[name]
             except KeyError:
-                raise ValueError("Level '%s' does not exist" % level_id) from None
+                min_level = core.compute_min_level(name)
 
-        if level_no < core.min_level:
+        if level_no < min_level:
             return
 
+        current_datetime = aware_now()
+
         code = frame.f_code
         file_path = code.co_filename
-        file_name = basename(file_path)
+        file_name, module = get_file_attributes(file_path)
         thread = current_thread()
         process = current_process()
         elapsed = current_datetime - start_time
@@ -1978,7 +2186,7 @@ class Logger:
             "level": RecordLevel(level_name, level_no, level_icon),
             "line": frame.f_lineno,
             "message": str(message),
-            "module": splitext(file_name)[0],
+            "module": module,
             "name": name,
             "process": RecordProcess(process.ident, process.name),
             "thread": RecordThread(thread.ident, thread.name),
@@ -0,0 +1,113 @@
+import json
+
+
+def dumps(obj):
+    return json.dumps(obj, default=str)
+
+
+def jsonable(value):
+    # The same as "default=str" would give, so that any encoder can be used
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {
+            key if key is None or isinstance(key, (str, int, float)) else str(key): jsonable(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [jsonable(item) for item in value]
+    return str(value)
+
+
+def serialize_exception(record):
+    exception = record["exception"]
+    if exception is None:
+        return None
+    return {
+        "type": None if exception.type is None else exception.type.__name__,
+        "value": str(exception.value),
+        "traceback": bool(exception.traceback),
+    }
+
+
+# The values of each field, as in the "record" of the messages serialized with "serialize=True",
+# except that non-JSON types are already converted to strings.
+getters = {
+    "elapsed": lambda r: {
+        "repr": str(r["elapsed"]),
+        "seconds": r["elapsed"].total_seconds(),
+    },
+    "elapsed.repr": lambda r: str(r["elapsed"]),
+    "elapsed.seconds": lambda r: r["elapsed"].total_seconds(),
+    "exception": serialize_exception,
+    "extra": lambda r: jsonable(r["extra"]),
+    "file": lambda r: {"name": r["file"].name, "path": r["file"].path},
+    "file.name": lambda r: r["file"].name,
+    "file.path": lambda r: r["file"].path,
+    "function": lambda r: r["function"],
+    "level": lambda r: {
+        "icon": r["level"].icon,
+        "name": r["level"].name,
+        "no": r["level"].no,
+    },
+    "level.icon": lambda r: r["level"].icon,
+    "level.name": lambda r: r["level"].name,
+    "level.no": lambda r: r["level"].no,
+    "line": lambda r: r["line"],
+    "message": lambda r: r["message"],
+    "module": lambda r: r["module"],
+    "name": lambda r: r["name"],
+    "process": lambda r: {"id": r["process"].id, "name": r["process"].name},
+    "process.id": lambda r: r["process"].id,
+    "process.name": lambda r: r["process"].name,
+    "thread": lambda r: {"id": r["thread"].id, "name": r["thread"].name},
+    "thread.id": lambda r: r["thread"].id,
+    "thread.name": lambda r: r["thread"].name,
+    "time": lambda r: {"repr": str(r["time"]), "timestamp": r["time"].timestamp()},
+    "time.repr": lambda r: str(r["time"]),
+    "time.timestamp": lambda r: r["time"].timestamp(),
+}
+
+
+class Serializer:
+    """Convert the records to JSON lines made of the configured fields only.
+
+    The getter of each field is looked up once, the formatted text is only needed if it is one of
+    the fields.
+    """
+
+    def __init__(self, fields, encoder):
+        if isinstance(fields, dict):
+            items = list(fields.items())
+        else:
+            items = [(field, field) for field in fields]
+
+        if not items:
+            raise ValueError("Invalid serialize, the fields should not be empty")
+
+        self._layout = []
+        self.needs_text = False
+
+        for key, field in items:
+            if not isinstance(key, str) or not isinstance(field, str):
+                raise TypeError(
+                    "Invalid serialize, the fields should be strings, not: '%s'"
+                    % type(field if isinstance(key, str) else key).__name__
+                )
+            if field == "text":
+                self.needs_text = True
+                getter = None
+            else:
+                try:
+                    getter = getters[field]
+                except KeyError:
+                    raise ValueError(
+                        "Invalid serialize, the field '%s' does not exist" % field
+                    ) from None
+            self._layout.append((key, getter))
+
+        self._encoder = encoder
+
+    def serialize(self, text, record):
+        obj = {key: text if getter is None else getter(record) for key, getter in self._layout}
+        return self._encoder(obj) + "\n"
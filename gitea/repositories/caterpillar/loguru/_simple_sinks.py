@@ -1,7 +1,11 @@
 import asyncio
+import collections
+import io
 import logging
 import sys
+import threading
 import weakref
+from asyncio import events
 
 if sys.version_info >= (3, 7):
 
@@ -22,12 +26,19 @@ class StreamSink:
         self._completable = asyncio.iscoroutinefunction(
             getattr(stream, "complete", None)
         )
+        # Other objects may need the record of each message
+        self.batchable = isinstance(stream, io.TextIOBase)
 
     def write(self, message):
         self._stream.write(message)
         if self._flushable:
             self._stream.flush()
 
+    def write_batch(self, messages):
+        self._stream.write("".join(messages))
+        if self._flushable:
+            self._stream.flush()
+
     def stop(self):
         if self._stoppable:
             self._stream.stop()
@@ -112,6 +123,142 @@ class AsyncSink:
         self._tasks = weakref.WeakSet()
 
 
+class QueuedAsyncSink:
+    """Coroutine sink fed by a single consumer task per event loop, through a bounded queue.
+
+    When the queue is full, with the "block" overflow, the messages are appended to an overflow
+    deque that the consumer moves to the queue as soon as there is room, so that they are kept in
+    order. The messages of the other threads are handed over to the event loop without waiting,
+    while the handler lock is held. Once it is released, these threads wait in "wait_for_room()"
+    while more than "size" of their messages are not in the queue yet. The logging calls made
+    from the event loop itself can't wait and return immediately.
+    """
+
+    def __init__(self, function, loop, error_interceptor, *, size, overflow, batch_size):
+        self._function = function
+        self._loop = loop
+        self._error_interceptor = error_interceptor
+        self._size = size
+        self._overflow = overflow
+        self._batch_size = batch_size
+        self._queues = weakref.WeakKeyDictionary()
+        self._consumers = weakref.WeakSet()
+        # Messages of the other threads not yet moved to the queue
+        self._pending = 0
+        self._room = threading.Condition()
+        self.dropped = 0
+
+    @property
+    def waits_for_room(self):
+        return self._overflow == "block" and bool(self._size)
+
+    def write(self, message):
+        loop = self._loop or asyncio.get_event_loop()
+        if events._get_running_loop() is loop:
+            self._put(message, loop, False)
+            return
+        if self._overflow == "block":
+            with self._room:
+                self._pending += 1
+        # Also used if the loop isn't running yet, the message is put once it runs
+        loop.call_soon_threadsafe(self._put, message, loop, self._overflow == "block")
+
+    def wait_for_room(self):
+        loop = self._loop or asyncio.get_event_loop()
+        if events._get_running_loop() is loop:
+            return
+        with self._room:
+            # Checked again regularly, in case the loop is stopped meanwhile
+            while self._pending > self._size and loop.is_running():
+                self._room.wait(0.1)
+
+    def _moved(self, count):
+        with self._room:
+            self._pending -= count
+            self._room.notify_all()
+
+    def _get_queue(self, loop):
+        queues = self._queues.get(loop)
+        if queues is None:
+            queue = asyncio.Queue(self._size or 0)
+            queues = self._queues[loop] = (queue, collections.deque())
+            self._consumers.add(loop.create_task(self._consume(queue, queues[1], loop)))
+        return queues
+
+    def _put(self, message, loop, from_thread):
+        queue, overflow = self._get_queue(loop)
+        if not overflow and not queue.full():
+            queue.put_nowait(message)
+            if from_thread:
+                self._moved(1)
+        elif self._overflow == "drop_new":
+            self.dropped += 1
+        elif self._overflow == "drop_oldest":
+            queue.get_nowait()
+            queue.task_done()
+            queue.put_nowait(message)
+            self.dropped += 1
+        else:
+            overflow.append((message, from_thread))
+
+    async def _consume(self, queue, overflow, loop):
+        while True:
+            messages = [await queue.get()]
+            if self._batch_size is not None:
+                while len(messages) < self._batch_size and not queue.empty():
+                    messages.append(queue.get_nowait())
+            # Done before the messages are marked as done, so that join() waits for the overflow
+            moved = 0
+            while overflow and not queue.full():
+                message, from_thread = overflow.popleft()
+                queue.put_nowait(message)
+                moved += from_thread
+            if moved:
+                self._moved(moved)
+            try:
+                if self._batch_size is None:
+                    await self._function(messages[0])
+                else:
+                    await self._function(messages)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The consumer must keep running, the error can't be propagated to the caller
+                if self._error_interceptor.should_catch():
+                    self._error_interceptor.print(messages[0].record, exception=e)
+                else:
+                    loop.call_exception_handler(
+                        {"message": "Exception in a coroutine sink", "exception": e}
+                    )
+            finally:
+                for _ in messages:
+                    queue.task_done()
+
+    def stop(self):
+        for task in self._consumers:
+            task.cancel()
+
+    async def complete(self):
+        loop = asyncio.get_event_loop()
+        queues = self._queues.get(loop)
+        if queues is not None:
+            await queues[0].join()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_queues"] = None
+        state["_consumers"] = None
+        state["_room"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._queues = weakref.WeakKeyDictionary()
+        self._consumers = weakref.WeakSet()
+        self._pending = 0
+        self._room = threading.Condition()
+
+
 class CallableSink:
     def __init__(self, function):
         self._function = function
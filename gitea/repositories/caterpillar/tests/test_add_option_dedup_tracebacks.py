@@ -0,0 +1,151 @@
+import datetime
+import re
+import sys
+import threading
+
+import pytest
+
+import loguru
+from loguru import logger
+
+
+def raise_error(value="Error"):
+    raise ValueError(value)
+
+
+def log_error(value="Error"):
+    try:
+        raise_error(value)
+    except ValueError:
+        logger.exception("")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(loguru._better_exceptions.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_repeated_traceback(writer, clock):
+    logger.add(writer, format="{message}", diagnose=False, dedup_tracebacks=10)
+
+    for _ in range(3):
+        log_error()
+        clock[0] += 1
+
+    full, first, second = writer.read().rstrip("\n").split("\n\n")
+    assert full.startswith("\nTraceback (most recent call last):")
+    assert full.endswith("ValueError: Error")
+    assert first == (
+        "Traceback (same as 1.0 seconds ago, repeated 1 time since)\nValueError: Error"
+    )
+    assert second == (
+        "Traceback (same as 2.0 seconds ago, repeated 2 times since)\nValueError: Error"
+    )
+
+
+def test_different_message_same_traceback(writer, clock):
+    logger.add(writer, format="{message}", diagnose=False, dedup_tracebacks=10)
+
+    log_error("A")
+    log_error("B")
+
+    assert writer.read().endswith(
+        "\nTraceback (same as 0.0 seconds ago, repeated 1 time since)\nValueError: B\n"
+    )
+
+
+def test_different_tracebacks(writer, clock):
+    logger.add(writer, format="{message}", diagnose=False, dedup_tracebacks=10)
+
+    log_error()
+    try:
+        raise_error()
+    except ValueError:
+        logger.exception("")
+
+    assert writer.read().count("Traceback (most recent call last):") == 2
+
+
+def test_expired_traceback(writer, clock):
+    logger.add(writer, format="{message}", dedup_tracebacks=datetime.timedelta(seconds=5))
+
+    log_error()
+    clock[0] += 3
+    log_error()
+    clock[0] += 5
+    log_error()
+    clock[0] += 1
+    log_error()
+
+    lines = writer.read()
+    assert lines.count("Traceback (most recent call last):") == 2
+    assert lines.count("Traceback (same as 3.0 seconds ago, repeated 1 time since)") == 1
+    assert lines.count("Traceback (same as 1.0 seconds ago, repeated 1 time since)") == 1
+
+
+def test_handlers_are_independent(clock):
+    first, second = [], []
+    logger.add(first.append, format="{message}", diagnose=False, dedup_tracebacks=10)
+    log_error()
+    logger.add(second.append, format="{message}", diagnose=False, dedup_tracebacks=10)
+    log_error()
+
+    assert "Traceback (same as" in first[1]
+    assert "Traceback (most recent call last):" in second[0]
+
+
+def test_disabled_by_default(writer):
+    logger.add(writer, format="{message}")
+
+    log_error()
+    log_error()
+
+    assert writer.read().count("Traceback (most recent call last):") == 2
+
+
+def test_colorized_repeated_traceback(writer, clock):
+    logger.add(writer, format="{message}", colorize=True, diagnose=False, dedup_tracebacks=10)
+
+    log_error()
+    log_error()
+
+    repeated = writer.read().split("\n\n")[1]
+    assert "\x1b[" in repeated
+    assert "Traceback (same as 0.0 seconds ago, repeated 1 time since)" in repeated
+
+
+def test_repeated_traceback_threads(clock):
+    messages = []
+    logger.add(messages.append, format="{message}", diagnose=False, dedup_tracebacks=10)
+
+    def worker():
+        for _ in range(200):
+            log_error()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    # Exceptions are formatted outside the handler lock, switch threads often to race
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert sum("Traceback (most recent call last):" in message for message in messages) == 1
+    repeated = sorted(
+        int(match.group(1))
+        for message in messages
+        for match in re.finditer(r"repeated (\d+) time", message)
+    )
+    assert repeated == list(range(1, 1600))
+
+
+@pytest.mark.parametrize("dedup_tracebacks", ["10", True, [10]])
+def test_invalid_dedup_tracebacks(dedup_tracebacks):
+    with pytest.raises(TypeError):
+        logger.add(lambda _: None, dedup_tracebacks=dedup_tracebacks)
@@ -1,6 +1,8 @@
+import io
 import pickle
 import re
 import sys
+import threading
 import time
 
 import pytest
@@ -212,3 +214,120 @@ def test_logging_not_picklable_exception(arg):
     assert type_ is ValueError
     assert value is None
     assert traceback_ is None
+
+
+def test_enqueue_batch(writer):
+    logger.add(writer, format="{message}", enqueue="batch")
+
+    for i in range(1000):
+        logger.info(i)
+
+    logger.complete()
+
+    assert writer.read() == "".join("%d\n" % i for i in range(1000))
+
+
+def test_enqueue_batch_single_write_per_batch():
+    class Stream(io.StringIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = []
+
+        def write(self, message):
+            if not self.writes:
+                # The other messages are enqueued while the first one is written
+                time.sleep(0.1)
+            self.writes.append(message)
+            return super().write(message)
+
+    stream = Stream()
+    logger.add(stream, format="{message}", enqueue="batch", batch_size=3)
+
+    logger.info("first")
+    time.sleep(0.05)
+    for i in range(5):
+        logger.info(i)
+    logger.complete()
+
+    assert stream.getvalue() == "first\n0\n1\n2\n3\n4\n"
+    assert stream.writes == ["first\n", "0\n1\n2\n", "3\n4\n"]
+
+
+def test_enqueue_batch_drop():
+    event = threading.Event()
+    x = []
+
+    def sink(message):
+        event.wait()
+        x.append(message)
+
+    logger.add(sink, format="{message}", enqueue="batch", capacity=2, overflow="drop")
+    logger.info("a")
+    time.sleep(0.1)
+    for i in range(5):
+        logger.info(i)
+    event.set()
+    logger.complete()
+
+    assert x == ["a\n", "0\n", "1\n"]
+
+
+def test_enqueue_batch_block():
+    x = []
+
+    def sink(message):
+        time.sleep(0.001)
+        x.append(message)
+
+    logger.add(sink, format="{message}", enqueue="batch", capacity=2, batch_size=1)
+    for i in range(20):
+        logger.info(i)
+    logger.remove()
+
+    assert x == ["%d\n" % i for i in range(20)]
+
+
+def test_enqueue_batch_caught_exception_sink_write(capsys):
+    logger.add(NotWritable(), enqueue="batch", catch=True, format="{message}")
+
+    logger.info("It's fine")
+    logger.bind(fail=True).info("Bye bye...")
+    logger.info("It's fine again")
+    logger.remove()
+
+    out, err = capsys.readouterr()
+    lines = err.strip().splitlines()
+    assert out == "It's fine\nIt's fine again\n"
+    assert lines[0] == "--- Logging error in Loguru Handler #0 ---"
+    assert re.match(r"Record was: \{.*Bye bye.*\}", lines[1])
+    assert lines[-1] == "--- End of logging error ---"
+
+
+def test_enqueue_batch_file(tmpdir):
+    filepath = tmpdir.join("test.log")
+    logger.add(str(filepath), format="{message}", enqueue="batch")
+
+    for i in range(100):
+        logger.info(i)
+    logger.remove()
+
+    assert filepath.read() == "".join("%d\n" % i for i in range(100))
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"enqueue": "foo"},
+        {"enqueue": "batch", "capacity": 0},
+        {"enqueue": "batch", "overflow": "foo"},
+        {"enqueue": "batch", "batch_size": "foo"},
+    ],
+)
+def test_enqueue_batch_invalid_options(writer, kwargs):
+    with pytest.raises(ValueError):
+        logger.add(writer, **kwargs)
+
+
+def test_enqueue_batch_options_require_batch(writer):
+    with pytest.raises(TypeError, match=r"unexpected keyword argument 'capacity'"):
+        logger.add(writer, capacity=10)
@@ -130,3 +130,45 @@ def test_filter_dict_with_custom_level(writer):
 def test_invalid_filter_builtin(writer):
     with pytest.raises(ValueError, match=r".* most likely a mistake"):
         logger.add(writer, filter=filter)
+
+
+@pytest.mark.parametrize(
+    "filter", ["other", {"tests": False}, {"tests": "ERROR"}, {"": "INFO", "tests": 40}]
+)
+def test_filtered_out_without_building_record(writer, filter):
+    calls = []
+    logger.add(writer, filter=filter, format="{message}")
+    logger.opt(lazy=True).warning("{}", lambda: calls.append(1))
+    assert writer.read() == ""
+    assert calls == []
+
+
+def test_filtered_module_cache_updated(writer):
+    logger.add(writer, filter="other", format="{message}")
+    logger.info("1")
+    i = logger.add(writer, filter="tests", format="{message}", level="WARNING")
+    logger.info("2")
+    logger.warning("3")
+    logger.remove(i)
+    logger.warning("4")
+    logger.add(writer, filter={"tests": "INFO"}, format="{message}")
+    logger.info("5")
+    logger.debug("6")
+    assert writer.read() == "3\n5\n"
+
+
+@pytest.mark.parametrize("filter", ["foo", {"": False, "foo": "INFO"}])
+def test_filter_on_patched_name(writer, filter):
+    logger.add(writer, filter=filter, format="{name} {message}")
+    logger.info("Skipped")
+    logger.patch(lambda r: r.update(name="foo")).info("Patched")
+    assert writer.read() == "foo Patched\n"
+
+
+def test_filter_on_name_patched_by_configure(writer):
+    logger.add(writer, filter="foo", format="{name} {message}")
+    logger.configure(patcher=lambda r: r.update(name="foo"))
+    logger.info("Patched")
+    logger.disable("tests")
+    logger.info("Disabled")
+    assert writer.read() == "foo Patched\n"
@@ -2,6 +2,7 @@ import io
 
 import pytest
 
+import loguru
 from loguru import logger
 
 
@@ -30,6 +31,40 @@ def test_file_buffering(tmpdir):
     assert file.read() != ""
 
 
+def test_file_flush_interval(tmpdir, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(loguru._file_sink, "monotonic", lambda: now[0])
+    file = tmpdir.join("test.log")
+    logger.add(str(file), format="{message}", buffering=-1, flush_interval="5 s")
+    logger.debug("a")
+    assert file.read() == "a\n"
+    now[0] = 4.0
+    logger.debug("b")
+    assert file.read() == "a\n"
+    now[0] = 5.0
+    logger.debug("c")
+    assert file.read() == "a\nb\nc\n"
+    logger.debug("d")
+    assert file.read() == "a\nb\nc\n"
+    logger.complete()
+    assert file.read() == "a\nb\nc\nd\n"
+
+
+@pytest.mark.parametrize("enqueue", [True, "batch"])
+def test_file_flushed_by_complete_with_enqueue(tmpdir, enqueue):
+    file = tmpdir.join("test.log")
+    logger.add(str(file), format="{message}", buffering=-1, enqueue=enqueue)
+    logger.debug("a")
+    logger.complete()
+    assert file.read() == "a\n"
+
+
+@pytest.mark.parametrize("flush_interval", ["foo", object(), True])
+def test_invalid_file_flush_interval(tmpdir, flush_interval):
+    with pytest.raises((ValueError, TypeError)):
+        logger.add(str(tmpdir.join("test.log")), flush_interval=flush_interval)
+
+
 def test_invalid_function_kwargs():
     def function(message):
         pass
@@ -1,6 +1,8 @@
 import json
 import sys
 
+import pytest
+
 from loguru import logger
 
 
@@ -127,3 +129,101 @@ def test_serialize_not_serializable():
     logger.bind(not_serializable=not_serializable).debug("Test")
     assert sink.dict["extra"]["not_serializable"] == not_serializable
     assert bool(sink.json["record"]["extra"]["not_serializable"])
+
+
+def test_serialize_fields(writer):
+    logger.add(writer, serialize=["level.name", "message", "extra", "line"])
+    logger.bind(a=1).info("Test")
+    line = sys._getframe().f_lineno - 1
+    assert json.loads(writer.read()) == {
+        "level.name": "INFO",
+        "message": "Test",
+        "extra": {"a": 1},
+        "line": line,
+    }
+
+
+def test_serialize_fields_same_as_record():
+    full, partial = JsonSink(), JsonSink()
+    fields = ["elapsed", "exception", "file", "level", "process", "thread", "time"]
+    logger.add(full, serialize=True, catch=False)
+    logger.add(partial, serialize=fields, catch=False)
+
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("Error")
+
+    for field in fields:
+        assert partial.json[field] == full.json["record"][field]
+
+
+def test_serialize_fields_with_keys(writer):
+    logger.add(
+        writer,
+        format="{level} {message}",
+        serialize={"time": "time.timestamp", "lvl": "level.no", "text": "text"},
+    )
+    logger.warning("Test")
+    serialized = json.loads(writer.read())
+    assert list(serialized) == ["time", "lvl", "text"]
+    assert isinstance(serialized["time"], float)
+    assert serialized["lvl"] == 30
+    assert serialized["text"] == "WARNING Test\n"
+
+
+def test_serialize_fields_without_formatting(writer):
+    def format_(record):
+        raise AssertionError("Should not be formatted")
+
+    logger.add(writer, format=format_, serialize=["message"], catch=False)
+    logger.info("Test")
+    assert writer.read() == '{"message": "Test"}\n'
+
+
+def test_serialize_json_encoder(writer):
+    def encoder(obj):
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+    logger.add(writer, serialize=["name", "message"], json_encoder=encoder)
+    logger.info("Test")
+    assert writer.read() == '{"message":"Test","name":"tests.test_add_option_serialize"}\n'
+
+
+def test_serialize_json_encoder_with_extra_objects(writer):
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    def encoder(obj):
+        return json.dumps(obj, sort_keys=True)
+
+    logger.add(writer, serialize=["extra"], json_encoder=encoder, catch=False)
+    logger.bind(obj=Custom(), nested={"items": (1, Custom()), Custom(): None}).info("Test")
+    assert json.loads(writer.read()) == {
+        "extra": {"nested": {"custom": None, "items": [1, "custom"]}, "obj": "custom"}
+    }
+
+
+def test_serialize_json_encoder_with_record(writer):
+    def encoder(obj):
+        return json.dumps(obj["record"]["message"])
+
+    logger.add(writer, serialize=True, json_encoder=encoder)
+    logger.info("Test")
+    assert writer.read() == '"Test"\n'
+
+
+@pytest.mark.parametrize(
+    "fields, exception",
+    [
+        ([], ValueError),
+        (["foo"], ValueError),
+        (["time.foo"], ValueError),
+        ([1], TypeError),
+        ({"key": None}, TypeError),
+    ],
+)
+def test_invalid_serialize_fields(writer, fields, exception):
+    with pytest.raises(exception):
+        logger.add(writer, serialize=fields)
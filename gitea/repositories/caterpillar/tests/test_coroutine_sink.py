@@ -725,3 +725,197 @@ def test_complete_with_sub_processes(monkeypatch, capsys):
     out, err = capsys.readouterr()
     assert out == err == ""
     assert writer.output == "Child\n"
+
+
+def test_queued_messages_in_order():
+    received = []
+
+    async def sink(message):
+        await asyncio.sleep(0)
+        received.append(str(message))
+
+    async def worker():
+        for i in range(10):
+            logger.info(str(i))
+        await logger.complete()
+
+    logger.add(sink, format="{message}", queue_size=3)
+    asyncio.run(worker())
+
+    assert received == ["%d\n" % i for i in range(10)]
+
+
+def test_queued_messages_in_order_when_yielding():
+    received = []
+
+    async def sink(message):
+        await asyncio.sleep(0)
+        received.append(message.record["message"])
+
+    async def worker():
+        for i in range(50):
+            logger.info(str(i))
+            if i % 3 == 0:
+                await asyncio.sleep(0)
+        await logger.complete()
+
+    logger.add(sink, queue_size=2)
+    asyncio.run(worker())
+
+    assert received == [str(i) for i in range(50)]
+
+
+def test_queued_before_loop_is_running():
+    received = []
+
+    async def sink(message):
+        received.append(message.record["message"])
+
+    loop = asyncio.new_event_loop()
+    handler_id = logger.add(sink, queue_size=2, loop=loop)
+    for i in range(5):
+        logger.info(str(i))
+    loop.run_until_complete(logger.complete())
+    logger.remove(handler_id)
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+    assert received == [str(i) for i in range(5)]
+
+
+def test_queued_single_consumer():
+    running = []
+    concurrency = []
+
+    async def sink(message):
+        running.append(message)
+        concurrency.append(len(running))
+        await asyncio.sleep(0.001)
+        running.remove(message)
+
+    async def worker():
+        for i in range(20):
+            logger.info(str(i))
+        await logger.complete()
+
+    logger.add(sink, format="{message}", queue_size=5)
+    asyncio.run(worker())
+
+    assert concurrency == [1] * 20
+
+
+@pytest.mark.parametrize("overflow, expected", [("drop_new", "012"), ("drop_oldest", "789")])
+def test_queued_overflow(overflow, expected):
+    received = []
+
+    async def sink(message):
+        received.append(message.record["message"])
+
+    async def worker():
+        for i in range(10):
+            logger.info(str(i))
+        await logger.complete()
+
+    logger.add(sink, queue_size=3, queue_overflow=overflow)
+    asyncio.run(worker())
+
+    assert "".join(received) == expected
+
+
+def test_queued_batches():
+    batches = []
+
+    async def sink(messages):
+        batches.append([m.record["message"] for m in messages])
+
+    async def worker():
+        for i in range(5):
+            logger.info(str(i))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        logger.info("5")
+        await logger.complete()
+
+    logger.add(sink, queue_batch_size=3)
+    asyncio.run(worker())
+
+    assert batches == [["0", "1", "2"], ["3", "4"], ["5"]]
+
+
+def test_queued_from_another_thread():
+    received = []
+
+    async def sink(message):
+        await asyncio.sleep(0.001)
+        received.append(message.record["message"])
+
+    async def worker():
+        loop = asyncio.get_event_loop()
+        logger.add(sink, queue_size=2, loop=loop)
+        await loop.run_in_executor(None, lambda: [logger.info(str(i)) for i in range(10)])
+        await logger.complete()
+
+    asyncio.run(worker())
+
+    assert received == [str(i) for i in range(10)]
+
+
+def test_queued_from_loop_and_another_thread():
+    received = []
+
+    async def sink(message):
+        await asyncio.sleep(0)
+        received.append(message.record["message"])
+
+    def log(name):
+        for i in range(2000):
+            logger.info("%s %d" % (name, i))
+
+    async def worker():
+        loop = asyncio.get_event_loop()
+        logger.add(sink, queue_size=100, loop=loop)
+        future = loop.run_in_executor(None, log, "thread")
+        log("loop")
+        await future
+        await logger.complete()
+
+    # Run apart so that a deadlock fails the test instead of hanging
+    thread = threading.Thread(target=asyncio.run, args=(worker(),), daemon=True)
+    thread.start()
+    thread.join(30)
+
+    assert not thread.is_alive()
+    for name in ("loop", "thread"):
+        messages = [m for m in received if m.startswith(name)]
+        assert messages == ["%s %d" % (name, i) for i in range(2000)]
+
+
+def test_queued_error(capsys):
+    async def sink(message):
+        raise ValueError("Oops")
+
+    async def worker():
+        logger.info("A")
+        logger.info("B")
+        await logger.complete()
+
+    logger.add(sink, queue_size=10)
+    asyncio.run(worker())
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.count("ValueError: Oops") == 2
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"queue_size": 0},
+        {"queue_size": "10"},
+        {"queue_overflow": "drop"},
+        {"queue_batch_size": 0},
+    ],
+)
+def test_invalid_queue_options(options):
+    with pytest.raises(ValueError):
+        logger.add(async_writer, **options)
@@ -156,3 +156,21 @@ def test_missing_struct_time_fields(writer, monkeypatch, monkeypatch_date):
     assert re.fullmatch(
         r"\d{4} \d{2} \d{2} \d{2} \d{2} \d{2} \d{6} [+-]\d{4} .*\n", result
     )
+
+
+def test_formatting_same_second():
+    tzinfo = datetime.timezone(datetime.timedelta(hours=1))
+    time_format = "YYYY-MM-DD HH:mm:ss.SSS [SSS] Z HH"
+    dates = [
+        (2018, 6, 9, 1, 2, 3, 456000, tzinfo),
+        (2018, 6, 9, 1, 2, 3, 789000, datetime.timezone.utc),
+        (2018, 6, 9, 1, 2, 4, 0, tzinfo),
+        (2019, 6, 9, 1, 2, 4, 0, tzinfo),
+    ]
+    results = [format(loguru._datetime.datetime(*date), time_format) for date in dates]
+    assert results == [
+        "2018-06-09 01:02:03.456 SSS +01:00 01",
+        "2018-06-09 01:02:03.789 SSS +00:00 01",
+        "2018-06-09 01:02:04.000 SSS +01:00 01",
+        "2019-06-09 01:02:04.000 SSS +01:00 01",
+    ]
@@ -0,0 +1,122 @@
+import os
+import threading
+
+import pytest
+
+from loguru import logger
+
+
+def test_compression_at_remove(tmpdir):
+    i = logger.add(str(tmpdir.join("file.log")), compression="gz", background=True)
+    logger.debug("test")
+    logger.remove(i)
+
+    assert [f.basename for f in tmpdir.listdir()] == ["file.log.gz"]
+
+
+def test_logging_not_blocked_by_compression(tmpdir):
+    event = threading.Event()
+    compressed = []
+
+    def compress(file):
+        assert event.wait(5)
+        os.replace(file, file + ".rar")
+        compressed.append(file)
+
+    logger.add(
+        str(tmpdir.join("file.log")),
+        format="{message}",
+        rotation=0,
+        compression=compress,
+        background=True,
+    )
+    logger.debug("A")
+    logger.debug("B")
+
+    assert compressed == []
+    assert tmpdir.join("file.log").read() == "B\n"
+    assert len(tmpdir.listdir(lambda f: f.basename.endswith(".compressing"))) == 2
+
+    event.set()
+    logger.complete()
+
+    assert len(compressed) == 2
+    files = sorted(f.basename for f in tmpdir.listdir())
+    assert len(files) == 3
+    assert files[-1] == "file.log"
+    assert all(f.endswith(".log.rar") for f in files[:-1])
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_retention_at_rotation(tmpdir, background):
+    logger.add(
+        str(tmpdir.join("file.log")),
+        format="{message}",
+        rotation=0,
+        retention=2,
+        compression="gz",
+        background=background,
+    )
+    for i in range(5):
+        logger.debug(str(i))
+    logger.complete()
+
+    files = sorted(f.basename for f in tmpdir.listdir())
+    assert len(files) == 3
+    assert files[-1] == "file.log"
+    assert all(f.endswith(".log.gz") for f in files[:-1])
+
+
+def test_retention_without_compression(tmpdir):
+    logger.add(
+        str(tmpdir.join("file.log")),
+        format="{message}",
+        rotation=0,
+        retention=1,
+        background=True,
+    )
+    for i in range(3):
+        logger.debug(str(i))
+    logger.complete()
+
+    assert len(tmpdir.listdir()) == 2
+    assert tmpdir.join("file.log").read() == "2\n"
+
+
+def test_resume_interrupted_compression(tmpdir):
+    rotated = tmpdir.join("file.2020-01-01_00-00-00_000000.log")
+    rotated.write("Rotated\n")
+    tmpdir.join("file.2020-01-01_00-00-00_000000.log.compressing").write("")
+    # The file of the marker has already been removed
+    tmpdir.join("file.2020-01-02_00-00-00_000000.log.compressing").write("")
+    # The current file is compressed again at the end
+    tmpdir.join("file.log.compressing").write("")
+
+    logger.add(str(tmpdir.join("file.log")), compression="gz", background=True)
+    logger.complete()
+
+    files = sorted(f.basename for f in tmpdir.listdir())
+    assert files == ["file.2020-01-01_00-00-00_000000.log.gz", "file.log"]
+
+
+def test_compression_error(tmpdir, capsys):
+    def compress(file):
+        raise ValueError("Compression error")
+
+    logger.add(
+        str(tmpdir.join("file.log")),
+        format="{message}",
+        rotation=0,
+        compression=compress,
+        background=True,
+        catch=False,
+    )
+    logger.debug("A")
+    logger.complete()
+    logger.debug("B")
+    logger.complete()
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err.count("ValueError: Compression error") == 2
+    assert tmpdir.join("file.log").read() == "B\n"
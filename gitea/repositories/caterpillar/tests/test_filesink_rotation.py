@@ -197,6 +197,36 @@ def test_size_rotation(monkeypatch_date, tmpdir, size):
     assert tmpdir.join("test_2018-01-01_00-00-03_000000.log").read() == "klmno\n"
 
 
+def test_size_rotation_existing_file(tmpdir):
+    file = tmpdir.join("test.log")
+    file.write("abcd\n")
+    logger.add(str(file), format="{message}", rotation=10, mode="a")
+    logger.debug("efg")
+    logger.debug("hij")
+    assert file.read() == "hij\n"
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_size_rotation_counts_bytes(tmpdir):
+    file = tmpdir.join("test.log")
+    logger.add(str(file), format="{message}", rotation=8, encoding="utf8")
+    logger.debug("éé")
+    logger.debug("éé")
+    assert file.read_text("utf8") == "éé\n"
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_size_rotation_with_block_buffering(tmpdir):
+    file = tmpdir.join("test.log")
+    logger.add(str(file), format="{message}", rotation=20, buffering=-1)
+    for message in ("abcdefghi", "jklmnopqr", "stuvwxyz"):
+        logger.debug(message)
+    logger.complete()
+    assert file.read() == "stuvwxyz\n"
+    (rotated,) = [f for f in tmpdir.listdir() if f != file]
+    assert rotated.read() == "abcdefghi\njklmnopqr\n"
+
+
 @pytest.mark.parametrize(
     "when, hours",
     [
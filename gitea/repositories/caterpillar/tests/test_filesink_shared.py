@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import pickle
+
+import pytest
+
+from loguru import logger
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Windows does not support shared files")
+
+
+def log_lines(logger_, process, number):
+    for i in range(number):
+        logger_.info("{} {} " + "x" * 100, process, i)
+    logger_.remove()
+
+
+def add_and_log_lines(path, process, number):
+    logger.remove()
+    logger.add(path, format="{message}", shared=True, rotation=2000)
+    log_lines(logger, process, number)
+
+
+def check_lines(tmpdir, processes, number):
+    lines = []
+    for file in tmpdir.listdir(lambda f: f.ext == ".log"):
+        lines += file.read().splitlines()
+    assert sorted(lines) == sorted(
+        "%d %d %s" % (p, i, "x" * 100) for p in range(processes) for i in range(number)
+    )
+
+
+def test_shared_file(tmpdir):
+    logger.add(str(tmpdir.join("file.log")), format="{message}", shared=True)
+    logger.info("A")
+    logger.info("B")
+    logger.remove()
+
+    assert tmpdir.join("file.log").read() == "A\nB\n"
+    assert tmpdir.join("file.log.lock").check(file=1)
+
+
+def test_bypass_buffering(tmpdir):
+    logger.add(str(tmpdir.join("file.log")), format="{message}", shared=True, buffering=1000)
+    logger.info("A")
+
+    assert tmpdir.join("file.log").read() == "A\n"
+
+
+def test_rotation_followed_by_other_sink(tmpdir):
+    path = str(tmpdir.join("file.log"))
+    first, second = [], []
+    logger.add(path, format="{message}", shared=True, rotation=4, filter=lambda r: first)
+    logger.add(path, format="{message}", shared=True, rotation=4, filter=lambda r: second)
+
+    first.append(True)
+    logger.info("A")
+    logger.info("B")
+    first.clear()
+    second.append(True)
+    logger.info("C")
+    first.append(True)
+    second.clear()
+    logger.info("D")
+    logger.remove()
+
+    files = sorted(tmpdir.listdir(lambda f: f.ext == ".log"))
+    assert [f.read() for f in files] == ["A\nB\n", "C\nD\n"]
+    assert files[-1].basename == "file.log"
+
+
+def test_retention_ignores_lock_file(tmpdir):
+    logger.add(
+        str(tmpdir.join("file.log")), format="{message}", shared=True, rotation=0, retention=1
+    )
+    for i in range(3):
+        logger.info(str(i))
+    logger.remove()
+
+    files = sorted(f.basename for f in tmpdir.listdir())
+    assert len(files) == 3
+    assert files[1:] == ["file.log", "file.log.lock"]
+
+
+def test_no_compression_at_stop(tmpdir):
+    logger.add(str(tmpdir.join("file.log")), shared=True, compression="gz")
+    logger.info("A")
+    logger.remove()
+
+    assert sorted(f.basename for f in tmpdir.listdir()) == ["file.log", "file.log.lock"]
+
+
+def test_time_in_path(tmpdir):
+    path = str(tmpdir.join("file_{time:x}.log"))
+    logger.add(path, format="{message}", shared=True)
+    logger.add(path, format="{message}", shared=True)
+    logger.info("A")
+    logger.remove()
+
+    files = tmpdir.listdir(lambda f: f.ext == ".log")
+    assert len(files) == 1
+    assert files[0].read() == "A\nA\n"
+
+
+def test_pickled_sink(tmpdir):
+    logger.add(str(tmpdir.join("file.log")), format="{message}", shared=True)
+    logger.info("A")
+    logger_ = pickle.loads(pickle.dumps(logger))
+    logger_.info("B")
+    logger.info("C")
+    logger_.remove()
+    logger.remove()
+
+    assert tmpdir.join("file.log").read() == "A\nB\nC\n"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows does not support forking")
+def test_forked_processes(tmpdir):
+    ctx = multiprocessing.get_context("fork")
+    logger.add(str(tmpdir.join("file.log")), format="{message}", shared=True, rotation=2000)
+
+    processes = [ctx.Process(target=log_lines, args=(logger, p, 200)) for p in range(1, 4)]
+    for process in processes:
+        process.start()
+    log_lines(logger, 0, 200)
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    check_lines(tmpdir, 4, 200)
+
+
+def test_independent_processes(tmpdir):
+    ctx = multiprocessing.get_context("spawn")
+    path = str(tmpdir.join("file.log"))
+
+    processes = [ctx.Process(target=add_and_log_lines, args=(path, p, 200)) for p in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    check_lines(tmpdir, 3, 200)
+
+
+def test_invalid_mode(tmpdir):
+    with pytest.raises(ValueError):
+        logger.add(str(tmpdir.join("file.log")), shared=True, mode="w")
@@ -105,6 +105,21 @@ def test_pickling_coroutine_function_handler(capsys):
     assert err == ""
 
 
+def test_pickling_dedup_tracebacks_handler(capsys):
+    logger.add(print_, format="{message}", diagnose=False, dedup_tracebacks=10)
+    pickled = pickle.dumps(logger)
+    unpickled = pickle.loads(pickled)
+    for _ in range(2):
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            unpickled.exception("")
+    out, err = capsys.readouterr()
+    assert out.count("Traceback (most recent call last):") == 1
+    assert "Traceback (same as" in out
+    assert err == ""
+
+
 @pytest.mark.parametrize("flushable", [True, False])
 @pytest.mark.parametrize("stoppable", [True, False])
 def test_pickling_stream_handler(flushable, stoppable):
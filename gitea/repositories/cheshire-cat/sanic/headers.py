@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 
+from functools import lru_cache
+from http.cookies import SimpleCookie
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import unquote
 
@@ -17,6 +19,11 @@ HeaderBytesIterable = Iterable[Tuple[bytes, bytes]]
 Options = Dict[str, Union[int, str]]  # key=value fields in various headers
 OptionsIterable = Iterable[Tuple[str, str]]  # May contain duplicate keys
 
+# Parsed header values are memoized per process, keyed by the raw header
+# string. Clients tend to send a very small set of distinct values for these
+# headers, so a bounded LRU cache avoids re-parsing them on every request.
+HEADER_CACHE_SIZE = 1024
+
 _token, _quoted = r"([\w!#$%&'*+\-.^_`|~]+)", r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
 _firefox_quote_escape = re.compile(r'\\"(?!; |\s*$)')
@@ -209,6 +216,12 @@ def parse_content_header(value: str) -> Tuple[str, Options]:
     Mostly identical to cgi.parse_header and werkzeug.parse_options_header
     but runs faster and handles special characters better. Unescapes quotes.
     """
+    value, options = _parse_content_header(value)
+    return value, dict(options)
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _parse_content_header(value: str) -> Tuple[str, Options]:
     value = _firefox_quote_escape.sub("%22", value)
     pos = value.find(";")
     if pos == -1:
@@ -242,6 +255,12 @@ def parse_forwarded(headers, config) -> Optional[Options]:
     header = ",".join(header)  # Join multiple header lines
     if secret not in header:
         return None
+    options = _parse_forwarded(header, secret)
+    return dict(options) if options is not None else None
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _parse_forwarded(header: str, secret: str) -> Optional[Options]:
     # Loop over <separator><key>=<value> elements from right to left
     sep = pos = None
     options: List[Tuple[str, str]] = []
@@ -376,6 +395,11 @@ def parse_accept(accept: str) -> AcceptContainer:
     accorsing to RFC 7231, s. 5.3.2
     https://datatracker.ietf.org/doc/html/rfc7231#section-5.3.2
     """
+    return AcceptContainer(_parse_accept(accept))
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _parse_accept(accept: str) -> Tuple[Accept, ...]:
     media_types = accept.split(",")
     accept_list: List[Accept] = []
 
@@ -385,4 +409,16 @@ def parse_accept(accept: str) -> AcceptContainer:
 
         accept_list.append(Accept.parse(mtype))
 
-    return AcceptContainer(sorted(accept_list, key=_sort_accept_value, reverse=True))
+    return tuple(sorted(accept_list, key=_sort_accept_value, reverse=True))
+
+
+def parse_cookie(raw: str) -> Dict[str, str]:
+    """Parse a Cookie request header into a dict of names and values."""
+    return dict(_parse_cookie(raw))
+
+
+@lru_cache(maxsize=HEADER_CACHE_SIZE)
+def _parse_cookie(raw: str) -> Dict[str, str]:
+    cookies: SimpleCookie = SimpleCookie()
+    cookies.load(raw)
+    return {name: cookie.value for name, cookie in cookies.items()}
@@ -24,7 +24,6 @@ import email.utils
 import uuid
 
 from collections import defaultdict
-from http.cookies import SimpleCookie
 from types import SimpleNamespace
 from urllib.parse import parse_qs, parse_qsl, unquote, urlunparse
 
@@ -38,6 +37,7 @@ from sanic.headers import (
     Options,
     parse_accept,
     parse_content_header,
+    parse_cookie,
     parse_forwarded,
     parse_host,
     parse_xforwarded,
@@ -480,9 +480,7 @@ class Request:
         if self._cookies is None:
             cookie = self.headers.getone("cookie", None)
             if cookie is not None:
-                cookies: SimpleCookie = SimpleCookie()
-                cookies.load(cookie)
-                self._cookies = {name: cookie.value for name, cookie in cookies.items()}
+                self._cookies = parse_cookie(cookie)
             else:
                 self._cookies = {}
         return self._cookies
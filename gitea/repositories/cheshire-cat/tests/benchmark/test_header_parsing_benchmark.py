@@ -0,0 +1,73 @@
+from pytest import fixture, mark
+
+from sanic import headers
+from sanic.config import Config
+from sanic.request import Request
+
+
+BROWSER_ACCEPT_HEADERS = (
+    # Firefox
+    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,"
+    "image/webp,*/*;q=0.8",
+    # Chrome
+    "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,"
+    "image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9",
+    # Safari
+    "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    # fetch() / XHR
+    "application/json, text/plain, */*",
+    "*/*",
+)
+FORWARDED_HEADERS = (
+    "for=1.1.1.1;proto=https;host=example.com;by=_secret",
+    "for=1.1.1.1, for=10.0.0.1;proto=https;host=example.com;by=_secret",
+    'for="[2001:db8::1]";proto=https;host=example.com;by=_secret',
+)
+COOKIE_HEADERS = (
+    "session=4cd2bd1e; theme=dark",
+    "session=4cd2bd1e; theme=dark; _ga=GA1.2.1234567890.1234567890",
+)
+
+
+@fixture
+def config():
+    config = Config()
+    config.FORWARDED_SECRET = "_secret"
+    return config
+
+
+def make_raw_headers():
+    return [
+        {"accept": accept, "forwarded": forwarded, "cookie": cookie}
+        for accept, forwarded, cookie in zip(
+            BROWSER_ACCEPT_HEADERS * 6,
+            FORWARDED_HEADERS * 10,
+            COOKIE_HEADERS * 15,
+        )
+    ]
+
+
+def parse_headers(raw_headers, config):
+    for raw in raw_headers:
+        request = Request(b"/", raw, "1.1", "GET", None, None)
+        request.accept
+        request.cookies
+        headers.parse_forwarded(request.headers, config)
+
+
+class TestSanicHeaderParsing:
+    @mark.parametrize("cached", (True, False), ids=("cached", "uncached"))
+    def test_parse_browser_headers(self, benchmark, config, cached, monkeypatch):
+        if not cached:
+            for name in ("_parse_accept", "_parse_cookie", "_parse_forwarded"):
+                monkeypatch.setattr(
+                    headers, name, getattr(headers, name).__wrapped__
+                )
+        raw_headers = make_raw_headers()
+
+        benchmark.pedantic(
+            parse_headers,
+            (raw_headers, config),
+            iterations=100,
+            rounds=100,
+        )
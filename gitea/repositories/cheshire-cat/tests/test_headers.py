@@ -365,3 +365,31 @@ def test_value_not_in_accept(value):
 def test_browser_headers(header, expected):
     request = Request(b"/", {"accept": header}, "1.1", "GET", None, None)
     assert request.accept == expected
+
+
+def test_parse_accept_cached_result_is_not_shared():
+    header = "text/html,application/xml;q=0.9,*/*;q=0.8"
+    first = headers.parse_accept(header)
+    first.clear()
+    second = headers.parse_accept(header)
+    assert second == ["text/html", "application/xml;q=0.9", "*/*;q=0.8"]
+    assert headers._parse_accept.cache_info().hits > 0
+
+
+def test_parse_content_header_cached_options_are_not_shared():
+    header = 'form-data; name=upload; filename="file.txt"'
+    _, options = headers.parse_content_header(header)
+    options["name"] = "changed"
+    assert headers.parse_content_header(header) == (
+        "form-data",
+        {"name": "upload", "filename": "file.txt"},
+    )
+
+
+def test_parse_cookie_cached_result_is_not_shared():
+    cookies = headers.parse_cookie("foo=one; bar=two")
+    cookies["foo"] = "changed"
+    assert headers.parse_cookie("foo=one; bar=two") == {
+        "foo": "one",
+        "bar": "two",
+    }
@@ -1,14 +1,34 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
 from enum import Enum
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from fastapi import routing
+from fastapi.caching import CachePolicy, etag_matches
+from fastapi.concurrency import Threadpool, run_in_threadpool
 from fastapi.datastructures import Default, DefaultPlaceholder
+from fastapi.dependencies.models import DependencyOverridesCache
 from fastapi.encoders import DictIntStrAny, SetIntStr
 from fastapi.exception_handlers import (
     http_exception_handler,
     request_validation_exception_handler,
 )
 from fastapi.exceptions import RequestValidationError
+from fastapi.formparsers import UploadSpool
 from fastapi.logger import logger
 from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
 from fastapi.openapi.docs import (
@@ -16,8 +36,9 @@ from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.openapi.utils import get_openapi
+from fastapi.openapi.utils import get_openapi, get_openapi_fingerprint
 from fastapi.params import Depends
+from fastapi.profiling import Profiler
 from fastapi.types import DecoratedCallable
 from fastapi.utils import generate_unique_id
 from starlette.applications import Starlette
@@ -25,6 +46,7 @@ from starlette.datastructures import State
 from starlette.exceptions import ExceptionMiddleware, HTTPException
 from starlette.middleware import Middleware
 from starlette.middleware.errors import ServerErrorMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from starlette.responses import HTMLResponse, JSONResponse, Response
 from starlette.routing import BaseRoute
@@ -72,6 +94,16 @@ class FastAPI(Starlette):
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
+        concurrent_dependencies: bool = False,
+        threadpool: Optional[Threadpool] = None,
+        max_form_size: Optional[int] = None,
+        upload_spool: Optional[UploadSpool] = None,
+        openapi_cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None,
+        generate_openapi_on_startup: bool = False,
+        profiler: Optional[Profiler] = None,
+        profiler_url: Optional[str] = None,
+        lazy_routes: bool = False,
+        compile_routes_on_startup: bool = False,
         **extra: Any,
     ) -> None:
         self._debug: bool = debug
@@ -93,6 +125,14 @@ class FastAPI(Starlette):
         self.extra = extra
         self.openapi_version = "3.0.2"
         self.openapi_schema: Optional[Dict[str, Any]] = None
+        self.openapi_cache_dir = openapi_cache_dir
+        self.generate_openapi_on_startup = generate_openapi_on_startup
+        self._openapi_lock = threading.Lock()
+        # The schema it was encoded from, the number of servers at that time, the
+        # JSON body, the gzipped body and the ETag
+        self._openapi_body: Optional[
+            Tuple[Dict[str, Any], int, bytes, Optional[bytes], str]
+        ] = None
         if self.openapi_url:
             assert self.title, "A title must be provided for OpenAPI, e.g.: 'My API'"
             assert self.version, "A version must be provided for OpenAPI, e.g.: '2.1.0'"
@@ -107,6 +147,15 @@ class FastAPI(Starlette):
         self.root_path = root_path or openapi_prefix
         self.state: State = State()
         self.dependency_overrides: Dict[Callable[..., Any], Callable[..., Any]] = {}
+        # Reuses the dependants and solve plans derived from the overrides until
+        # they change
+        self.dependency_overrides_cache = DependencyOverridesCache()
+        self.concurrent_dependencies = concurrent_dependencies
+        self.threadpool = threadpool or Threadpool()
+        self.max_form_size = max_form_size
+        self.upload_spool = upload_spool or UploadSpool()
+        self.profiler = profiler
+        self.profiler_url = profiler_url
         self.router: routing.APIRouter = routing.APIRouter(
             routes=routes,
             dependency_overrides_provider=self,
@@ -119,7 +168,10 @@ class FastAPI(Starlette):
             include_in_schema=include_in_schema,
             responses=responses,
             generate_unique_id_function=generate_unique_id_function,
+            lazy_routes=lazy_routes,
         )
+        if compile_routes_on_startup:
+            self.add_event_handler("startup", self._compile_routes_in_background)
         self.exception_handlers: Dict[
             Union[int, Type[Exception]],
             Callable[[Request, Any], Coroutine[Any, Any, Response]],
@@ -188,34 +240,150 @@ class FastAPI(Starlette):
 
     def openapi(self) -> Dict[str, Any]:
         if not self.openapi_schema:
-            self.openapi_schema = get_openapi(
-                title=self.title,
-                version=self.version,
-                openapi_version=self.openapi_version,
-                description=self.description,
-                terms_of_service=self.terms_of_service,
-                contact=self.contact,
-                license_info=self.license_info,
-                routes=self.routes,
-                tags=self.openapi_tags,
-                servers=self.servers,
-            )
+            with self._openapi_lock:
+                if not self.openapi_schema:
+                    self.openapi_schema = self._generate_openapi()
         return self.openapi_schema
 
+    def _generate_openapi(self) -> Dict[str, Any]:
+        openapi_args: Dict[str, Any] = dict(
+            title=self.title,
+            version=self.version,
+            openapi_version=self.openapi_version,
+            description=self.description,
+            terms_of_service=self.terms_of_service,
+            contact=self.contact,
+            license_info=self.license_info,
+            routes=self.routes,
+            tags=self.openapi_tags,
+            servers=self.servers,
+        )
+        if not self.openapi_cache_dir:
+            return get_openapi(**openapi_args)
+        fingerprint = get_openapi_fingerprint(**openapi_args)
+        path = os.path.join(self.openapi_cache_dir, f"openapi-{fingerprint}.json")
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+            schema: Dict[str, Any] = json.loads(body)
+        except (OSError, ValueError):
+            schema = get_openapi(**openapi_args)
+            body = JSONResponse(schema).body
+            try:
+                os.makedirs(self.openapi_cache_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(body)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not store the OpenAPI schema in {path}: {e}")
+            else:
+                self._prune_openapi_cache_dir(keep=path)
+        else:
+            if self.servers:
+                # Keep sharing the list, a root_path is added to it when serving
+                schema["servers"] = self.servers
+        self._openapi_body = self._encode_openapi(schema, body=body)
+        return schema
+
+    def _prune_openapi_cache_dir(self, *, keep: str) -> None:
+        # The schemas of the previous versions of the app are never used again
+        assert self.openapi_cache_dir
+        keep_name = os.path.basename(keep)
+        try:
+            names = os.listdir(self.openapi_cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if (
+                name != keep_name
+                and name.startswith("openapi-")
+                and name.endswith(".json")
+            ):
+                try:
+                    os.remove(os.path.join(self.openapi_cache_dir, name))
+                except OSError:
+                    pass
+
+    def _encode_openapi(
+        self, schema: Dict[str, Any], *, body: Optional[bytes] = None
+    ) -> Tuple[Dict[str, Any], int, bytes, Optional[bytes], str]:
+        if body is None:
+            body = JSONResponse(schema).body
+        gzip_body = None
+        # Don't compress it twice
+        if len(body) >= 500 and not any(
+            middleware.cls is GZipMiddleware for middleware in self.user_middleware
+        ):
+            gzip_body = gzip.compress(body)
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        return schema, len(self.servers), body, gzip_body, etag
+
+    def openapi_body(self) -> Tuple[bytes, Optional[bytes], str]:
+        """
+        The OpenAPI schema encoded to JSON, gzipped (if it's worth it) and its
+        ETag. Encoded once and reused while `openapi()` returns the same schema.
+        """
+        schema = self.openapi()
+        encoded = self._openapi_body
+        if (
+            encoded is None
+            or encoded[0] is not schema
+            or encoded[1] != len(self.servers)
+        ):
+            encoded = self._openapi_body = self._encode_openapi(schema)
+        return encoded[2:]
+
+    def _generate_openapi_in_background(self) -> None:
+        def generate() -> None:
+            try:
+                self.openapi_body()
+            except Exception as e:
+                logger.warning(f"Could not generate the OpenAPI schema: {e!r}")
+
+        threading.Thread(target=generate, name="openapi", daemon=True).start()
+
+    def _compile_routes_in_background(self) -> None:
+        def compile_routes() -> None:
+            try:
+                self.router.compile_routes()
+            except Exception as e:
+                logger.warning(f"Could not compile the routes: {e!r}")
+
+        threading.Thread(target=compile_routes, name="routes", daemon=True).start()
+
     def setup(self) -> None:
         if self.openapi_url:
             urls = (server_data.get("url") for server_data in self.servers)
             server_urls = {url for url in urls if url}
 
-            async def openapi(req: Request) -> JSONResponse:
+            async def openapi(req: Request) -> Response:
                 root_path = req.scope.get("root_path", "").rstrip("/")
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi())
+                if not self.openapi_schema:
+                    # Not generated yet, or being generated in the background:
+                    # wait for it without blocking the event loop
+                    body, gzip_body, etag = await run_in_threadpool(self.openapi_body)
+                else:
+                    body, gzip_body, etag = self.openapi_body()
+                headers = {"ETag": etag}
+                if gzip_body is not None:
+                    headers["Vary"] = "Accept-Encoding"
+                if etag_matches(req.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers=headers)
+                if gzip_body is not None and "gzip" in req.headers.get(
+                    "accept-encoding", ""
+                ):
+                    headers["Content-Encoding"] = "gzip"
+                    body = gzip_body
+                return Response(body, media_type="application/json", headers=headers)
 
             self.add_route(self.openapi_url, openapi, include_in_schema=False)
+            if self.generate_openapi_on_startup:
+                self.add_event_handler("startup", self._generate_openapi_in_background)
         if self.openapi_url and self.docs_url:
 
             async def swagger_ui_html(req: Request) -> HTMLResponse:
@@ -254,6 +422,16 @@ class FastAPI(Starlette):
                 )
 
             self.add_route(self.redoc_url, redoc_html, include_in_schema=False)
+        if self.profiler_url:
+            assert self.profiler, "A profiler must be provided to serve its statistics"
+
+            async def profiler_statistics(req: Request) -> JSONResponse:
+                assert self.profiler
+                return JSONResponse(self.profiler.statistics())
+
+            self.add_route(
+                self.profiler_url, profiler_statistics, include_in_schema=False
+            )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if self.root_path:
@@ -288,6 +466,7 @@ class FastAPI(Starlette):
         ),
         name: Optional[str] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -316,6 +495,7 @@ class FastAPI(Starlette):
             response_class=response_class,
             name=name,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -344,6 +524,7 @@ class FastAPI(Starlette):
         response_class: Type[Response] = Default(JSONResponse),
         name: Optional[str] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -373,6 +554,7 @@ class FastAPI(Starlette):
                 response_class=response_class,
                 name=name,
                 openapi_extra=openapi_extra,
+                cache=cache,
                 generate_unique_id_function=generate_unique_id_function,
             )
             return func
@@ -447,6 +629,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -474,6 +657,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -502,6 +686,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -529,6 +714,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -557,6 +743,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -584,6 +771,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -612,6 +800,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -639,6 +828,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -667,6 +857,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -694,6 +885,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -722,6 +914,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -749,6 +942,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -777,6 +971,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -804,6 +999,7 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -832,6 +1028,7 @@ class FastAPI(Starlette):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[routing.APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -859,5 +1056,6 @@ class FastAPI(Starlette):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
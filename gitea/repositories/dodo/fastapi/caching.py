@@ -0,0 +1,231 @@
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import params
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class CacheBackend(ABC):
+    """
+    Where cached responses are stored.
+
+    The methods are a subset of the Redis commands, so that any Redis compatible
+    store can be used.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...  # pragma: no cover
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        ...  # pragma: no cover
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Keeps up to `max_entries` values in memory, evicting the least recently used.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+        # Kept apart from the entries so they are never evicted
+        self.counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if key in self.counters:
+            return str(self.counters[key]).encode()
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        self.entries[key] = (value, expires)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+        self.counters.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        value = self.counters.get(key, 0) + 1
+        self.counters[key] = value
+        return value
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Stores the values with a client like `redis.asyncio.Redis`, or any other with
+    the same async `get()`, `set()`, `delete()` and `incr()` methods.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value: Optional[bytes] = await self.client.get(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            await self.client.set(key, value)
+        else:
+            await self.client.set(key, value, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(key))
+
+
+class CachePolicy:
+    """
+    Caches the responses of a path operation, the serialized body with its status
+    code and headers.
+
+    Responses are cached per method, path and query string, and per the values of
+    the `vary_headers` and of the `vary_on` dependencies, e.g. the current user.
+    The other dependencies, like the security ones, are still solved before a
+    cached response is returned, only the endpoint call is skipped. Responses are
+    served with an `ETag`, and requests with a matching `If-None-Match` get a
+    `304 Not Modified`.
+
+    `await policy.invalidate()` drops all the responses cached with the same
+    `namespace` and backend.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = 60,
+        vary_headers: Sequence[str] = (),
+        vary_on: Sequence[params.Depends] = (),
+        namespace: str = "default",
+        backend: Optional[CacheBackend] = None,
+        status_codes: Sequence[int] = (200,),
+        key_prefix: str = "fastapi-cache:",
+    ) -> None:
+        self.ttl = ttl
+        self.vary_headers = [header.lower() for header in vary_headers]
+        self.vary_on = list(vary_on)
+        self.namespace = namespace
+        self.backend = backend or InMemoryCacheBackend()
+        self.status_codes = set(status_codes)
+        self.key_prefix = key_prefix
+        self.generation_key = f"{key_prefix}{namespace}:generation"
+
+    async def get_key(self, request: Request, vary_values: Dict[str, Any]) -> str:
+        # Invalidated by moving to a new generation, the old entries expire
+        generation = await self.backend.get(self.generation_key)
+        key_data = json.dumps(
+            [
+                request.method,
+                request.url.path,
+                sorted(request.query_params.multi_items()),
+                [request.headers.getlist(header) for header in self.vary_headers],
+                vary_values,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        digest = hashlib.sha256(key_data.encode()).hexdigest()
+        return f"{self.key_prefix}{self.namespace}:{int(generation or 0)}:{digest}"
+
+    def is_cacheable(self, response: Response) -> bool:
+        # Streaming and file responses don't have a body to store
+        return (
+            response.status_code in self.status_codes
+            and hasattr(response, "body")
+            and "set-cookie" not in response.headers
+        )
+
+    async def load(self, key: str) -> Optional[Tuple[Response, bool]]:
+        """
+        Return the cached response, and whether the headers and status code set by
+        the dependencies should be added to it.
+        """
+        data = await self.backend.get(key)
+        if data is None:
+            return None
+        return load_response(data)
+
+    async def store(
+        self, key: str, response: Response, *, merge_dependencies: bool = True
+    ) -> None:
+        if not self.is_cacheable(response):
+            return
+        if "etag" not in response.headers:
+            digest = hashlib.sha256(response.body).hexdigest()
+            response.headers["etag"] = f'"{digest}"'
+        if self.vary_headers:
+            vary = [
+                value.strip()
+                for value in response.headers.get("vary", "").split(",")
+                if value.strip()
+            ]
+            present = {value.lower() for value in vary}
+            vary.extend(header for header in self.vary_headers if header not in present)
+            response.headers["vary"] = ", ".join(vary)
+        await self.backend.set(
+            key, dump_response(response, merge_dependencies), self.ttl
+        )
+
+    async def invalidate(self) -> None:
+        await self.backend.incr(self.generation_key)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (
+        tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")
+    )
+
+
+def dump_response(response: Response, merge_dependencies: bool = True) -> bytes:
+    headers = [
+        [key.decode("latin-1"), value.decode("latin-1")]
+        for key, value in response.raw_headers
+        if key != b"content-length"
+    ]
+    # json.dumps() escapes new lines, the body starts after the first one
+    head = [response.status_code, headers, merge_dependencies]
+    return json.dumps(head).encode() + b"\n" + response.body
+
+
+def load_response(data: bytes) -> Tuple[Response, bool]:
+    head, body = data.split(b"\n", 1)
+    status_code, headers, merge_dependencies = json.loads(head)
+    response = Response(body, status_code=status_code)
+    raw_headers: List[Tuple[bytes, bytes]] = [
+        (key.encode("latin-1"), value.encode("latin-1")) for key, value in headers
+    ]
+    raw_headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    response.raw_headers = raw_headers
+    return response, merge_dependencies
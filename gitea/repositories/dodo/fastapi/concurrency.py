@@ -1,6 +1,15 @@
+import contextvars
+import itertools
+import math
 import sys
-from typing import AsyncGenerator, ContextManager, TypeVar
+import time
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, ContextManager, Optional, TypeVar
 
+import anyio
+from anyio.lowlevel import RunVar
+from fastapi.exceptions import HTTPException
+from fastapi.profiling import current_profile
 from starlette.concurrency import iterate_in_threadpool as iterate_in_threadpool  # noqa
 from starlette.concurrency import run_in_threadpool as run_in_threadpool  # noqa
 from starlette.concurrency import (  # noqa
@@ -17,16 +26,171 @@ else:
 
 _T = TypeVar("_T")
 
+# Run variables are stored by name, each threadpool needs its own names
+_threadpool_ids = itertools.count()
+
+
+class ThreadpoolStatistics:
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int],
+        busy: int,
+        waiting: int,
+        calls: int,
+        rejected: int,
+        queue_wait_total: float,
+        queue_wait_max: float,
+    ) -> None:
+        # None when using AnyIO's default thread limiter
+        self.max_workers = max_workers
+        # Calls running in a worker thread right now
+        self.busy = busy
+        # Calls waiting for a free worker thread right now
+        self.waiting = waiting
+        self.calls = calls
+        self.rejected = rejected
+        # Seconds calls spent waiting for a free worker thread
+        self.queue_wait_total = queue_wait_total
+        self.queue_wait_max = queue_wait_max
+
+    @property
+    def queue_wait_mean(self) -> float:
+        return self.queue_wait_total / self.calls if self.calls else 0.0
+
+
+class Threadpool:
+    """
+    The worker threads that run the sync endpoints, dependencies and response
+    validation of an app.
+
+    `max_workers` limits how many calls run at the same time, by default the
+    limit is shared with everything else using AnyIO's default thread limiter.
+    When `max_queue` calls are already waiting for a free thread, new ones are
+    rejected with a 503 error, except the exits of the yield dependencies so
+    that their cleanup always runs. `on_queue_wait` is called with the seconds each
+    call waited for a thread, e.g. to feed a metrics histogram.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        on_queue_wait: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.on_queue_wait = on_queue_wait
+        self.calls = 0
+        self.rejected = 0
+        self.busy = 0
+        self.waiting = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        # Limiters can only be used in the event loop they were created in
+        pool_id = next(_threadpool_ids)
+        self._limiter: RunVar[anyio.CapacityLimiter] = RunVar(
+            f"fastapi_threadpool_limiter_{pool_id}"
+        )
+        # The threads are limited by acquiring a token of the limiter above,
+        # running them must not wait on a second one
+        self._unlimited: RunVar[anyio.CapacityLimiter] = RunVar(
+            f"fastapi_threadpool_unlimited_{pool_id}"
+        )
+
+    @property
+    def limiter(self) -> anyio.CapacityLimiter:
+        if self.max_workers is None:
+            # One per event loop
+            return anyio.to_thread.current_default_thread_limiter()
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(self.max_workers)
+            self._limiter.set(limiter)
+            return limiter
+
+    async def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        return await self._run(partial(func, *args, **kwargs), reject=True)
+
+    async def run_teardown(
+        self, func: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """
+        Like `run()`, but never rejected when the queue is full, for calls that
+        release resources.
+        """
+        return await self._run(partial(func, *args, **kwargs), reject=False)
+
+    async def _run(self, func: Callable[[], _T], *, reject: bool) -> _T:
+        limiter = self.limiter
+        if (
+            reject
+            and self.max_queue is not None
+            and self.waiting >= self.max_queue
+            and limiter.available_tokens < 1
+        ):
+            self.rejected += 1
+            raise HTTPException(status_code=503)
+        borrower = object()
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            await limiter.acquire_on_behalf_of(borrower)
+        finally:
+            self.waiting -= 1
+        self.busy += 1
+        try:
+            queue_wait = time.perf_counter() - start
+            self.calls += 1
+            self.queue_wait_total += queue_wait
+            if queue_wait > self.queue_wait_max:
+                self.queue_wait_max = queue_wait
+            if self.on_queue_wait is not None:
+                self.on_queue_wait(queue_wait)
+            profile = current_profile.get()
+            if profile is not None:
+                profile.threadpool_wait += queue_wait
+            try:
+                unlimited = self._unlimited.get()
+            except LookupError:
+                unlimited = anyio.CapacityLimiter(math.inf)
+                self._unlimited.set(unlimited)
+            # In a copy of the caller's contextvars, like run_in_threadpool()
+            context = contextvars.copy_context()
+            return await anyio.to_thread.run_sync(context.run, func, limiter=unlimited)
+        finally:
+            self.busy -= 1
+            limiter.release_on_behalf_of(borrower)
+
+    def statistics(self) -> ThreadpoolStatistics:
+        return ThreadpoolStatistics(
+            max_workers=self.max_workers,
+            busy=self.busy,
+            waiting=self.waiting,
+            calls=self.calls,
+            rejected=self.rejected,
+            queue_wait_total=self.queue_wait_total,
+            queue_wait_max=self.queue_wait_max,
+        )
+
+
+# Used when there's no app to take the threadpool from
+default_threadpool = Threadpool()
+
 
 @asynccontextmanager
 async def contextmanager_in_threadpool(
     cm: ContextManager[_T],
+    threadpool: Optional[Threadpool] = None,
 ) -> AsyncGenerator[_T, None]:
+    threadpool = threadpool or default_threadpool
     try:
-        yield await run_in_threadpool(cm.__enter__)
+        yield await threadpool.run(cm.__enter__)
     except Exception as e:
-        ok = await run_in_threadpool(cm.__exit__, type(e), e, None)
+        ok = await threadpool.run_teardown(cm.__exit__, type(e), e, None)
         if not ok:
             raise e
     else:
-        await run_in_threadpool(cm.__exit__, None, None, None)
+        await threadpool.run_teardown(cm.__exit__, None, None, None)
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from fastapi.security.base import SecurityBase
 from pydantic.fields import ModelField
@@ -56,3 +56,113 @@ class Dependant:
         self.path = path
         # Save the cache key at creation to optimize performance
         self.cache_key = (self.call, tuple(sorted(set(self.security_scopes or []))))
+        # Compiled by get_solve_plan() when the dependant is fully built
+        self.solve_plan: Optional["SolvePlan"] = None
+
+
+class ParamExtractor:
+    def __init__(
+        self,
+        *,
+        field: ModelField,
+        loc: Tuple[str, str],
+        is_sequence: bool,
+        convert: Optional[Callable[[str], Any]] = None,
+        copy_default: bool = True,
+    ) -> None:
+        self.field = field
+        self.name = field.name
+        self.alias = field.alias
+        self.required = field.required
+        self.default = field.default
+        self.loc = loc
+        # Read with getlist() from query params and headers
+        self.is_sequence = is_sequence
+        # Converts str values exactly as field.validate() would, for simple types
+        self.convert = convert
+        # Immutable defaults are used as is instead of deep copied
+        self.copy_default = copy_default
+
+
+class SolveStep:
+    def __init__(
+        self,
+        *,
+        dependant: Dependant,
+        call: Optional[Callable[..., Any]],
+        name: Optional[str],
+        use_cache: bool,
+        cache_slot: int,
+        children: List[int],
+        level: int,
+        alias: Optional[int] = None,
+        is_gen_callable: bool = False,
+        is_async_gen_callable: bool = False,
+        is_coroutine_callable: bool = False,
+        path_extractors: Optional[List[ParamExtractor]] = None,
+        query_extractors: Optional[List[ParamExtractor]] = None,
+        header_extractors: Optional[List[ParamExtractor]] = None,
+        cookie_extractors: Optional[List[ParamExtractor]] = None,
+    ) -> None:
+        self.dependant = dependant
+        self.call = call
+        self.name = name
+        self.use_cache = use_cache
+        self.cache_slot = cache_slot
+        self.children = children
+        self.level = level
+        # Index of an earlier step that solves exactly the same cached value
+        self.alias = alias
+        self.is_gen_callable = is_gen_callable
+        self.is_async_gen_callable = is_async_gen_callable
+        self.is_coroutine_callable = is_coroutine_callable
+        self.path_extractors = path_extractors or []
+        self.query_extractors = query_extractors or []
+        self.header_extractors = header_extractors or []
+        self.cookie_extractors = cookie_extractors or []
+        # A plain function, these can be called together in one worker thread
+        self.is_sync_callable = call is not None and not (
+            is_gen_callable or is_async_gen_callable or is_coroutine_callable
+        )
+
+
+class SolvePlan:
+    def __init__(
+        self,
+        *,
+        steps: List[SolveStep],
+        cache_keys: List[Tuple[Optional[Callable[..., Any]], Tuple[str, ...]]],
+    ) -> None:
+        # Steps are in dependency order: every step comes after the steps it
+        # depends on, and the last step is the dependant that was compiled
+        self.steps = steps
+        self.cache_keys = cache_keys
+        self.cache_slots = {key: slot for slot, key in enumerate(cache_keys)}
+        stages: Dict[int, List[int]] = {}
+        for index, step in enumerate(steps[:-1]):
+            stages.setdefault(step.level, []).append(index)
+        # Groups of steps that don't depend on each other, used to solve
+        # independent async dependencies concurrently
+        self.stages = [stages[level] for level in sorted(stages)]
+
+
+class DependencyOverridesCache:
+    """
+    What is derived from the dependency overrides of an app, reused across requests.
+
+    The sub-dependants created for each override and the solve plans that use them
+    are discarded as soon as the overrides differ from the ones they were derived
+    from, whether the dict was modified or replaced.
+    """
+
+    def __init__(self) -> None:
+        self.dependants: Dict[Tuple[Dependant, Callable[..., Any]], Dependant] = {}
+        self.solve_plans: Dict[Dependant, SolvePlan] = {}
+        # The overrides the cached values were derived from
+        self.overrides: Dict[Callable[..., Any], Callable[..., Any]] = {}
+
+    def check(self, overrides: Mapping[Callable[..., Any], Callable[..., Any]]) -> None:
+        if self.overrides != overrides:
+            self.dependants.clear()
+            self.solve_plans.clear()
+            self.overrides = dict(overrides)
@@ -1,9 +1,17 @@
+import codecs
+import collections.abc
+import contextvars
 import dataclasses
 import inspect
+import json
+import re
+import time
 from contextlib import contextmanager
 from copy import deepcopy
+from functools import partial
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Coroutine,
     Dict,
@@ -21,18 +29,30 @@ import anyio
 from fastapi import params
 from fastapi.concurrency import (
     AsyncExitStack,
+    Threadpool,
     asynccontextmanager,
     contextmanager_in_threadpool,
+    default_threadpool,
 )
-from fastapi.dependencies.models import Dependant, SecurityRequirement
+from fastapi.dependencies.models import (
+    Dependant,
+    DependencyOverridesCache,
+    ParamExtractor,
+    SecurityRequirement,
+    SolvePlan,
+    SolveStep,
+)
+from fastapi.exceptions import HTTPException, RequestValidationError
+from fastapi.formparsers import iterate_upload_file
 from fastapi.logger import logger
+from fastapi.profiling import RequestProfile, call_profiled, current_profile
 from fastapi.security.base import SecurityBase
 from fastapi.security.oauth2 import OAuth2, SecurityScopes
 from fastapi.security.open_id_connect_url import OpenIdConnect
 from fastapi.utils import create_response_field, get_path_param_names
 from pydantic import BaseModel, create_model
 from pydantic.error_wrappers import ErrorWrapper
-from pydantic.errors import MissingError
+from pydantic.errors import ListError, MissingError
 from pydantic.fields import (
     SHAPE_LIST,
     SHAPE_SEQUENCE,
@@ -45,10 +65,10 @@ from pydantic.fields import (
     Required,
 )
 from pydantic.schema import get_annotation_from_field_info
-from pydantic.typing import ForwardRef, evaluate_forwardref
+from pydantic.typing import ForwardRef, evaluate_forwardref, get_args, get_origin
 from pydantic.utils import lenient_issubclass
+from pydantic.validators import BOOL_FALSE, BOOL_TRUE
 from starlette.background import BackgroundTasks
-from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, Headers, QueryParams, UploadFile
 from starlette.requests import HTTPConnection, Request
 from starlette.responses import Response
@@ -166,6 +186,9 @@ def get_sub_dependant(
 
 CacheKey = Tuple[Optional[Callable[..., Any]], Tuple[str, ...]]
 
+# Marks dependencies that haven't been solved (yet) in a request
+_unsolved: Any = object()
+
 
 def get_flat_dependant(
     dependant: Dependant,
@@ -374,6 +397,19 @@ def get_param_field(
     annotation: Any = Any
     if not param.annotation == param.empty:
         annotation = param.annotation
+    if getattr(field_info, "stream", False):
+        assert get_origin(annotation) in (
+            collections.abc.AsyncIterator,
+            collections.abc.AsyncIterable,
+        ), f"Param: {param_name} with stream=True must be an AsyncIterator[...]"
+        if isinstance(field_info, params.File):
+            assert get_args(annotation) == (
+                bytes,
+            ), f"Param: {param_name} with File(stream=True) must be an AsyncIterator[bytes]"
+            annotation = bytes
+        else:
+            # Documented and validated as the list it's read from
+            annotation = List[get_args(annotation)[0]]  # type: ignore
     annotation = get_annotation_from_field_info(annotation, field_info, param_name)
     if not field_info.alias and getattr(field_info, "convert_underscores", None):
         alias = param.name.replace("_", "-")
@@ -444,6 +480,143 @@ async def solve_generator(
     return await stack.enter_async_context(cm)
 
 
+def get_solve_plan(
+    dependant: Dependant,
+    *,
+    dependency_overrides: Optional[
+        Mapping[Callable[..., Any], Callable[..., Any]]
+    ] = None,
+    overrides_cache: Optional[DependencyOverridesCache] = None,
+) -> SolvePlan:
+    steps: List[SolveStep] = []
+    cache_slots: Dict[CacheKey, int] = {}
+    add_solve_steps(
+        dependant,
+        call=dependant.call,
+        name=dependant.name,
+        use_cache=dependant.use_cache,
+        cache_key=dependant.cache_key,
+        steps=steps,
+        cache_slots=cache_slots,
+        dependency_overrides=dependency_overrides,
+        overrides_cache=overrides_cache,
+    )
+    return SolvePlan(steps=steps, cache_keys=list(cache_slots))
+
+
+def add_solve_steps(
+    dependant: Dependant,
+    *,
+    call: Optional[Callable[..., Any]],
+    name: Optional[str],
+    use_cache: bool,
+    cache_key: CacheKey,
+    steps: List[SolveStep],
+    cache_slots: Dict[CacheKey, int],
+    dependency_overrides: Optional[Mapping[Callable[..., Any], Callable[..., Any]]],
+    overrides_cache: Optional[DependencyOverridesCache] = None,
+) -> int:
+    children: List[int] = []
+    for sub_dependant in dependant.dependencies:
+        sub_call = cast(Callable[..., Any], sub_dependant.call)
+        use_sub_dependant = sub_dependant
+        if dependency_overrides and sub_call in dependency_overrides:
+            sub_call = dependency_overrides[sub_call]
+            use_sub_dependant = get_override_dependant(
+                sub_dependant, call=sub_call, overrides_cache=overrides_cache
+            )
+        children.append(
+            add_solve_steps(
+                use_sub_dependant,
+                call=sub_call,
+                name=sub_dependant.name,
+                use_cache=sub_dependant.use_cache,
+                cache_key=sub_dependant.cache_key,
+                steps=steps,
+                cache_slots=cache_slots,
+                dependency_overrides=dependency_overrides,
+                overrides_cache=overrides_cache,
+            )
+        )
+    level = max((steps[child].level + 1 for child in children), default=0)
+    alias = None
+    if cache_key in cache_slots:
+        cache_slot = cache_slots[cache_key]
+        same_slot = [i for i, step in enumerate(steps) if step.cache_slot == cache_slot]
+        if use_cache and all(steps[child].alias is not None for child in children):
+            # Repeated with the same cached sub-dependencies, it can take the
+            # value (and errors) of the first one as soon as that is solved
+            alias = same_slot[0]
+            level = steps[alias].level
+        else:
+            level = max(level, steps[same_slot[-1]].level + 1)
+    else:
+        cache_slot = cache_slots[cache_key] = len(cache_slots)
+    steps.append(
+        SolveStep(
+            dependant=dependant,
+            call=call,
+            name=name,
+            use_cache=use_cache,
+            cache_slot=cache_slot,
+            children=children,
+            level=level,
+            alias=alias,
+            is_gen_callable=call is not None and is_gen_callable(call),
+            is_async_gen_callable=call is not None and is_async_gen_callable(call),
+            is_coroutine_callable=call is not None and is_coroutine_callable(call),
+            path_extractors=get_param_extractors(dependant.path_params),
+            query_extractors=get_param_extractors(dependant.query_params),
+            header_extractors=get_param_extractors(dependant.header_params),
+            cookie_extractors=get_param_extractors(dependant.cookie_params),
+        )
+    )
+    return len(steps) - 1
+
+
+def get_override_dependant(
+    dependant: Dependant,
+    *,
+    call: Callable[..., Any],
+    overrides_cache: Optional[DependencyOverridesCache] = None,
+) -> Dependant:
+    key = (dependant, call)
+    if overrides_cache is not None:
+        override_dependant = overrides_cache.dependants.get(key)
+        if override_dependant is not None:
+            return override_dependant
+    override_dependant = get_dependant(
+        path=cast(str, dependant.path),
+        call=call,
+        name=dependant.name,
+        security_scopes=dependant.security_scopes,
+    )
+    override_dependant.security_scopes = dependant.security_scopes
+    if overrides_cache is not None:
+        overrides_cache.dependants[key] = override_dependant
+    return override_dependant
+
+
+def get_overrides_solve_plan(
+    dependant: Dependant,
+    *,
+    dependency_overrides: Mapping[Callable[..., Any], Callable[..., Any]],
+    overrides_cache: Optional[DependencyOverridesCache] = None,
+) -> SolvePlan:
+    if overrides_cache is None:
+        return get_solve_plan(dependant, dependency_overrides=dependency_overrides)
+    overrides_cache.check(dependency_overrides)
+    plan = overrides_cache.solve_plans.get(dependant)
+    if plan is None:
+        plan = get_solve_plan(
+            dependant,
+            dependency_overrides=dependency_overrides,
+            overrides_cache=overrides_cache,
+        )
+        overrides_cache.solve_plans[dependant] = plan
+    return plan
+
+
 async def solve_dependencies(
     *,
     request: Union[Request, WebSocket],
@@ -460,103 +633,231 @@ async def solve_dependencies(
     Response,
     Dict[Tuple[Callable[..., Any], Tuple[str]], Any],
 ]:
-    values: Dict[str, Any] = {}
-    errors: List[ErrorWrapper] = []
-    response = response or Response(
+    sub_response = response or Response(
         content=None,
         status_code=None,  # type: ignore
         headers=None,  # type: ignore # in Starlette
         media_type=None,  # type: ignore # in Starlette
         background=None,  # type: ignore # in Starlette
     )
-    dependency_cache = dependency_cache or {}
-    sub_dependant: Dependant
-    for sub_dependant in dependant.dependencies:
-        sub_dependant.call = cast(Callable[..., Any], sub_dependant.call)
-        sub_dependant.cache_key = cast(
-            Tuple[Callable[..., Any], Tuple[str]], sub_dependant.cache_key
+    dependency_overrides = getattr(
+        dependency_overrides_provider, "dependency_overrides", None
+    )
+    if dependency_overrides:
+        plan = get_overrides_solve_plan(
+            dependant,
+            dependency_overrides=dependency_overrides,
+            overrides_cache=getattr(
+                dependency_overrides_provider, "dependency_overrides_cache", None
+            ),
         )
-        call = sub_dependant.call
-        use_sub_dependant = sub_dependant
-        if (
-            dependency_overrides_provider
-            and dependency_overrides_provider.dependency_overrides
-        ):
-            original_call = sub_dependant.call
-            call = getattr(
-                dependency_overrides_provider, "dependency_overrides", {}
-            ).get(original_call, original_call)
-            use_path: str = sub_dependant.path  # type: ignore
-            use_sub_dependant = get_dependant(
-                path=use_path,
-                call=call,
-                name=sub_dependant.name,
-                security_scopes=sub_dependant.security_scopes,
-            )
-            use_sub_dependant.security_scopes = sub_dependant.security_scopes
+    else:
+        if dependant.solve_plan is None:
+            dependant.solve_plan = get_solve_plan(dependant)
+        plan = dependant.solve_plan
+    steps = plan.steps
+    cached: List[Any] = [_unsolved] * len(plan.cache_keys)
+    if dependency_cache:
+        for key, value in dependency_cache.items():
+            if key in plan.cache_slots:
+                cached[plan.cache_slots[key]] = value
+    solved: List[Any] = [_unsolved] * len(steps)
+    step_values: List[Dict[str, Any]] = [{}] * len(steps)
+    step_errors: List[List[ErrorWrapper]] = [[]] * len(steps)
+    concurrent = getattr(
+        dependency_overrides_provider, "concurrent_dependencies", False
+    )
+    threadpool = (
+        getattr(dependency_overrides_provider, "threadpool", None) or default_threadpool
+    )
+    profile = current_profile.get()
 
-        solved_result = await solve_dependencies(
+    def is_solvable(index: int) -> bool:
+        # Only solve a step if it and all its sub-dependencies are valid
+        return not step_errors[index] and all(
+            solved[child] is not _unsolved for child in steps[index].children
+        )
+
+    async def solve_values(index: int) -> bool:
+        nonlocal background_tasks
+        values, errors, background_tasks = await solve_step_values(
             request=request,
-            dependant=use_sub_dependant,
+            step=steps[index],
+            steps=steps,
+            solved=solved,
             body=body,
             background_tasks=background_tasks,
-            response=response,
-            dependency_overrides_provider=dependency_overrides_provider,
-            dependency_cache=dependency_cache,
+            response=sub_response,
         )
-        (
-            sub_values,
-            sub_errors,
-            background_tasks,
-            _,  # the subdependency returns the same response we have
-            sub_dependency_cache,
-        ) = solved_result
-        dependency_cache.update(sub_dependency_cache)
-        if sub_errors:
-            errors.extend(sub_errors)
-            continue
-        if sub_dependant.use_cache and sub_dependant.cache_key in dependency_cache:
-            solved = dependency_cache[sub_dependant.cache_key]
-        elif is_gen_callable(call) or is_async_gen_callable(call):
-            stack = request.scope.get("fastapi_astack")
-            assert isinstance(stack, AsyncExitStack)
-            solved = await solve_generator(
-                call=call, stack=stack, sub_values=sub_values
-            )
-        elif is_coroutine_callable(call):
-            solved = await call(**sub_values)
+        step_values[index] = values
+        step_errors[index] = errors
+        return is_solvable(index)
+
+    def is_cached(index: int) -> bool:
+        step = steps[index]
+        return step.use_cache and cached[step.cache_slot] is not _unsolved
+
+    def set_solved(index: int, result: Any) -> None:
+        solved[index] = result
+        slot = steps[index].cache_slot
+        if cached[slot] is _unsolved:
+            cached[slot] = result
+
+    async def solve_call(index: int) -> None:
+        if is_cached(index):
+            result = cached[steps[index].cache_slot]
         else:
-            solved = await run_in_threadpool(call, **sub_values)
-        if sub_dependant.name is not None:
-            values[sub_dependant.name] = solved
-        if sub_dependant.cache_key not in dependency_cache:
-            dependency_cache[sub_dependant.cache_key] = solved
-    path_values, path_errors = request_params_to_args(
-        dependant.path_params, request.path_params
-    )
-    query_values, query_errors = request_params_to_args(
-        dependant.query_params, request.query_params
-    )
-    header_values, header_errors = request_params_to_args(
-        dependant.header_params, request.headers
-    )
-    cookie_values, cookie_errors = request_params_to_args(
-        dependant.cookie_params, request.cookies
-    )
-    values.update(path_values)
-    values.update(query_values)
-    values.update(header_values)
-    values.update(cookie_values)
-    errors += path_errors + query_errors + header_errors + cookie_errors
-    if dependant.body_params:
-        (
-            body_values,
-            body_errors,
-        ) = await request_body_to_args(  # body_params checked above
-            required_params=dependant.body_params, received_body=body
+            result = await call_step(
+                request=request,
+                step=steps[index],
+                values=step_values[index],
+                threadpool=threadpool,
+                profile=profile,
+            )
+        set_solved(index, result)
+
+    def solve_sync_calls(indexes: List[int], *, solve_params: bool) -> None:
+        # Runs in a worker thread, calling several sync dependencies with a single
+        # thread hop. With solve_params, the values of all but the first step are
+        # solved here too, after the steps they depend on. Each call gets its own
+        # copy of the contextvars, as if it had its own thread hop.
+        nonlocal background_tasks
+        for position, index in enumerate(indexes):
+            if solve_params and position:
+                values, errors, background_tasks = get_step_params_values(
+                    request=request,
+                    step=steps[index],
+                    steps=steps,
+                    solved=solved,
+                    background_tasks=background_tasks,
+                    response=sub_response,
+                )
+                step_values[index] = values
+                step_errors[index] = errors
+                if not is_solvable(index):
+                    continue
+            call = cast(Callable[..., Any], steps[index].call)
+            if is_cached(index):
+                result = cached[steps[index].cache_slot]
+            elif profile is not None:
+                context = contextvars.copy_context()
+                result = context.run(call_profiled, profile, call, step_values[index])
+            else:
+                context = contextvars.copy_context()
+                result = context.run(call, **step_values[index])
+            set_solved(index, result)
+
+    if concurrent:
+        for stage in plan.stages:
+            coroutine_steps = []
+            sync_steps = []
+            alias_steps = []
+            for index in stage:
+                if steps[index].alias is not None:
+                    alias_steps.append(index)
+                    continue
+                if not await solve_values(index):
+                    continue
+                if steps[index].is_coroutine_callable:
+                    coroutine_steps.append(index)
+                elif steps[index].is_sync_callable and not is_cached(index):
+                    sync_steps.append(index)
+                else:
+                    await solve_call(index)
+            if len(coroutine_steps) > 1 or (coroutine_steps and sync_steps):
+                async with anyio.create_task_group() as tg:
+                    for index in coroutine_steps:
+                        tg.start_soon(solve_call, index)
+                    if sync_steps:
+                        tg.start_soon(
+                            partial(
+                                threadpool.run,
+                                solve_sync_calls,
+                                sync_steps,
+                                solve_params=False,
+                            )
+                        )
+            elif coroutine_steps:
+                await solve_call(coroutine_steps[0])
+            elif sync_steps:
+                await threadpool.run(solve_sync_calls, sync_steps, solve_params=False)
+            for index in alias_steps:
+                alias = cast(int, steps[index].alias)
+                solved[index] = solved[alias]
+                step_errors[index] = step_errors[alias]
+    else:
+        index = 0
+        last = len(steps) - 1
+        while index < last:
+            if not await solve_values(index):
+                index += 1
+                continue
+            if not steps[index].is_sync_callable or is_cached(index):
+                await solve_call(index)
+                index += 1
+                continue
+            # Call the following sync dependencies in the same thread, as long as
+            # their values don't need the event loop to read the body
+            batch = [index]
+            index += 1
+            while (
+                index < last
+                and steps[index].is_sync_callable
+                and not steps[index].dependant.body_params
+            ):
+                batch.append(index)
+                index += 1
+            await threadpool.run(solve_sync_calls, batch, solve_params=True)
+    await solve_values(len(steps) - 1)
+    errors = [error for errors_ in step_errors for error in errors_]
+    dependency_cache = dependency_cache or {}
+    for slot, value in enumerate(cached):
+        if value is not _unsolved:
+            dependency_cache.setdefault(plan.cache_keys[slot], value)  # type: ignore
+    return step_values[-1], errors, background_tasks, sub_response, dependency_cache
+
+
+def get_step_params_values(
+    *,
+    request: Union[Request, WebSocket],
+    step: SolveStep,
+    steps: List[SolveStep],
+    solved: List[Any],
+    background_tasks: Optional[BackgroundTasks],
+    response: Response,
+) -> Tuple[Dict[str, Any], List[ErrorWrapper], Optional[BackgroundTasks]]:
+    # Everything but the body, this doesn't need the event loop
+    dependant = step.dependant
+    values: Dict[str, Any] = {}
+    errors: List[ErrorWrapper] = []
+    for child in step.children:
+        child_name = steps[child].name
+        if child_name is not None and solved[child] is not _unsolved:
+            values[child_name] = solved[child]
+    if step.path_extractors:
+        path_values, path_errors = extract_params(
+            step.path_extractors, request.path_params
         )
-        values.update(body_values)
-        errors.extend(body_errors)
+        values.update(path_values)
+        errors.extend(path_errors)
+    if step.query_extractors:
+        query_values, query_errors = extract_params(
+            step.query_extractors, request.query_params
+        )
+        values.update(query_values)
+        errors.extend(query_errors)
+    if step.header_extractors:
+        header_values, header_errors = extract_params(
+            step.header_extractors, request.headers
+        )
+        values.update(header_values)
+        errors.extend(header_errors)
+    if step.cookie_extractors:
+        cookie_values, cookie_errors = extract_params(
+            step.cookie_extractors, request.cookies
+        )
+        values.update(cookie_values)
+        errors.extend(cookie_errors)
     if dependant.http_connection_param_name:
         values[dependant.http_connection_param_name] = request
     if dependant.request_param_name and isinstance(request, Request):
@@ -573,48 +874,176 @@ async def solve_dependencies(
         values[dependant.security_scopes_param_name] = SecurityScopes(
             scopes=dependant.security_scopes
         )
-    return values, errors, background_tasks, response, dependency_cache
+    return values, errors, background_tasks
 
 
-def request_params_to_args(
-    required_params: Sequence[ModelField],
+async def solve_step_values(
+    *,
+    request: Union[Request, WebSocket],
+    step: SolveStep,
+    steps: List[SolveStep],
+    solved: List[Any],
+    body: Optional[Union[Dict[str, Any], FormData]],
+    background_tasks: Optional[BackgroundTasks],
+    response: Response,
+) -> Tuple[Dict[str, Any], List[ErrorWrapper], Optional[BackgroundTasks]]:
+    values, errors, background_tasks = get_step_params_values(
+        request=request,
+        step=step,
+        steps=steps,
+        solved=solved,
+        background_tasks=background_tasks,
+        response=response,
+    )
+    if step.dependant.body_params:
+        (
+            body_values,
+            body_errors,
+        ) = await request_body_to_args(  # body_params checked above
+            required_params=step.dependant.body_params, received_body=body
+        )
+        values.update(body_values)
+        errors.extend(body_errors)
+    return values, errors, background_tasks
+
+
+async def call_step(
+    *,
+    request: Union[Request, WebSocket],
+    step: SolveStep,
+    values: Dict[str, Any],
+    threadpool: Optional[Threadpool] = None,
+    profile: Optional[RequestProfile] = None,
+) -> Any:
+    call = cast(Callable[..., Any], step.call)
+    if profile is not None:
+        # Sync calls are timed in the worker thread, without the wait for it
+        if step.is_sync_callable:
+            return await (threadpool or default_threadpool).run(
+                call_profiled, profile, call, values
+            )
+        start = time.perf_counter()
+        try:
+            return await call_step(
+                request=request, step=step, values=values, threadpool=threadpool
+            )
+        finally:
+            profile.calls.append((call, time.perf_counter() - start))
+    if step.is_gen_callable or step.is_async_gen_callable:
+        stack = request.scope.get("fastapi_astack")
+        assert isinstance(stack, AsyncExitStack)
+        if step.is_gen_callable:
+            cm = contextmanager_in_threadpool(
+                contextmanager(call)(**values), threadpool=threadpool
+            )
+        else:
+            cm = asynccontextmanager(call)(**values)
+        return await stack.enter_async_context(cm)
+    elif step.is_coroutine_callable:
+        return await call(**values)
+    else:
+        return await (threadpool or default_threadpool).run(call, **values)
+
+
+def _str_to_int(value: str) -> int:
+    # Longer ones are rejected by pydantic (max_str_int), leave them to it
+    if len(value) > 4300:
+        raise ValueError(value)
+    return int(value)
+
+
+def _str_to_bool(value: str) -> bool:
+    value = value.lower()
+    if value in BOOL_TRUE:
+        return True
+    if value in BOOL_FALSE:
+        return False
+    raise ValueError(value)
+
+
+# What pydantic's own validators do with str values for these types
+param_converters: Dict[Any, Callable[[str], Any]] = {
+    str: str,
+    int: _str_to_int,
+    float: float,
+    bool: _str_to_bool,
+}
+immutable_default_types = {type(None), str, int, float, bool}
+
+
+def get_param_extractor(field: ModelField) -> ParamExtractor:
+    field_info = field.field_info
+    assert isinstance(field_info, params.Param), "Params must be subclasses of Param"
+    convert = None
+    if (
+        field.shape == SHAPE_SINGLETON
+        and not field.sub_fields
+        and not field.class_validators
+        and not field.pre_validators
+        and not field.post_validators
+    ):
+        # Constrained params have a constrained type, e.g. ConstrainedIntValue
+        convert = param_converters.get(field.type_)
+    return ParamExtractor(
+        field=field,
+        loc=(field_info.in_.value, field.alias),
+        is_sequence=is_scalar_sequence_field(field),
+        convert=convert,
+        copy_default=type(field.default) not in immutable_default_types,
+    )
+
+
+def get_param_extractors(fields: Sequence[ModelField]) -> List[ParamExtractor]:
+    return [get_param_extractor(field) for field in fields]
+
+
+def extract_params(
+    extractors: Sequence[ParamExtractor],
     received_params: Union[Mapping[str, Any], QueryParams, Headers],
 ) -> Tuple[Dict[str, Any], List[ErrorWrapper]]:
-    values = {}
-    errors = []
-    for field in required_params:
-        if is_scalar_sequence_field(field) and isinstance(
-            received_params, (QueryParams, Headers)
-        ):
-            value = received_params.getlist(field.alias) or field.default
+    values: Dict[str, Any] = {}
+    errors: List[ErrorWrapper] = []
+    is_multi_dict = isinstance(received_params, (QueryParams, Headers))
+    for extractor in extractors:
+        if extractor.is_sequence and is_multi_dict:
+            value = (
+                received_params.getlist(extractor.alias)  # type: ignore
+                or extractor.default
+            )
         else:
-            value = received_params.get(field.alias)
-        field_info = field.field_info
-        assert isinstance(
-            field_info, params.Param
-        ), "Params must be subclasses of Param"
+            value = received_params.get(extractor.alias)
         if value is None:
-            if field.required:
-                errors.append(
-                    ErrorWrapper(
-                        MissingError(), loc=(field_info.in_.value, field.alias)
-                    )
-                )
+            if extractor.required:
+                errors.append(ErrorWrapper(MissingError(), loc=extractor.loc))
+            elif extractor.copy_default:
+                values[extractor.name] = deepcopy(extractor.default)
             else:
-                values[field.name] = deepcopy(field.default)
+                values[extractor.name] = extractor.default
             continue
-        v_, errors_ = field.validate(
-            value, values, loc=(field_info.in_.value, field.alias)
-        )
+        if extractor.convert is not None and type(value) is str:
+            try:
+                values[extractor.name] = extractor.convert(value)
+                continue
+            except ValueError:
+                # Invalid, let pydantic build the error
+                pass
+        v_, errors_ = extractor.field.validate(value, values, loc=extractor.loc)
         if isinstance(errors_, ErrorWrapper):
             errors.append(errors_)
         elif isinstance(errors_, list):
             errors.extend(errors_)
         else:
-            values[field.name] = v_
+            values[extractor.name] = v_
     return values, errors
 
 
+def request_params_to_args(
+    required_params: Sequence[ModelField],
+    received_params: Union[Mapping[str, Any], QueryParams, Headers],
+) -> Tuple[Dict[str, Any], List[ErrorWrapper]]:
+    return extract_params(get_param_extractors(required_params), received_params)
+
+
 async def request_body_to_args(
     required_params: List[ModelField],
     received_body: Optional[Union[Dict[str, Any], FormData]],
@@ -662,6 +1091,19 @@ async def request_body_to_args(
                 else:
                     values[field.name] = deepcopy(field.default)
                 continue
+            if getattr(field_info, "stream", False):
+                if not isinstance(field_info, params.File):
+                    values[field.name] = validate_body_stream(field, value)
+                elif isinstance(value, UploadFile):
+                    values[field.name] = iterate_upload_file(value)
+                else:
+                    errors.append(
+                        ErrorWrapper(
+                            ValueError(f"Expected UploadFile, received: {type(value)}"),
+                            loc=loc,
+                        )
+                    )
+                continue
             if (
                 isinstance(field_info, params.File)
                 and lenient_issubclass(field.type_, bytes)
@@ -698,11 +1140,154 @@ async def request_body_to_args(
     return values, errors
 
 
+json_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayStream:
+    """
+    The items of a JSON array in a request body, decoded one by one as the body
+    is received.
+    """
+
+    # An error this close to the end of what was received can be caused by a
+    # value cut between chunks, e.g. a number or a \u escape
+    lookahead = 64
+
+    def __init__(self, stream: AsyncIterator[bytes]) -> None:
+        self.stream = stream
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # Characters already dropped from the start of the buffer
+        self.offset = 0
+        self.done = False
+
+    async def read(self) -> bool:
+        if self.done:
+            return False
+        try:
+            try:
+                chunk = await self.stream.__anext__()
+            except StopAsyncIteration:
+                self.done = True
+                self.buffer += self.text_decoder.decode(b"", final=True)
+                return False
+            text = self.text_decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise HTTPException(
+                status_code=400, detail="There was an error parsing the body"
+            ) from e
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    async def read_more(self) -> None:
+        # Read at least as much again as what's pending, so that a value spanning
+        # many chunks is only decoded a few times
+        pending = len(self.buffer) - self.pos
+        while await self.read() and len(self.buffer) - self.pos < 2 * pending:
+            pass
+
+    async def peek(self) -> str:
+        # The next character that is not whitespace, without consuming it
+        while True:
+            self.pos = json_whitespace.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not await self.read():
+                return ""
+
+    def may_be_incomplete(self, pos: int) -> bool:
+        return not self.done and len(self.buffer) - pos < self.lookahead
+
+    def error(self, msg: str, pos: int) -> RequestValidationError:
+        error = json.JSONDecodeError(msg, self.buffer, pos)
+        return RequestValidationError(
+            [ErrorWrapper(error, ("body", self.offset + pos))]
+        )
+
+    async def start(self) -> bool:
+        """
+        Read up to the opening bracket of the array, `False` if the body is empty.
+        """
+        char = await self.peek()
+        if not char:
+            return False
+        if char != "[":
+            raise RequestValidationError([ErrorWrapper(ListError(), ("body",))])
+        self.pos += 1
+        return True
+
+    async def decode_item(self) -> Any:
+        while True:
+            await self.peek()
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.may_be_incomplete(e.pos) or (
+                    e.msg.startswith("Unterminated string") and not self.done
+                ):
+                    await self.read_more()
+                    continue
+                raise self.error(e.msg, e.pos)
+            # A value is only complete when followed by a delimiter, "12" could
+            # still be the start of "1234"
+            next_pos = json_whitespace.match(self.buffer, end).end()  # type: ignore
+            if next_pos < len(self.buffer) and self.buffer[next_pos] in ",]":
+                self.pos = next_pos
+                return value
+            if self.may_be_incomplete(next_pos):
+                await self.read_more()
+                continue
+            raise self.error("Expecting ',' delimiter", next_pos)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        if await self.peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield await self.decode_item()
+                char = self.buffer[self.pos]
+                self.pos += 1
+                if char == "]":
+                    break
+        if await self.peek():
+            raise self.error("Extra data", self.pos)
+
+
+async def validate_body_stream(
+    field: ModelField, items: JSONArrayStream
+) -> AsyncIterator[Any]:
+    assert field.sub_fields
+    item_field = field.sub_fields[0]
+    index = 0
+    async for item in items:
+        value, errors = item_field.validate(item, {}, loc=("body", index))
+        if isinstance(errors, ErrorWrapper):
+            raise RequestValidationError([errors])
+        elif errors:
+            raise RequestValidationError(errors)
+        yield value
+        index += 1
+
+
 def get_missing_field_error(loc: Tuple[str, ...]) -> ErrorWrapper:
     missing_field_error = ErrorWrapper(MissingError(), loc=loc)
     return missing_field_error
 
 
+def get_form_field_max_sizes(body_field: ModelField) -> Dict[str, int]:
+    # Form params are always embedded in a model for the whole body
+    fields = getattr(body_field.type_, "__fields__", {})
+    return {
+        field.alias: field.field_info.max_size
+        for field in fields.values()
+        if getattr(field.field_info, "max_size", None) is not None
+    }
+
+
 def get_body_field(*, dependant: Dependant, name: str) -> Optional[ModelField]:
     flat_dependant = get_flat_dependant(dependant)
     if not flat_dependant.body_params:
@@ -711,6 +1296,13 @@ def get_body_field(*, dependant: Dependant, name: str) -> Optional[ModelField]:
     field_info = first_param.field_info
     embed = getattr(field_info, "embed", None)
     body_param_names_set = {param.name for param in flat_dependant.body_params}
+    assert not any(
+        getattr(param.field_info, "stream", False)
+        and not isinstance(param.field_info, params.File)
+        for param in flat_dependant.body_params
+    ) or (
+        len(body_param_names_set) == 1 and not embed
+    ), "A Body(stream=True) param must be the only body param and not embedded"
     if len(body_param_names_set) == 1 and not embed:
         check_file_field(first_param)
         return first_param
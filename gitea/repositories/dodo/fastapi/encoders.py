@@ -26,6 +26,248 @@ def generate_encoders_by_class_tuples(
 encoders_by_class_tuples = generate_encoders_by_class_tuples(ENCODERS_BY_TYPE)
 
 
+# Kinds of values, resolved once per type and cached in _kinds_by_type
+_PRIMITIVE = 0
+_DICT = 1
+_SEQUENCE = 2
+_MODEL = 3
+_DATACLASS = 4
+_ENUM = 5
+_PATH = 6
+_ENCODER = 7
+_OTHER = 8
+
+_primitive_types = {str, int, float, bool, type(None)}
+_sequence_types = (list, set, frozenset, GeneratorType, tuple)
+_kinds_by_type: Dict[type, Tuple[int, Optional[Callable[[Any], Any]]]] = {}
+
+# include, exclude, by_alias, exclude_unset, exclude_defaults, exclude_none,
+# custom_encoder, sqlalchemy_safe
+_Context = Tuple[
+    Optional[Union[SetIntStr, DictIntStrAny]],
+    Optional[Union[SetIntStr, DictIntStrAny]],
+    bool,
+    bool,
+    bool,
+    bool,
+    Dict[Any, Callable[[Any], Any]],
+    bool,
+]
+
+
+def _get_kind(obj: Any) -> Tuple[int, Optional[Callable[[Any], Any]]]:
+    type_ = type(obj)
+    kind = _kinds_by_type.get(type_)
+    if kind is not None:
+        return kind
+    # The order matters, e.g. str Enums and models with __root__ must not be
+    # handled as plain values
+    encoder: Optional[Callable[[Any], Any]] = None
+    if isinstance(obj, BaseModel):
+        kind_ = _MODEL
+    elif dataclasses.is_dataclass(obj):
+        kind_ = _DATACLASS
+    elif isinstance(obj, Enum):
+        kind_ = _ENUM
+    elif isinstance(obj, PurePath):
+        kind_ = _PATH
+    elif isinstance(obj, (str, int, float, type(None))):
+        kind_ = _PRIMITIVE
+    elif isinstance(obj, dict):
+        kind_ = _DICT
+    elif isinstance(obj, _sequence_types):
+        kind_ = _SEQUENCE
+    elif type_ in ENCODERS_BY_TYPE:
+        kind_ = _ENCODER
+        encoder = ENCODERS_BY_TYPE[type_]
+    else:
+        kind_ = _OTHER
+        for class_encoder, classes_tuple in encoders_by_class_tuples.items():
+            if isinstance(obj, classes_tuple):
+                kind_ = _ENCODER
+                encoder = class_encoder
+                break
+    kind = (kind_, encoder)
+    # isinstance() also looks at __class__, only cache when it's the real type,
+    # classes themselves can be dataclasses
+    if obj.__class__ is type_ and not isinstance(obj, type):
+        _kinds_by_type[type_] = kind
+    return kind
+
+
+def _as_set(
+    value: Optional[Union[SetIntStr, DictIntStrAny]]
+) -> Optional[Union[SetIntStr, DictIntStrAny]]:
+    if value is not None and not isinstance(value, (set, dict)):
+        return set(value)
+    return value
+
+
+def _get_custom_encoder(
+    obj: Any, custom_encoder: Dict[Any, Callable[[Any], Any]]
+) -> Optional[Callable[[Any], Any]]:
+    if type(obj) in custom_encoder:
+        return custom_encoder[type(obj)]
+    for encoder_type, encoder_instance in custom_encoder.items():
+        if isinstance(obj, encoder_type):
+            return encoder_instance
+    return None
+
+
+def _encode(obj: Any, context: _Context) -> Any:
+    # Walk the structure with an explicit stack instead of recursion. Each task
+    # encodes one value and stores it in target[slot], containers are created
+    # empty and filled by the tasks of their items.
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, _Context, Any, Any]] = [(obj, context, root, 0)]
+    pop = stack.pop
+    while stack:
+        obj, context, target, slot = pop()
+        custom_encoder = context[6]
+        if custom_encoder:
+            encoder = _get_custom_encoder(obj, custom_encoder)
+            if encoder is not None:
+                target[slot] = encoder(obj)
+                continue
+        kind, encoder = _get_kind(obj)
+        if kind == _PRIMITIVE:
+            target[slot] = obj
+        elif kind == _DICT:
+            (
+                include,
+                exclude,
+                by_alias,
+                exclude_unset,
+                _,
+                exclude_none,
+                _,
+                sqlalchemy_safe,
+            ) = context
+            include = _as_set(include)
+            exclude = _as_set(exclude)
+            item_context: _Context = (
+                None,
+                None,
+                by_alias,
+                exclude_unset,
+                False,
+                exclude_none,
+                custom_encoder,
+                sqlalchemy_safe,
+            )
+            encoded_dict: Dict[Any, Any] = {}
+            target[slot] = encoded_dict
+            tasks: List[Tuple[Any, _Context, Any, Any]] = []
+            for key, value in obj.items():
+                if (
+                    (
+                        not sqlalchemy_safe
+                        or (not isinstance(key, str))
+                        or (not key.startswith("_sa"))
+                    )
+                    and (value is not None or not exclude_none)
+                    and (
+                        (include and key in include)
+                        or not exclude
+                        or key not in exclude
+                    )
+                ):
+                    if type(key) is str and not custom_encoder:
+                        encoded_key = key
+                    else:
+                        encoded_key = _encode(key, item_context)
+                    if (
+                        type(value) in _primitive_types
+                        and not custom_encoder
+                        and encoded_key not in encoded_dict
+                    ):
+                        encoded_dict[encoded_key] = value
+                    else:
+                        # Keep the key order, a later duplicate key still wins as
+                        # its task runs last
+                        encoded_dict[encoded_key] = None
+                        tasks.append((value, item_context, encoded_dict, encoded_key))
+            stack.extend(reversed(tasks))
+        elif kind == _SEQUENCE:
+            include, exclude = context[0], context[1]
+            if not isinstance(include, (set, dict, type(None))) or not isinstance(
+                exclude, (set, dict, type(None))
+            ):
+                context = (
+                    _as_set(include),
+                    _as_set(exclude),
+                ) + context[2:]
+            encoded_list: List[Any] = []
+            target[slot] = encoded_list
+            tasks = []
+            for index, item in enumerate(obj):
+                if type(item) in _primitive_types and not custom_encoder:
+                    encoded_list.append(item)
+                else:
+                    encoded_list.append(None)
+                    tasks.append((item, context, encoded_list, index))
+            stack.extend(reversed(tasks))
+        elif kind == _MODEL:
+            (
+                include,
+                exclude,
+                by_alias,
+                exclude_unset,
+                exclude_defaults,
+                exclude_none,
+                _,
+                sqlalchemy_safe,
+            ) = context
+            include = _as_set(include)
+            exclude = _as_set(exclude)
+            model_encoder = getattr(obj.__config__, "json_encoders", {})
+            if custom_encoder:
+                model_encoder = {**model_encoder, **custom_encoder}
+            obj_dict = obj.dict(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_none=exclude_none,
+                exclude_defaults=exclude_defaults,
+            )
+            if "__root__" in obj_dict:
+                obj_dict = obj_dict["__root__"]
+            model_context: _Context = (
+                None,
+                None,
+                True,
+                False,
+                exclude_defaults,
+                exclude_none,
+                model_encoder,
+                sqlalchemy_safe,
+            )
+            stack.append((obj_dict, model_context, target, slot))
+        elif kind == _DATACLASS:
+            target[slot] = dataclasses.asdict(obj)
+        elif kind == _ENUM:
+            target[slot] = obj.value
+        elif kind == _PATH:
+            target[slot] = str(obj)
+        elif kind == _ENCODER:
+            assert encoder is not None
+            target[slot] = encoder(obj)
+        else:
+            errors: List[Exception] = []
+            try:
+                data = dict(obj)
+            except Exception as e:
+                errors.append(e)
+                try:
+                    data = vars(obj)
+                except Exception as e:
+                    errors.append(e)
+                    raise ValueError(errors)
+            stack.append((data, (None, None) + context[2:], target, slot))
+    return root[0]
+
+
 def jsonable_encoder(
     obj: Any,
     include: Optional[Union[SetIntStr, DictIntStrAny]] = None,
@@ -37,117 +279,18 @@ def jsonable_encoder(
     custom_encoder: Optional[Dict[Any, Callable[[Any], Any]]] = None,
     sqlalchemy_safe: bool = True,
 ) -> Any:
-    custom_encoder = custom_encoder or {}
-    if custom_encoder:
-        if type(obj) in custom_encoder:
-            return custom_encoder[type(obj)](obj)
-        else:
-            for encoder_type, encoder_instance in custom_encoder.items():
-                if isinstance(obj, encoder_type):
-                    return encoder_instance(obj)
-    if include is not None and not isinstance(include, (set, dict)):
-        include = set(include)
-    if exclude is not None and not isinstance(exclude, (set, dict)):
-        exclude = set(exclude)
-    if isinstance(obj, BaseModel):
-        encoder = getattr(obj.__config__, "json_encoders", {})
-        if custom_encoder:
-            encoder.update(custom_encoder)
-        obj_dict = obj.dict(
-            include=include,  # type: ignore # in Pydantic
-            exclude=exclude,  # type: ignore # in Pydantic
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-        )
-        if "__root__" in obj_dict:
-            obj_dict = obj_dict["__root__"]
-        return jsonable_encoder(
-            obj_dict,
-            exclude_none=exclude_none,
-            exclude_defaults=exclude_defaults,
-            custom_encoder=encoder,
-            sqlalchemy_safe=sqlalchemy_safe,
-        )
-    if dataclasses.is_dataclass(obj):
-        return dataclasses.asdict(obj)
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
+    if type(obj) in _primitive_types and not custom_encoder:
         return obj
-    if isinstance(obj, dict):
-        encoded_dict = {}
-        for key, value in obj.items():
-            if (
-                (
-                    not sqlalchemy_safe
-                    or (not isinstance(key, str))
-                    or (not key.startswith("_sa"))
-                )
-                and (value is not None or not exclude_none)
-                and ((include and key in include) or not exclude or key not in exclude)
-            ):
-                encoded_key = jsonable_encoder(
-                    key,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_value = jsonable_encoder(
-                    value,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-                encoded_dict[encoded_key] = encoded_value
-        return encoded_dict
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        encoded_list = []
-        for item in obj:
-            encoded_list.append(
-                jsonable_encoder(
-                    item,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    custom_encoder=custom_encoder,
-                    sqlalchemy_safe=sqlalchemy_safe,
-                )
-            )
-        return encoded_list
-
-    if type(obj) in ENCODERS_BY_TYPE:
-        return ENCODERS_BY_TYPE[type(obj)](obj)
-    for encoder, classes_tuple in encoders_by_class_tuples.items():
-        if isinstance(obj, classes_tuple):
-            return encoder(obj)
-
-    errors: List[Exception] = []
-    try:
-        data = dict(obj)
-    except Exception as e:
-        errors.append(e)
-        try:
-            data = vars(obj)
-        except Exception as e:
-            errors.append(e)
-            raise ValueError(errors)
-    return jsonable_encoder(
-        data,
-        by_alias=by_alias,
-        exclude_unset=exclude_unset,
-        exclude_defaults=exclude_defaults,
-        exclude_none=exclude_none,
-        custom_encoder=custom_encoder,
-        sqlalchemy_safe=sqlalchemy_safe,
+    return _encode(
+        obj,
+        (
+            include,
+            exclude,
+            by_alias,
+            exclude_unset,
+            exclude_defaults,
+            exclude_none,
+            custom_encoder or {},
+            sqlalchemy_safe,
+        ),
     )
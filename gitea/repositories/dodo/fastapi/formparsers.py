@@ -0,0 +1,296 @@
+import tempfile
+import weakref
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.datastructures import UploadFile
+from fastapi.exceptions import HTTPException
+from starlette.datastructures import FormData, Headers
+from starlette.datastructures import UploadFile as StarletteUploadFile
+from starlette.formparsers import FormParser, MultiPartMessage
+from starlette.formparsers import MultiPartParser as StarletteMultiPartParser
+from starlette.requests import Request
+
+try:
+    import multipart  # type: ignore
+    from multipart.multipart import parse_options_header  # type: ignore
+except ImportError:  # pragma: nocover
+    multipart = None
+    parse_options_header = None
+
+upload_chunk_size = 64 * 1024
+
+
+class UploadSpool:
+    """
+    Where uploaded files are kept while a request is handled.
+
+    Each file is kept in memory up to `spool_max_size` bytes and then rolled over
+    to a temporary file on disk. With `memory_limit`, the bytes kept in memory by
+    all the uploads in progress are accounted for, and once the limit is reached
+    new data is written to disk right away, so many concurrent uploads can't run
+    out of memory.
+    """
+
+    def __init__(
+        self, *, spool_max_size: int = 1024 * 1024, memory_limit: Optional[int] = None
+    ) -> None:
+        self.spool_max_size = spool_max_size
+        self.memory_limit = memory_limit
+        self.memory_used = 0
+
+    def reserve(self, size: int) -> bool:
+        if (
+            self.memory_limit is not None
+            and self.memory_used + size > self.memory_limit
+        ):
+            return False
+        self.memory_used += size
+        return True
+
+    def release(self, size: int) -> None:
+        self.memory_used -= size
+
+    def create_file(self, filename: str, content_type: str = "") -> "SpooledUploadFile":
+        return SpooledUploadFile(filename, content_type, spool=self)
+
+
+default_upload_spool = UploadSpool()
+
+
+class _Reservation:
+    def __init__(self, spool: UploadSpool) -> None:
+        self.spool = spool
+        self.size = 0
+
+    def release(self) -> None:
+        self.spool.release(self.size)
+        self.size = 0
+
+
+class SpooledUploadFile(UploadFile):
+    def __init__(
+        self, filename: str, content_type: str = "", *, spool: UploadSpool
+    ) -> None:
+        super().__init__(
+            filename,
+            tempfile.SpooledTemporaryFile(max_size=spool.spool_max_size),
+            content_type,
+        )
+        self.size = 0
+        self._reservation = _Reservation(spool)
+        # Also released if the file is never closed
+        weakref.finalize(self, self._reservation.release)
+
+    async def write(self, data: Union[bytes, str]) -> None:
+        self.size += len(data)
+        if self._in_memory:
+            reservation = self._reservation
+            if reservation.spool.reserve(len(data)):
+                reservation.size += len(data)
+                self.file.write(data)
+                if not self._in_memory:
+                    # Rolled over past spool_max_size
+                    reservation.release()
+                return
+            await run_in_threadpool(self.file.rollover)  # type: ignore
+            reservation.release()
+        await run_in_threadpool(self.file.write, data)
+
+    async def close(self) -> None:
+        await super().close()
+        self._reservation.release()
+
+
+def _user_safe_decode(src: bytes, codec: str) -> str:
+    try:
+        return src.decode(codec)
+    except (UnicodeDecodeError, LookupError):
+        return src.decode("latin-1")
+
+
+def _too_large(name: Optional[str] = None) -> HTTPException:
+    if name is None:
+        return HTTPException(status_code=413, detail="Request body too large")
+    return HTTPException(status_code=413, detail=f"Form field {name!r} too large")
+
+
+class MultiPartParser(StarletteMultiPartParser):
+    def __init__(
+        self,
+        headers: Headers,
+        stream: AsyncGenerator[bytes, None],
+        *,
+        field_max_sizes: Dict[str, int],
+        spool: UploadSpool,
+    ) -> None:
+        super().__init__(headers, stream)
+        self.field_max_sizes = field_max_sizes
+        self.spool = spool
+
+    async def parse(self) -> FormData:
+        # Parse the Content-Type header to get the multipart boundary.
+        content_type, params = parse_options_header(self.headers["Content-Type"])
+        charset = params.get(b"charset", "utf-8")
+        if type(charset) == bytes:
+            charset = charset.decode("latin-1")
+        boundary = params.get(b"boundary")
+
+        callbacks = {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_end": self.on_end,
+        }
+
+        parser = multipart.MultipartParser(boundary, callbacks)
+        header_field = b""
+        header_value = b""
+        content_disposition = None
+        content_type = b""
+        field_name = ""
+        data: List[bytes] = []
+        size = 0
+        max_size: Optional[int] = None
+        file: Optional[SpooledUploadFile] = None
+
+        items: List[Tuple[str, Union[str, StarletteUploadFile]]] = []
+
+        try:
+            async for chunk in self.stream:
+                parser.write(chunk)
+                messages = list(self.messages)
+                self.messages.clear()
+                for message_type, message_bytes in messages:
+                    if message_type == MultiPartMessage.PART_BEGIN:
+                        content_disposition = None
+                        content_type = b""
+                        data = []
+                        size = 0
+                    elif message_type == MultiPartMessage.HEADER_FIELD:
+                        header_field += message_bytes
+                    elif message_type == MultiPartMessage.HEADER_VALUE:
+                        header_value += message_bytes
+                    elif message_type == MultiPartMessage.HEADER_END:
+                        field = header_field.lower()
+                        if field == b"content-disposition":
+                            content_disposition = header_value
+                        elif field == b"content-type":
+                            content_type = header_value
+                        header_field = b""
+                        header_value = b""
+                    elif message_type == MultiPartMessage.HEADERS_FINISHED:
+                        disposition, options = parse_options_header(content_disposition)
+                        field_name = _user_safe_decode(options[b"name"], charset)
+                        max_size = self.field_max_sizes.get(field_name)
+                        if b"filename" in options:
+                            filename = _user_safe_decode(options[b"filename"], charset)
+                            file = self.spool.create_file(
+                                filename, content_type.decode("latin-1")
+                            )
+                            # Added right away to be closed if parsing fails
+                            items.append((field_name, file))
+                        else:
+                            file = None
+                    elif message_type == MultiPartMessage.PART_DATA:
+                        size += len(message_bytes)
+                        if max_size is not None and size > max_size:
+                            raise _too_large(field_name)
+                        if file is None:
+                            data.append(message_bytes)
+                        else:
+                            await file.write(message_bytes)
+                    elif message_type == MultiPartMessage.PART_END:
+                        if file is None:
+                            items.append(
+                                (field_name, _user_safe_decode(b"".join(data), charset))
+                            )
+                        else:
+                            await file.seek(0)
+            parser.finalize()
+        except BaseException:
+            for _, value in items:
+                if isinstance(value, StarletteUploadFile):
+                    await value.close()
+            raise
+        return FormData(items)
+
+
+async def _limit_stream(
+    stream: AsyncGenerator[bytes, None], max_size: int
+) -> AsyncGenerator[bytes, None]:
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+        if size > max_size:
+            raise _too_large()
+        yield chunk
+
+
+async def parse_form(
+    request: Request,
+    *,
+    max_size: Optional[int] = None,
+    field_max_sizes: Optional[Dict[str, int]] = None,
+    spool: Optional[UploadSpool] = None,
+) -> FormData:
+    """
+    Like `request.form()`, but with the request body limited to `max_size` bytes
+    and each field to `field_max_sizes[name]` bytes, both checked while the body
+    is received. Uploaded files are kept in `spool`.
+    """
+    if hasattr(request, "_form"):
+        return request._form
+    assert (
+        parse_options_header is not None
+    ), "The `python-multipart` library must be installed to use form parsing."
+    field_max_sizes = field_max_sizes or {}
+    stream = request.stream()
+    if max_size is not None:
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_size:
+            raise _too_large()
+        stream = _limit_stream(stream, max_size)
+    content_type, _ = parse_options_header(request.headers.get("Content-Type"))
+    if content_type == b"multipart/form-data":
+        multipart_parser = MultiPartParser(
+            request.headers,
+            stream,
+            field_max_sizes=field_max_sizes,
+            spool=spool or default_upload_spool,
+        )
+        form = await multipart_parser.parse()
+    elif content_type == b"application/x-www-form-urlencoded":
+        form = await FormParser(request.headers, stream).parse()
+        for name, value in form.multi_items():
+            field_max_size = field_max_sizes.get(name)
+            if field_max_size is not None and len(value.encode()) > field_max_size:
+                raise _too_large(name)
+    else:
+        form = FormData()
+    # Closed with the request, returned by request.form()
+    request._form = form
+    return form
+
+
+async def iterate_upload_file(
+    file: StarletteUploadFile, chunk_size: int = upload_chunk_size
+) -> AsyncIterator[bytes]:
+    while True:
+        chunk: Any = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
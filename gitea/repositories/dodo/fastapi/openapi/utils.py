@@ -1,9 +1,13 @@
+import hashlib
 import http.client
 import inspect
+import re
 import warnings
 from enum import Enum
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
 
+import fastapi
+import pydantic
 from fastapi import routing
 from fastapi.datastructures import DefaultPlaceholder
 from fastapi.dependencies.models import Dependant
@@ -261,6 +265,14 @@ def get_openapi_path(
             operation.setdefault("responses", {}).setdefault(status_code, {})[
                 "description"
             ] = route.response_description
+            if route.cache is not None and method in ("GET", "HEAD"):
+                operation["responses"][status_code].setdefault("headers", {})[
+                    "ETag"
+                ] = {
+                    "description": "Validator of the cached response",
+                    "schema": {"type": "string"},
+                }
+                operation["responses"]["304"] = {"description": "Not Modified"}
             if (
                 route_response_media_type
                 and route.status_code not in STATUS_CODES_WITH_NO_BODY
@@ -437,3 +449,175 @@ def get_openapi(
     if tags:
         output["tags"] = tags
     return jsonable_encoder(OpenAPI(**output), by_alias=True, exclude_none=True)  # type: ignore
+
+
+_memory_address_re = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _stable_repr(value: Any) -> str:
+    # The same in every process: without memory addresses, and with the items of
+    # sets sorted as their order depends on the hash seed
+    if isinstance(value, dict):
+        items = (f"{_stable_repr(k)}: {_stable_repr(v)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_stable_repr(item) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_stable_repr(item) for item in value)) + "}"
+    if isinstance(value, type) or inspect.isroutine(value):
+        return f"{value.__module__}.{value.__qualname__}"
+    return _memory_address_re.sub("", repr(value))
+
+
+def _add_type_fingerprint(hasher: "hashlib._Hash", type_: Any, seen: Set[Any]) -> None:
+    if type_ in seen:
+        return
+    seen.add(type_)
+    if lenient_issubclass(type_, BaseModel):
+        hasher.update(
+            _stable_repr(
+                (
+                    type_.__module__,
+                    type_.__qualname__,
+                    type_.__doc__,
+                    type_.__config__.title,
+                    type_.__config__.schema_extra,
+                )
+            ).encode()
+        )
+        for field in type_.__fields__.values():
+            _add_field_fingerprint(hasher, field, seen)
+    elif lenient_issubclass(type_, Enum):
+        hasher.update(
+            _stable_repr(
+                (type_.__module__, type_.__qualname__, type_.__doc__)
+                + tuple((member.name, member.value) for member in type_)
+            ).encode()
+        )
+    for arg in getattr(type_, "__args__", None) or ():
+        _add_type_fingerprint(hasher, arg, seen)
+
+
+def _add_field_fingerprint(
+    hasher: "hashlib._Hash", field: ModelField, seen: Set[Any]
+) -> None:
+    # Callables like default_factory don't change the schema
+    field_info = [
+        (name, value)
+        for name, value in field.field_info.__repr_args__()
+        if not callable(value)
+    ]
+    hasher.update(
+        _stable_repr(
+            (
+                field.name,
+                field.alias,
+                field.required,
+                field.allow_none,
+                field.shape,
+                field.outer_type_,
+                field.type_,
+                type(field.field_info),
+                field_info,
+            )
+        ).encode()
+    )
+    _add_type_fingerprint(hasher, field.outer_type_, seen)
+    _add_type_fingerprint(hasher, field.type_, seen)
+    for sub_field in field.sub_fields or ():
+        _add_field_fingerprint(hasher, sub_field, seen)
+
+
+def _add_route_fingerprint(
+    hasher: "hashlib._Hash", route: routing.APIRoute, seen: Set[Any]
+) -> None:
+    response_class: Any = route.response_class
+    if isinstance(response_class, DefaultPlaceholder):
+        response_class = response_class.value
+    hasher.update(
+        _stable_repr(
+            (
+                route.path_format,
+                sorted(route.methods),
+                route.name,
+                route.unique_id,
+                route.operation_id,
+                route.summary,
+                route.description,
+                route.response_description,
+                route.tags,
+                route.deprecated,
+                route.include_in_schema,
+                route.status_code,
+                route.responses,
+                route.openapi_extra,
+                route.cache is not None,
+                response_class.__module__,
+                response_class.__qualname__,
+                response_class.media_type,
+            )
+        ).encode()
+    )
+    flat_dependant = get_flat_dependant(route.dependant, skip_repeats=True)
+    for field in get_flat_params(flat_dependant):
+        _add_field_fingerprint(hasher, field, seen)
+    for security_requirement in flat_dependant.security_requirements:
+        hasher.update(
+            _stable_repr(
+                (
+                    security_requirement.security_scheme.scheme_name,
+                    security_requirement.security_scheme.model,
+                    security_requirement.scopes,
+                )
+            ).encode()
+        )
+    for model_field in (route.body_field, route.response_field):
+        if model_field:
+            _add_field_fingerprint(hasher, model_field, seen)
+    for additional_response in route.responses.values():
+        _add_type_fingerprint(hasher, additional_response.get("model"), seen)
+    for callback in route.callbacks or ():
+        if isinstance(callback, routing.APIRoute):
+            _add_route_fingerprint(hasher, callback, seen)
+
+
+def get_openapi_fingerprint(
+    *,
+    title: str,
+    version: str,
+    openapi_version: str = "3.0.2",
+    description: Optional[str] = None,
+    routes: Sequence[BaseRoute],
+    tags: Optional[List[Dict[str, Any]]] = None,
+    servers: Optional[List[Dict[str, Union[str, Any]]]] = None,
+    terms_of_service: Optional[str] = None,
+    contact: Optional[Dict[str, Union[str, Any]]] = None,
+    license_info: Optional[Dict[str, Union[str, Any]]] = None,
+) -> str:
+    """
+    A hash of everything the schema from `get_openapi()` is generated from,
+    to know if a stored schema is still valid without generating it again.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(
+        _stable_repr(
+            (
+                fastapi.__version__,
+                pydantic.VERSION,
+                title,
+                version,
+                openapi_version,
+                description,
+                tags,
+                servers,
+                terms_of_service,
+                contact,
+                license_info,
+            )
+        ).encode()
+    )
+    seen: Set[Any] = set()
+    for route in routes:
+        if isinstance(route, routing.APIRoute):
+            _add_route_fingerprint(hasher, route, seen)
+    return hasher.hexdigest()
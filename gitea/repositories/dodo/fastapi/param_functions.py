@@ -166,6 +166,7 @@ def Body(  # noqa: N802
     default: Any,
     *,
     embed: bool = False,
+    stream: bool = False,
     media_type: str = "application/json",
     alias: Optional[str] = None,
     title: Optional[str] = None,
@@ -184,6 +185,7 @@ def Body(  # noqa: N802
     return params.Body(
         default,
         embed=embed,
+        stream=stream,
         media_type=media_type,
         alias=alias,
         title=title,
@@ -205,6 +207,7 @@ def Form(  # noqa: N802
     default: Any,
     *,
     media_type: str = "application/x-www-form-urlencoded",
+    max_size: Optional[int] = None,
     alias: Optional[str] = None,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -222,6 +225,7 @@ def Form(  # noqa: N802
     return params.Form(
         default,
         media_type=media_type,
+        max_size=max_size,
         alias=alias,
         title=title,
         description=description,
@@ -242,6 +246,8 @@ def File(  # noqa: N802
     default: Any,
     *,
     media_type: str = "multipart/form-data",
+    max_size: Optional[int] = None,
+    stream: bool = False,
     alias: Optional[str] = None,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -259,6 +265,8 @@ def File(  # noqa: N802
     return params.File(
         default,
         media_type=media_type,
+        max_size=max_size,
+        stream=stream,
         alias=alias,
         title=title,
         description=description,
@@ -238,6 +238,7 @@ class Body(FieldInfo):
         default: Any,
         *,
         embed: bool = False,
+        stream: bool = False,
         media_type: str = "application/json",
         alias: Optional[str] = None,
         title: Optional[str] = None,
@@ -254,6 +255,8 @@ class Body(FieldInfo):
         **extra: Any,
     ):
         self.embed = embed
+        # Validated item by item while it's read, for AsyncIterator[...] params
+        self.stream = stream
         self.media_type = media_type
         self.example = example
         self.examples = examples
@@ -282,6 +285,7 @@ class Form(Body):
         default: Any,
         *,
         media_type: str = "application/x-www-form-urlencoded",
+        max_size: Optional[int] = None,
         alias: Optional[str] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -314,6 +318,8 @@ class Form(Body):
             examples=examples,
             **extra,
         )
+        # In bytes, checked while the form is parsed
+        self.max_size = max_size
 
 
 class File(Form):
@@ -322,6 +328,8 @@ class File(Form):
         default: Any,
         *,
         media_type: str = "multipart/form-data",
+        max_size: Optional[int] = None,
+        stream: bool = False,
         alias: Optional[str] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -339,6 +347,7 @@ class File(Form):
         super().__init__(
             default,
             media_type=media_type,
+            max_size=max_size,
             alias=alias,
             title=title,
             description=description,
@@ -353,6 +362,8 @@ class File(Form):
             examples=examples,
             **extra,
         )
+        # Read in chunks by an AsyncIterator[bytes] param
+        self.stream = stream
 
 
 class Depends:
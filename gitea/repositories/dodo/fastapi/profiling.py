@@ -0,0 +1,168 @@
+import contextvars
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Histogram:
+    """
+    Durations in seconds, counted in buckets growing exponentially from 10
+    microseconds to about 80 seconds, so recording one is cheap and the memory
+    used is fixed.
+    """
+
+    bounds: List[float] = [0.00001 * 2 ** exponent for exponent in range(24)]
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        # The upper bound of the bucket holding it, at most the max recorded
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                [self.bounds[index] if index < len(self.bounds) else None, count]
+                for index, count in enumerate(self.counts)
+                if count
+            ],
+        }
+
+
+class RequestProfile:
+    """
+    The durations measured while handling a single request, recorded in the
+    profiler's histograms once the request is done.
+    """
+
+    def __init__(self) -> None:
+        self.body: Optional[float] = None
+        self.dependencies: Optional[float] = None
+        self.endpoint: Optional[float] = None
+        self.serialize: Optional[float] = None
+        self.threadpool_wait = 0.0
+        # Each dependency called, possibly from worker threads
+        self.calls: List[Tuple[Callable[..., Any], float]] = []
+
+
+# The profile of the request being handled, if the app has a profiler
+current_profile: "contextvars.ContextVar[Optional[RequestProfile]]" = (
+    contextvars.ContextVar("current_profile", default=None)
+)
+
+
+def call_profiled(
+    profile: RequestProfile, call: Callable[..., Any], values: Dict[str, Any]
+) -> Any:
+    start = time.perf_counter()
+    try:
+        return call(**values)
+    finally:
+        profile.calls.append((call, time.perf_counter() - start))
+
+
+def get_dependency_name(call: Callable[..., Any]) -> str:
+    if not hasattr(call, "__qualname__"):
+        call = type(call)
+    return f"{call.__module__}.{call.__qualname__}"
+
+
+class Profiler:
+    """
+    Latency histograms per route, for each phase of the request: reading the
+    body, solving the dependencies, the endpoint and serializing the response,
+    with the time spent waiting for a thread apart. And one histogram per
+    dependency.
+
+    Pass it to `FastAPI(profiler=...)`, with `profiler_url` to serve the
+    statistics.
+    """
+
+    phases = (
+        "total",
+        "body",
+        "dependencies",
+        "endpoint",
+        "serialize",
+        "threadpool_wait",
+    )
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Dict[str, Histogram]] = {}
+        self.dependencies: Dict[str, Histogram] = {}
+        self._dependency_names: Dict[Any, str] = {}
+
+    def record(self, route: str, total: float, profile: RequestProfile) -> None:
+        histograms = self.routes.get(route)
+        if histograms is None:
+            histograms = self.routes[route] = {
+                phase: Histogram() for phase in self.phases
+            }
+        histograms["total"].record(total)
+        if profile.body is not None:
+            histograms["body"].record(profile.body)
+        if profile.dependencies is not None:
+            histograms["dependencies"].record(profile.dependencies)
+        if profile.endpoint is not None:
+            histograms["endpoint"].record(profile.endpoint)
+        if profile.serialize is not None:
+            histograms["serialize"].record(profile.serialize)
+        histograms["threadpool_wait"].record(profile.threadpool_wait)
+        for call, seconds in profile.calls:
+            try:
+                name = self._dependency_names.get(call)
+            except TypeError:  # pragma: no cover
+                name = get_dependency_name(call)
+            else:
+                if name is None:
+                    name = self._dependency_names[call] = get_dependency_name(call)
+            histogram = self.dependencies.get(name)
+            if histogram is None:
+                histogram = self.dependencies[name] = Histogram()
+            histogram.record(seconds)
+
+    def statistics(self) -> Dict[str, Any]:
+        return {
+            "routes": {
+                route: {
+                    phase: histogram.to_dict()
+                    for phase, histogram in histograms.items()
+                    if histogram.count
+                }
+                for route, histograms in self.routes.items()
+            },
+            "dependencies": {
+                name: histogram.to_dict()
+                for name, histogram in self.dependencies.items()
+            },
+        }
+
+    def reset(self) -> None:
+        self.routes.clear()
+        self.dependencies.clear()
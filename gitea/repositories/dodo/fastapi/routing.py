@@ -3,6 +3,8 @@ import dataclasses
 import email.message
 import inspect
 import json
+import threading
+import time
 from enum import Enum, IntEnum
 from typing import (
     Any,
@@ -19,17 +21,25 @@ from typing import (
 )
 
 from fastapi import params
+from fastapi.caching import CachePolicy, etag_matches
+from fastapi.concurrency import default_threadpool
 from fastapi.datastructures import Default, DefaultPlaceholder
 from fastapi.dependencies.models import Dependant
 from fastapi.dependencies.utils import (
+    JSONArrayStream,
     get_body_field,
     get_dependant,
+    get_form_field_max_sizes,
     get_parameterless_sub_dependant,
+    get_solve_plan,
+    get_sub_dependant,
     solve_dependencies,
 )
 from fastapi.encoders import DictIntStrAny, SetIntStr, jsonable_encoder
 from fastapi.exceptions import RequestValidationError, WebSocketRequestValidationError
+from fastapi.formparsers import parse_form
 from fastapi.openapi.constants import STATUS_CODES_WITH_NO_BODY
+from fastapi.profiling import RequestProfile, current_profile
 from fastapi.types import DecoratedCallable
 from fastapi.utils import (
     create_cloned_field,
@@ -39,8 +49,11 @@ from fastapi.utils import (
 )
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from pydantic.fields import ModelField, Undefined
+from pydantic.errors import ListError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.utils import lenient_issubclass
 from starlette import routing
+from starlette.background import BackgroundTask, BackgroundTasks
 from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
@@ -57,6 +70,8 @@ from starlette.status import WS_1008_POLICY_VIOLATION
 from starlette.types import ASGIApp, Scope
 from starlette.websockets import WebSocket
 
+_native_json_types = (str, int, float, list, tuple, dict, type(None))
+
 
 def _prepare_response_content(
     res: Any,
@@ -104,6 +119,77 @@ def _prepare_response_content(
     return res
 
 
+def _is_trusted_response_content(field: ModelField, response_content: Any) -> bool:
+    # The response field is a clone of the declared response model, so the
+    # models returned by the endpoint are instances of its base class. Only
+    # exact instances are trusted, a subclass could carry extra data.
+    model = field.type_
+    if not lenient_issubclass(model, BaseModel) or getattr(
+        model.__config__, "validate_response", True
+    ):
+        return False
+    trusted_types = (model,) + model.__bases__
+    if field.shape == SHAPE_SINGLETON:
+        return type(response_content) in trusted_types
+    if field.shape == SHAPE_LIST and isinstance(response_content, list):
+        return all(type(item) in trusted_types for item in response_content)
+    return False
+
+
+def _validate_response_content(
+    field: ModelField,
+    response_content: Any,
+    *,
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+) -> Any:
+    if _is_trusted_response_content(field, response_content):
+        return response_content
+    errors = []
+    response_content = _prepare_response_content(
+        response_content,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+    value, errors_ = field.validate(response_content, {}, loc=("response",))
+    if isinstance(errors_, ErrorWrapper):
+        errors.append(errors_)
+    elif isinstance(errors_, list):
+        errors.extend(errors_)
+    if errors:
+        raise ValidationError(errors, field.type_)
+    return value
+
+
+async def validate_response_content(
+    *,
+    field: ModelField,
+    response_content: Any,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    is_coroutine: bool = True,
+) -> Any:
+    if is_coroutine:
+        return _validate_response_content(
+            field,
+            response_content,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+    return await run_in_threadpool(
+        _validate_response_content,
+        field,
+        response_content,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+
+
 async def serialize_response(
     *,
     field: Optional[ModelField] = None,
@@ -117,25 +203,14 @@ async def serialize_response(
     is_coroutine: bool = True,
 ) -> Any:
     if field:
-        errors = []
-        response_content = _prepare_response_content(
-            response_content,
+        value = await validate_response_content(
+            field=field,
+            response_content=response_content,
             exclude_unset=exclude_unset,
             exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
+            is_coroutine=is_coroutine,
         )
-        if is_coroutine:
-            value, errors_ = field.validate(response_content, {}, loc=("response",))
-        else:
-            value, errors_ = await run_in_threadpool(
-                field.validate, response_content, {}, loc=("response",)
-            )
-        if isinstance(errors_, ErrorWrapper):
-            errors.append(errors_)
-        elif isinstance(errors_, list):
-            errors.extend(errors_)
-        if errors:
-            raise ValidationError(errors, field.type_)
         return jsonable_encoder(
             value,
             include=include,
@@ -149,6 +224,171 @@ async def serialize_response(
         return jsonable_encoder(response_content)
 
 
+def _render_json(content: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    # Same output as JSONResponse.render()
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=default,
+    ).encode("utf-8")
+
+
+def _has_sqlalchemy_keys(content: Any) -> bool:
+    # jsonable_encoder() drops the keys starting with "_sa" at any depth
+    if isinstance(content, dict):
+        return any(
+            (isinstance(key, str) and key.startswith("_sa"))
+            or _has_sqlalchemy_keys(value)
+            for key, value in content.items()
+        )
+    if isinstance(content, (list, tuple)):
+        return any(_has_sqlalchemy_keys(value) for value in content)
+    return False
+
+
+def _encode_models_json(
+    field: ModelField,
+    value: Any,
+    *,
+    include: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    exclude: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    by_alias: bool = True,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+) -> Optional[bytes]:
+    model = field.type_
+    if not lenient_issubclass(model, BaseModel):
+        return None
+    config = model.__config__
+    # A custom json_dumps would change the body JSONResponse renders
+    if config.json_dumps is not json.dumps:
+        return None
+    # jsonable_encoder() checks custom encoders before the native JSON types,
+    # json.dumps() would only call them for the types it can't handle
+    for type_ in getattr(config, "json_encoders", {}):
+        if lenient_issubclass(type_, _native_json_types):
+            return None
+    if field.shape == SHAPE_SINGLETON and isinstance(value, BaseModel):
+        models = [value]
+    elif field.shape == SHAPE_LIST and all(
+        isinstance(item, BaseModel) for item in value
+    ):
+        models = value
+    else:
+        return None
+    dict_kwargs: Dict[str, Any] = {
+        "by_alias": by_alias,
+        "exclude_unset": exclude_unset,
+        "exclude_defaults": exclude_defaults,
+    }
+    if include is not None:
+        dict_kwargs["include"] = (
+            include if isinstance(include, (set, dict)) else set(include)
+        )
+    if exclude is not None:
+        dict_kwargs["exclude"] = (
+            exclude if isinstance(exclude, (set, dict)) else set(exclude)
+        )
+    content = []
+    for item in models:
+        item_dict = item.dict(**dict_kwargs)
+        if "__root__" in item_dict:
+            item_dict = item_dict["__root__"]
+        content.append(item_dict)
+    if _has_sqlalchemy_keys(content):
+        return None
+    data: Any = content if field.shape == SHAPE_LIST else content[0]
+    try:
+        return _render_json(data, default=model.__json_encoder__)
+    except TypeError:
+        # e.g. dict keys that only jsonable_encoder() knows how to convert
+        return None
+
+
+def encode_response_json(
+    *,
+    field: ModelField,
+    value: Any,
+    include: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    exclude: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    by_alias: bool = True,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+) -> bytes:
+    """
+    Render validated response content straight to JSON bytes.
+
+    Pydantic models (and lists of them) using the default `json_dumps` are
+    dumped with their `json_encoders` config in a single pass, anything else
+    goes through `jsonable_encoder()`, giving the same body `JSONResponse`
+    would render.
+    """
+    if not exclude_none:
+        # jsonable_encoder() also drops None values from plain dicts nested in
+        # the models, only it can do that
+        body = _encode_models_json(
+            field,
+            value,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+        )
+        if body is not None:
+            return body
+    return _render_json(
+        jsonable_encoder(
+            value,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+    )
+
+
+async def serialize_response_json(
+    *,
+    field: ModelField,
+    response_content: Any,
+    include: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    exclude: Optional[Union[SetIntStr, DictIntStrAny]] = None,
+    by_alias: bool = True,
+    exclude_unset: bool = False,
+    exclude_defaults: bool = False,
+    exclude_none: bool = False,
+    is_coroutine: bool = True,
+) -> bytes:
+    """
+    Validate the response content once and render it straight to JSON bytes.
+    """
+    value = await validate_response_content(
+        field=field,
+        response_content=response_content,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+        is_coroutine=is_coroutine,
+    )
+    return encode_response_json(
+        field=field,
+        value=value,
+        include=include,
+        exclude=exclude,
+        by_alias=by_alias,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+
+
 async def run_endpoint_function(
     *, dependant: Dependant, values: Dict[str, Any], is_coroutine: bool
 ) -> Any:
@@ -162,6 +402,51 @@ async def run_endpoint_function(
         return await run_in_threadpool(dependant.call, **values)
 
 
+def run_sync_endpoint_function(
+    *,
+    dependant: Dependant,
+    values: Dict[str, Any],
+    response_field: Optional[ModelField],
+    exclude_unset: bool,
+    exclude_defaults: bool,
+    exclude_none: bool,
+    profile: Optional[RequestProfile] = None,
+) -> Tuple[Any, Any]:
+    # Only called by get_request_handler, in a worker thread. The response of sync
+    # endpoints is validated in the same thread, saving a second thread hop.
+    assert dependant.call is not None, "dependant.call must be a function"
+    if profile is not None:
+        start = time.perf_counter()
+    raw_response = dependant.call(**values)
+    if profile is not None:
+        validating = time.perf_counter()
+        profile.endpoint = validating - start
+    if response_field is None or isinstance(raw_response, Response):
+        return raw_response, raw_response
+    value = _validate_response_content(
+        response_field,
+        raw_response,
+        exclude_unset=exclude_unset,
+        exclude_defaults=exclude_defaults,
+        exclude_none=exclude_none,
+    )
+    if profile is not None:
+        profile.serialize = time.perf_counter() - validating
+    return raw_response, value
+
+
+def is_json_content_type(request: Request) -> bool:
+    content_type_value = request.headers.get("content-type")
+    if not content_type_value:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type_value
+    if message.get_content_maintype() == "application":
+        subtype = message.get_content_subtype()
+        return subtype == "json" or subtype.endswith("+json")
+    return False
+
+
 def get_request_handler(
     dependant: Dependant,
     body_field: Optional[ModelField] = None,
@@ -175,85 +460,314 @@ def get_request_handler(
     response_model_exclude_defaults: bool = False,
     response_model_exclude_none: bool = False,
     dependency_overrides_provider: Optional[Any] = None,
+    cache: Optional[CachePolicy] = None,
 ) -> Callable[[Request], Coroutine[Any, Any, Response]]:
     assert dependant.call is not None, "dependant.call must be a function"
     is_coroutine = asyncio.iscoroutinefunction(dependant.call)
     is_body_form = body_field and isinstance(body_field.field_info, params.Form)
+    is_body_stream = body_field and getattr(body_field.field_info, "stream", False)
+    form_field_max_sizes = (
+        get_form_field_max_sizes(body_field) if body_field and is_body_form else {}
+    )
     if isinstance(response_class, DefaultPlaceholder):
         actual_response_class: Type[Response] = response_class.value
     else:
         actual_response_class = response_class
 
-    async def app(request: Request) -> Response:
+    async def app(
+        request: Request,
+        dependency_cache: Optional[Dict[Any, Any]] = None,
+        cache_key: Optional[str] = None,
+    ) -> Response:
+        profile = current_profile.get()
+        if profile is not None:
+            start = time.perf_counter()
         try:
             body: Any = None
             if body_field:
                 if is_body_form:
-                    body = await request.form()
+                    body = await parse_form(
+                        request,
+                        max_size=getattr(
+                            dependency_overrides_provider, "max_form_size", None
+                        ),
+                        field_max_sizes=form_field_max_sizes,
+                        spool=getattr(
+                            dependency_overrides_provider, "upload_spool", None
+                        ),
+                    )
+                elif is_body_stream:
+                    if not is_json_content_type(request):
+                        raise RequestValidationError(
+                            [ErrorWrapper(ListError(), ("body",))]
+                        )
+                    body = JSONArrayStream(request.stream())
+                    if not await body.start():
+                        body = None
                 else:
                     body_bytes = await request.body()
                     if body_bytes:
-                        json_body: Any = Undefined
-                        content_type_value = request.headers.get("content-type")
-                        if not content_type_value:
-                            json_body = await request.json()
-                        else:
-                            message = email.message.Message()
-                            message["content-type"] = content_type_value
-                            if message.get_content_maintype() == "application":
-                                subtype = message.get_content_subtype()
-                                if subtype == "json" or subtype.endswith("+json"):
-                                    json_body = await request.json()
-                        if json_body != Undefined:
-                            body = json_body
+                        if is_json_content_type(request):
+                            body = await request.json()
                         else:
                             body = body_bytes
         except json.JSONDecodeError as e:
             raise RequestValidationError([ErrorWrapper(e, ("body", e.pos))], body=e.doc)
+        except (RequestValidationError, HTTPException):
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=400, detail="There was an error parsing the body"
             ) from e
+        if profile is not None:
+            solving = time.perf_counter()
+            profile.body = solving - start
         solved_result = await solve_dependencies(
             request=request,
             dependant=dependant,
             body=body,
             dependency_overrides_provider=dependency_overrides_provider,
+            dependency_cache=dependency_cache,
         )
         values, errors, background_tasks, sub_response, _ = solved_result
+        if profile is not None:
+            calling = time.perf_counter()
+            profile.dependencies = calling - solving
         if errors:
             raise RequestValidationError(errors, body=body)
         else:
-            raw_response = await run_endpoint_function(
-                dependant=dependant, values=values, is_coroutine=is_coroutine
-            )
+            if cache is not None and cache_key is not None:
+                # Looked up once all the dependencies, including the security
+                # ones, are solved: only the endpoint call is skipped
+                cached = await cache.load(cache_key)
+                if cached is not None:
+                    cached_response, merge_dependencies = cached
+                    if merge_dependencies:
+                        # Only set by the dependencies, the endpoint isn't called
+                        cached_response.headers.raw.extend(sub_response.headers.raw)
+                        if sub_response.status_code:
+                            cached_response.status_code = sub_response.status_code
+                    if background_tasks is not None:
+                        cached_response.background = background_tasks
+                    return cached_response
+                # The dependencies set theirs again on each hit, they aren't stored
+                dependency_headers = len(sub_response.headers.raw)
+                dependency_status_code = sub_response.status_code
+            if is_coroutine:
+                raw_response = await run_endpoint_function(
+                    dependant=dependant, values=values, is_coroutine=is_coroutine
+                )
+                if profile is not None:
+                    profile.endpoint = time.perf_counter() - calling
+            else:
+                threadpool = (
+                    getattr(dependency_overrides_provider, "threadpool", None)
+                    or default_threadpool
+                )
+                raw_response, response_value = await threadpool.run(
+                    run_sync_endpoint_function,
+                    dependant=dependant,
+                    values=values,
+                    response_field=response_field,
+                    exclude_unset=response_model_exclude_unset,
+                    exclude_defaults=response_model_exclude_defaults,
+                    exclude_none=response_model_exclude_none,
+                    profile=profile,
+                )
+            if profile is not None:
+                serializing = time.perf_counter()
 
             if isinstance(raw_response, Response):
                 if raw_response.background is None:
                     raw_response.background = background_tasks
+                if cache is not None and cache_key is not None:
+                    await cache.store(cache_key, raw_response, merge_dependencies=False)
                 return raw_response
-            response_data = await serialize_response(
-                field=response_field,
-                response_content=raw_response,
-                include=response_model_include,
-                exclude=response_model_exclude,
-                by_alias=response_model_by_alias,
-                exclude_unset=response_model_exclude_unset,
-                exclude_defaults=response_model_exclude_defaults,
-                exclude_none=response_model_exclude_none,
-                is_coroutine=is_coroutine,
-            )
             response_args: Dict[str, Any] = {"background": background_tasks}
             # If status_code was set, use it, otherwise use the default from the
             # response class, in the case of redirect it's 307
             if status_code is not None:
                 response_args["status_code"] = status_code
-            response = actual_response_class(response_data, **response_args)
-            response.headers.raw.extend(sub_response.headers.raw)
+            if response_field:
+                if is_coroutine:
+                    response_value = _validate_response_content(
+                        response_field,
+                        raw_response,
+                        exclude_unset=response_model_exclude_unset,
+                        exclude_defaults=response_model_exclude_defaults,
+                        exclude_none=response_model_exclude_none,
+                    )
+                if actual_response_class is JSONResponse:
+                    # Skip building the intermediate jsonable data, render the
+                    # validated models directly
+                    response_body = encode_response_json(
+                        field=response_field,
+                        value=response_value,
+                        include=response_model_include,
+                        exclude=response_model_exclude,
+                        by_alias=response_model_by_alias,
+                        exclude_unset=response_model_exclude_unset,
+                        exclude_defaults=response_model_exclude_defaults,
+                        exclude_none=response_model_exclude_none,
+                    )
+                    response = Response(
+                        response_body,
+                        media_type=JSONResponse.media_type,
+                        **response_args,
+                    )
+                else:
+                    response_data = jsonable_encoder(
+                        response_value,
+                        include=response_model_include,
+                        exclude=response_model_exclude,
+                        by_alias=response_model_by_alias,
+                        exclude_unset=response_model_exclude_unset,
+                        exclude_defaults=response_model_exclude_defaults,
+                        exclude_none=response_model_exclude_none,
+                    )
+                    response = actual_response_class(response_data, **response_args)
+            else:
+                response = actual_response_class(
+                    jsonable_encoder(raw_response), **response_args
+                )
+            if profile is not None:
+                # Plus the validation done in the worker thread for sync endpoints
+                profile.serialize = (
+                    (profile.serialize or 0.0) + time.perf_counter() - serializing
+                )
+            if cache is not None and cache_key is not None:
+                # Stored with what the endpoint set on the sub-response
+                response.headers.raw.extend(
+                    sub_response.headers.raw[dependency_headers:]
+                )
+                if sub_response.status_code != dependency_status_code:
+                    response.status_code = sub_response.status_code
+                await cache.store(cache_key, response)
+                response.headers.raw.extend(
+                    sub_response.headers.raw[:dependency_headers]
+                )
+            else:
+                response.headers.raw.extend(sub_response.headers.raw)
             if sub_response.status_code:
                 response.status_code = sub_response.status_code
             return response
 
+    handler: Callable[[Request], Coroutine[Any, Any, Response]] = app
+    if cache is not None:
+        handler = cache_responses(
+            app,
+            cache=cache,
+            path=dependant.path or "",
+            dependency_overrides_provider=dependency_overrides_provider,
+        )
+    if is_body_form:
+        handler = close_form_after_response(handler)
+    return profile_requests(
+        handler,
+        path=dependant.path or "",
+        dependency_overrides_provider=dependency_overrides_provider,
+    )
+
+
+def cache_responses(
+    handler: Callable[..., Coroutine[Any, Any, Response]],
+    *,
+    cache: CachePolicy,
+    path: str,
+    dependency_overrides_provider: Optional[Any] = None,
+) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+    # The values of the vary_on dependencies are part of the cache key, they are
+    # solved first and reused by the handler, which looks up the key once the
+    # other dependencies are solved
+    vary_dependant = Dependant(path=path)
+    for index, depends in enumerate(cache.vary_on):
+        assert callable(
+            depends.dependency
+        ), "A vary_on dependency must have a callable dependency"
+        vary_dependant.dependencies.append(
+            get_sub_dependant(
+                depends=depends,
+                dependency=depends.dependency,
+                path=path,
+                name=f"vary_on_{index}",
+            )
+        )
+    vary_dependant.solve_plan = get_solve_plan(vary_dependant)
+
+    async def app(request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return await handler(request)
+        vary_values: Dict[str, Any] = {}
+        dependency_cache = None
+        if vary_dependant.dependencies:
+            solved_result = await solve_dependencies(
+                request=request,
+                dependant=vary_dependant,
+                dependency_overrides_provider=dependency_overrides_provider,
+            )
+            vary_values, errors, _, _, dependency_cache = solved_result
+            if errors:
+                raise RequestValidationError(errors)
+        key = await cache.get_key(request, jsonable_encoder(vary_values))
+        response = await handler(
+            request, dependency_cache=dependency_cache, cache_key=key
+        )
+        etag = response.headers.get("etag")
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(
+                status_code=304, headers={"etag": etag}, background=response.background
+            )
+        return response
+
+    return app
+
+
+def close_form_after_response(
+    handler: Callable[[Request], Coroutine[Any, Any, Response]]
+) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+    # Uploaded files can be used by the response and its background tasks, they
+    # are closed after them instead of waiting for the garbage collector
+    async def app(request: Request) -> Response:
+        try:
+            response = await handler(request)
+        except BaseException:
+            await request.close()
+            raise
+        if response.background is None:
+            response.background = BackgroundTask(request.close)
+        elif isinstance(response.background, BackgroundTasks):
+            response.background.add_task(request.close)
+        else:
+            response.background = BackgroundTasks(
+                [response.background, BackgroundTask(request.close)]
+            )
+        return response
+
+    return app
+
+
+def profile_requests(
+    handler: Callable[[Request], Coroutine[Any, Any, Response]],
+    *,
+    path: str,
+    dependency_overrides_provider: Optional[Any] = None,
+) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+    # The phases are timed by the handler, the dependencies and the threadpool,
+    # into the profile of the current request
+    async def app(request: Request) -> Response:
+        profiler = getattr(dependency_overrides_provider, "profiler", None)
+        if profiler is None:
+            return await handler(request)
+        profile = RequestProfile()
+        token = current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            total = time.perf_counter() - start
+            current_profile.reset(token)
+            profiler.record(f"{request.method} {path}", total, profile)
+
     return app
 
 
@@ -289,6 +803,7 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         self.endpoint = endpoint
         self.name = get_name(endpoint) if name is None else name
         self.dependant = get_dependant(path=path, call=self.endpoint)
+        self.dependant.solve_plan = get_solve_plan(self.dependant)
         self.app = websocket_session(
             get_websocket_app(
                 dependant=self.dependant,
@@ -304,6 +819,10 @@ class APIWebSocketRoute(routing.WebSocketRoute):
         return match, child_scope
 
 
+# Lazy routes can be compiled by a request and by a thread warming them up
+_compile_lock = threading.RLock()
+
+
 class APIRoute(routing.Route):
     def __init__(
         self,
@@ -335,9 +854,11 @@ class APIRoute(routing.Route):
         dependency_overrides_provider: Optional[Any] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Union[
             Callable[["APIRoute"], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
+        lazy: bool = False,
     ) -> None:
         self.path = path
         self.endpoint = endpoint
@@ -357,6 +878,7 @@ class APIRoute(routing.Route):
         self.dependency_overrides_provider = dependency_overrides_provider
         self.callbacks = callbacks
         self.openapi_extra = openapi_extra
+        self.cache = cache
         self.generate_unique_id_function = generate_unique_id_function
         self.tags = tags or []
         self.responses = responses or {}
@@ -380,6 +902,52 @@ class APIRoute(routing.Route):
             assert (
                 status_code not in STATUS_CODES_WITH_NO_BODY
             ), f"Status code {status_code} must not have a response body"
+        if dependencies:
+            self.dependencies = list(dependencies)
+        else:
+            self.dependencies = []
+        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
+        # if a "form feed" character (page break) is found in the description text,
+        # truncate description text to the content preceding the first "form feed"
+        self.description = self.description.split("\f")[0]
+        for additional_status_code, response in self.responses.items():
+            assert isinstance(response, dict), "An additional response must be a dict"
+            if response.get("model"):
+                assert (
+                    additional_status_code not in STATUS_CODES_WITH_NO_BODY
+                ), f"Status code {additional_status_code} must not have a response body"
+        assert callable(endpoint), "An endpoint must be a callable"
+        if not lazy:
+            self.compile()
+
+    # Set by compile(), on first access for lazy routes
+    _compiled_attributes = {
+        "response_field",
+        "secure_cloned_response_field",
+        "response_fields",
+        "dependant",
+        "body_field",
+        "app",
+    }
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in self._compiled_attributes or "path" not in self.__dict__:
+            raise AttributeError(name)
+        self.compile()
+        return self.__dict__[name]
+
+    def compile(self) -> None:
+        """
+        Build the dependant, the body and response fields and the request handler.
+        Routes created with `lazy=True` are compiled on first use, e.g. when they
+        handle their first request or the OpenAPI schema is generated.
+        """
+        with _compile_lock:
+            if "app" not in self.__dict__:
+                self._compile()
+
+    def _compile(self) -> None:
+        if self.response_model:
             response_name = "Response_" + self.unique_id
             self.response_field = create_response_field(
                 name=response_name, type_=self.response_model
@@ -397,22 +965,10 @@ class APIRoute(routing.Route):
         else:
             self.response_field = None  # type: ignore
             self.secure_cloned_response_field = None
-        if dependencies:
-            self.dependencies = list(dependencies)
-        else:
-            self.dependencies = []
-        self.description = description or inspect.cleandoc(self.endpoint.__doc__ or "")
-        # if a "form feed" character (page break) is found in the description text,
-        # truncate description text to the content preceding the first "form feed"
-        self.description = self.description.split("\f")[0]
         response_fields = {}
         for additional_status_code, response in self.responses.items():
-            assert isinstance(response, dict), "An additional response must be a dict"
             model = response.get("model")
             if model:
-                assert (
-                    additional_status_code not in STATUS_CODES_WITH_NO_BODY
-                ), f"Status code {additional_status_code} must not have a response body"
                 response_name = f"Response_{additional_status_code}_{self.unique_id}"
                 response_field = create_response_field(name=response_name, type_=model)
                 response_fields[additional_status_code] = response_field
@@ -420,14 +976,13 @@ class APIRoute(routing.Route):
             self.response_fields: Dict[Union[int, str], ModelField] = response_fields
         else:
             self.response_fields = {}
-
-        assert callable(endpoint), "An endpoint must be a callable"
         self.dependant = get_dependant(path=self.path_format, call=self.endpoint)
         for depends in self.dependencies[::-1]:
             self.dependant.dependencies.insert(
                 0,
                 get_parameterless_sub_dependant(depends=depends, path=self.path_format),
             )
+        self.dependant.solve_plan = get_solve_plan(self.dependant)
         self.body_field = get_body_field(dependant=self.dependant, name=self.unique_id)
         self.app = request_response(self.get_route_handler())
 
@@ -445,6 +1000,7 @@ class APIRoute(routing.Route):
             response_model_exclude_defaults=self.response_model_exclude_defaults,
             response_model_exclude_none=self.response_model_exclude_none,
             dependency_overrides_provider=self.dependency_overrides_provider,
+            cache=self.cache,
         )
 
     def matches(self, scope: Scope) -> Tuple[Match, Scope]:
@@ -476,6 +1032,7 @@ class APIRouter(routing.Router):
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
+        lazy_routes: bool = False,
     ) -> None:
         super().__init__(
             routes=routes,  # type: ignore # in Starlette
@@ -500,6 +1057,15 @@ class APIRouter(routing.Router):
         self.route_class = route_class
         self.default_response_class = default_response_class
         self.generate_unique_id_function = generate_unique_id_function
+        self.lazy_routes = lazy_routes
+
+    def compile_routes(self) -> None:
+        """
+        Compile the routes not compiled yet, when created with `lazy_routes=True`.
+        """
+        for route in self.routes:
+            if isinstance(route, APIRoute):
+                route.compile()
 
     def add_api_route(
         self,
@@ -531,6 +1097,7 @@ class APIRouter(routing.Router):
         route_class_override: Optional[Type[APIRoute]] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Union[
             Callable[[APIRoute], str], DefaultPlaceholder
         ] = Default(generate_unique_id),
@@ -579,7 +1146,9 @@ class APIRouter(routing.Router):
             dependency_overrides_provider=self.dependency_overrides_provider,
             callbacks=current_callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=current_generate_unique_id,
+            lazy=self.lazy_routes,
         )
         self.routes.append(route)
 
@@ -609,6 +1178,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -639,6 +1209,7 @@ class APIRouter(routing.Router):
                 name=name,
                 callbacks=callbacks,
                 openapi_extra=openapi_extra,
+                cache=cache,
                 generate_unique_id_function=generate_unique_id_function,
             )
             return func
@@ -754,6 +1325,7 @@ class APIRouter(routing.Router):
                     route_class_override=type(route),
                     callbacks=current_callbacks,
                     openapi_extra=route.openapi_extra,
+                    cache=route.cache,
                     generate_unique_id_function=current_generate_unique_id,
                 )
             elif isinstance(route, routing.Route):
@@ -803,6 +1375,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -831,6 +1404,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -859,6 +1433,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -887,6 +1462,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -915,6 +1491,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -943,6 +1520,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -971,6 +1549,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -999,6 +1578,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -1027,6 +1607,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -1055,6 +1636,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -1083,6 +1665,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -1111,6 +1694,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -1139,6 +1723,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -1167,6 +1752,7 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
 
@@ -1195,6 +1781,7 @@ class APIRouter(routing.Router):
         name: Optional[str] = None,
         callbacks: Optional[List[BaseRoute]] = None,
         openapi_extra: Optional[Dict[str, Any]] = None,
+        cache: Optional[CachePolicy] = None,
         generate_unique_id_function: Callable[[APIRoute], str] = Default(
             generate_unique_id
         ),
@@ -1224,5 +1811,6 @@ class APIRouter(routing.Router):
             name=name,
             callbacks=callbacks,
             openapi_extra=openapi_extra,
+            cache=cache,
             generate_unique_id_function=generate_unique_id_function,
         )
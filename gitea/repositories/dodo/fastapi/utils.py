@@ -1,9 +1,21 @@
 import functools
 import re
+import threading
 import warnings
+from collections import ChainMap, OrderedDict
 from dataclasses import is_dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    MutableMapping,
+    Optional,
+    Set,
+    Type,
+    Union,
+    cast,
+)
 
 import fastapi
 from fastapi.datastructures import DefaultPlaceholder, DefaultType
@@ -73,14 +85,35 @@ def create_response_field(
         )
 
 
+# Models are cloned once, the clones are shared by all the routes using them.
+# Each clone references its original model, only the most recently used ones are
+# kept.
+_cloned_types_cache: "OrderedDict[Type[BaseModel], Type[BaseModel]]" = OrderedDict()
+_cloned_types_cache_size = 1024
+_cloned_types_cache_lock = threading.Lock()
+
+
 def create_cloned_field(
     field: ModelField,
     *,
-    cloned_types: Optional[Dict[Type[BaseModel], Type[BaseModel]]] = None,
+    cloned_types: Optional[MutableMapping[Type[BaseModel], Type[BaseModel]]] = None,
 ) -> ModelField:
     # _cloned_types has already cloned types, to support recursive models
     if cloned_types is None:
-        cloned_types = dict()
+        # The new clones are only shared once they are all created, the cache
+        # could evict them before the recursion is done otherwise
+        new_types: Dict[Type[BaseModel], Type[BaseModel]] = {}
+        new_field = create_cloned_field(
+            field, cloned_types=ChainMap(new_types, _cloned_types_cache)
+        )
+        with _cloned_types_cache_lock:
+            # Including the clones reused from the cache, to refresh their order
+            for model, clone in new_types.items():
+                _cloned_types_cache[model] = clone
+                _cloned_types_cache.move_to_end(model)
+            while len(_cloned_types_cache) > _cloned_types_cache_size:
+                _cloned_types_cache.popitem(last=False)
+        return new_field
     original_type = field.type_
     if is_dataclass(original_type) and hasattr(original_type, "__pydantic_model__"):
         original_type = original_type.__pydantic_model__
@@ -88,7 +121,10 @@ def create_cloned_field(
     if lenient_issubclass(original_type, BaseModel):
         original_type = cast(Type[BaseModel], original_type)
         use_type = cloned_types.get(original_type)
-        if use_type is None:
+        if use_type is not None:
+            # Recorded with the new clones, to be moved to the end of the cache
+            cloned_types[original_type] = use_type
+        else:
             use_type = create_model(original_type.__name__, __base__=original_type)
             cloned_types[original_type] = use_type
             for f in original_type.__fields__.values():
@@ -0,0 +1,48 @@
+"""
+Time per request for a GET route with a 1000 items response, with and without a
+response cache.
+
+Run with: python scripts/benchmarks/cache.py
+"""
+from typing import List
+
+from common import bench, make_scope
+from fastapi import Depends, FastAPI
+from fastapi.caching import CachePolicy
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+
+
+def get_db() -> List[Item]:
+    return [
+        Item(id=index, name=f"item {index}", price=index / 3) for index in range(1000)
+    ]
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/", response_model=List[Item])
+    def read_items(db: List[Item] = Depends(get_db)) -> List[Item]:
+        return db
+
+    @app.get("/cached/", response_model=List[Item], cache=CachePolicy(ttl=None))
+    def read_cached_items(db: List[Item] = Depends(get_db)) -> List[Item]:
+        return db
+
+    return app
+
+
+def main() -> None:
+    app = make_app()
+    bench("1000 items", app, make_scope("/items/"), number=200)
+    bench("1000 items, cached", app, make_scope("/cached/"), number=200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from starlette.types import ASGIApp, Message
+
+
+def make_scope(
+    path: str, method: str = "GET", query_string: bytes = b""
+) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+
+
+async def call_app(
+    app: ASGIApp, scope: Dict[str, Any], body: bytes = b""
+) -> List[Message]:
+    """Send one request through an ASGI app without a network or test client."""
+    messages: List[Message] = []
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if request_sent:
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    assert messages[0]["status"] == 200, messages
+    return messages
+
+
+def bench(
+    name: str,
+    app: ASGIApp,
+    scope: Dict[str, Any],
+    *,
+    number: int = 2000,
+    body: bytes = b"",
+    setup: Optional[Callable[[], None]] = None,
+) -> float:
+    """Print and return the mean seconds per request over `number` requests."""
+
+    async def run() -> float:
+        # Warm up, e.g. to run startup handlers and fill caches
+        await call_app(app, scope, body)
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            await call_app(app, scope, body)
+        return (time.perf_counter() - start) / number
+
+    mean = asyncio.run(run())
+    print(f"{name:<50} {mean * 1_000_000:>10.1f} us/request")
+    return mean
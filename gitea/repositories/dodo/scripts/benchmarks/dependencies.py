@@ -0,0 +1,95 @@
+"""
+Requests per second for routes with deep dependency chains.
+
+Run with: python scripts/benchmarks/dependencies.py
+"""
+import asyncio
+from typing import Any, Callable
+
+from common import bench, make_scope
+from fastapi import Depends, FastAPI
+
+DEPTH = 8
+
+
+def make_chain(depth: int, *, async_: bool) -> Callable[..., Any]:
+    def make_level(parent: Callable[..., Any], level: int) -> Callable[..., Any]:
+        if async_:
+
+            async def dep(value: int = Depends(parent), q: int = 0) -> int:
+                return value + q + level
+
+        else:
+
+            def dep(value: int = Depends(parent), q: int = 0) -> int:  # type: ignore
+                return value + q + level
+
+        return dep
+
+    def root() -> int:
+        return 0
+
+    dep = root
+    for level in range(depth):
+        dep = make_level(dep, level)
+    return dep
+
+
+def make_fan_out(width: int) -> Callable[..., Any]:
+    def make_io(index: int) -> Callable[..., Any]:
+        async def io() -> int:
+            await asyncio.sleep(0.001)
+            return index
+
+        return io
+
+    ios = [make_io(index) for index in range(width)]
+
+    async def fan_out(
+        a: int = Depends(ios[0]),
+        b: int = Depends(ios[1]),
+        c: int = Depends(ios[2]),
+        d: int = Depends(ios[3]),
+    ) -> int:
+        return a + b + c + d
+
+    return fan_out
+
+
+def make_app(**kwargs: Any) -> FastAPI:
+    app = FastAPI(**kwargs)
+    async_chain = make_chain(DEPTH, async_=True)
+    sync_chain = make_chain(DEPTH, async_=False)
+    fan_out = make_fan_out(4)
+
+    @app.get("/async-chain")
+    async def async_chain_route(value: int = Depends(async_chain)) -> int:
+        return value
+
+    @app.get("/sync-chain")
+    async def sync_chain_route(value: int = Depends(sync_chain)) -> int:
+        return value
+
+    @app.get("/fan-out")
+    async def fan_out_route(value: int = Depends(fan_out)) -> int:
+        return value
+
+    return app
+
+
+def main() -> None:
+    app = make_app()
+    concurrent_app = make_app(concurrent_dependencies=True)
+    bench(f"async chain, depth {DEPTH}", app, make_scope("/async-chain"))
+    bench(f"sync chain, depth {DEPTH}", app, make_scope("/sync-chain"), number=500)
+    bench("4 async I/O dependencies", app, make_scope("/fan-out"), number=100)
+    bench(
+        "4 async I/O dependencies, concurrent_dependencies",
+        concurrent_app,
+        make_scope("/fan-out"),
+        number=100,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Time to encode large responses returned without a response_model.
+
+Run with: python scripts/benchmarks/jsonable_encoder.py
+"""
+from datetime import datetime
+from typing import Any, Dict, List
+
+from common import bench, make_scope
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+SIZE = 10_000
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    created: datetime
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    dicts = [
+        {"id": index, "name": f"item {index}", "price": index / 3, "tags": ["a", "b"]}
+        for index in range(SIZE)
+    ]
+    models = [
+        Item(id=index, name=f"item {index}", created=datetime(2022, 1, 1))
+        for index in range(SIZE)
+    ]
+    nested: Dict[str, Any] = {"value": 0}
+    for _ in range(500):
+        nested = {"child": nested, "values": [1, 2, 3]}
+
+    @app.get("/dicts")
+    async def get_dicts() -> List[Dict[str, Any]]:
+        return dicts
+
+    @app.get("/models")
+    async def get_models() -> List[Item]:
+        return models
+
+    @app.get("/nested")
+    async def get_nested() -> Dict[str, Any]:
+        return nested
+
+    return app
+
+
+def main() -> None:
+    app = make_app()
+    bench(f"{SIZE} dicts", app, make_scope("/dicts"), number=20)
+    bench(f"{SIZE} models", app, make_scope("/models"), number=20)
+    bench("dicts nested 500 levels deep", app, make_scope("/nested"), number=200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Requests per second for routes with many simple path, query and header params.
+
+Run with: python scripts/benchmarks/params.py
+"""
+from typing import Optional
+
+from common import bench, make_scope
+from fastapi import FastAPI, Header
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(
+        item_id: int,
+        q: str,
+        skip: int = 0,
+        limit: int = 100,
+        price: float = 0.0,
+        active: bool = True,
+        sort: Optional[str] = None,
+        user_agent: Optional[str] = Header(None),
+    ) -> int:
+        return item_id
+
+    return app
+
+
+def main() -> None:
+    app = make_app()
+    scope = make_scope(
+        "/items/42",
+        query_string=b"q=foo&skip=10&limit=20&price=1.5&active=false&sort=name",
+    )
+    bench("8 simple params", app, scope, number=5000)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Time per request for a route with a sync and an async dependency, with and
+without a profiler.
+
+Run with: python scripts/benchmarks/profiling.py
+"""
+from typing import Optional
+
+from common import bench, make_scope
+from fastapi import Depends, FastAPI
+from fastapi.profiling import Profiler
+
+
+def get_db() -> str:
+    return "db"
+
+
+async def get_user(db: str = Depends(get_db)) -> str:
+    return "user"
+
+
+def make_app(profiler: Optional[Profiler] = None) -> FastAPI:
+    app = FastAPI(profiler=profiler)
+
+    @app.get("/users/{user_id}")
+    def read_user(user_id: int, user: str = Depends(get_user)) -> dict:
+        return {"user_id": user_id, "user": user}
+
+    return app
+
+
+def main() -> None:
+    scope = make_scope("/users/1")
+    bench("without profiler", make_app(), scope)
+    bench("with profiler", make_app(Profiler()), scope)
+
+
+if __name__ == "__main__":
+    main()
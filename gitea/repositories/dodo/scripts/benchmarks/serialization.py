@@ -0,0 +1,91 @@
+"""
+Time to validate and serialize large `List[Model]` responses.
+
+Run with: python scripts/benchmarks/serialization.py
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from common import bench, make_scope
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+SIZE = 10_000
+
+
+class Owner(BaseModel):
+    id: int
+    name: str
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    price: float
+    description: Optional[str] = None
+    created: datetime
+    tags: List[str] = []
+    owner: Owner
+
+
+class TrustedItem(Item):
+    class Config:
+        validate_response = False
+
+
+def make_items(model: type) -> list:
+    owner = Owner(id=1, name="owner")
+    return [
+        model(
+            id=index,
+            name=f"item {index}",
+            price=index / 3,
+            created=datetime(2022, 1, 1),
+            tags=["a", "b"],
+            owner=owner,
+        )
+        for index in range(SIZE)
+    ]
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    items = make_items(Item)
+    trusted_items = make_items(TrustedItem)
+    dict_items = [item.dict() for item in items]
+
+    @app.get("/models", response_model=List[Item])
+    async def models() -> List[Item]:
+        return items
+
+    @app.get("/dicts", response_model=List[Item])
+    async def dicts() -> list:
+        return dict_items
+
+    @app.get("/trusted", response_model=List[TrustedItem])
+    async def trusted() -> List[TrustedItem]:
+        return trusted_items
+
+    @app.get("/orjson", response_model=List[Item], response_class=ORJSONResponse)
+    async def orjson() -> List[Item]:
+        return items
+
+    return app
+
+
+def main() -> None:
+    app = make_app()
+    bench(f"{SIZE} models", app, make_scope("/models"), number=5)
+    bench(f"{SIZE} dicts", app, make_scope("/dicts"), number=5)
+    bench(
+        f"{SIZE} models, validate_response = False",
+        app,
+        make_scope("/trusted"),
+        number=5,
+    )
+    bench(f"{SIZE} models, ORJSONResponse", app, make_scope("/orjson"), number=5)
+
+
+if __name__ == "__main__":
+    main()
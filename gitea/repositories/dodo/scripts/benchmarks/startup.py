@@ -0,0 +1,76 @@
+"""
+Time to create an app with 800 routes, defined in 40 routers included with a
+prefix, with eager and lazy route compilation. And the time of the first request
+to a lazy route, when it's compiled.
+
+Run with: python scripts/benchmarks/startup.py
+"""
+import asyncio
+import time
+from typing import List, Optional
+
+from common import call_app, make_scope
+from fastapi import APIRouter, Depends, FastAPI, Header, Query
+from pydantic import BaseModel
+
+routers = 40
+routes_per_router = 10
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: List[str] = []
+
+
+class ItemIn(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+def get_token(x_token: str = Header("")) -> str:
+    return x_token
+
+
+def make_router(lazy: bool) -> APIRouter:
+    router = APIRouter(lazy_routes=lazy)
+    for route in range(routes_per_router):
+
+        @router.get(f"/items{route}/{{item_id}}", response_model=Item)
+        def read_item(
+            item_id: int,
+            q: Optional[str] = Query(None, max_length=50),
+            token: str = Depends(get_token),
+        ) -> Item:
+            return Item(id=item_id, name="item")
+
+        @router.post(f"/items{route}/", response_model=Item)
+        def create_item(item: ItemIn, token: str = Depends(get_token)) -> Item:
+            return Item(id=1, **item.dict())
+
+    return router
+
+
+def make_app(lazy: bool) -> FastAPI:
+    app = FastAPI(lazy_routes=lazy)
+    for index in range(routers):
+        app.include_router(make_router(lazy), prefix=f"/api{index}")
+    return app
+
+
+def main() -> None:
+    for lazy in (False, True):
+        start = time.perf_counter()
+        app = make_app(lazy)
+        elapsed = time.perf_counter() - start
+        name = "lazy" if lazy else "eager"
+        print(f"{name + ' startup':<50} {elapsed * 1000:>10.1f} ms")
+    scope = make_scope("/api0/items0/1")
+    start = time.perf_counter()
+    asyncio.run(call_app(app, scope))
+    elapsed = time.perf_counter() - start
+    print(f"{'lazy first request':<50} {elapsed * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import json
+from typing import AsyncIterator, List
+
+import pytest
+from fastapi import Body, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+app = FastAPI()
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+@app.post("/items/")
+async def create_items(items: AsyncIterator[Item] = Body(..., stream=True)):
+    names = []
+    async for item in items:
+        assert isinstance(item, Item)
+        names.append(item.name)
+    return names
+
+
+@app.post("/items/optional")
+async def create_items_optional(items: AsyncIterator[Item] = Body(None, stream=True)):
+    if items is None:
+        return None
+    return [item.name async for item in items]
+
+
+client = TestClient(app)
+
+
+def chunked(content: bytes, size: int):
+    for index in range(0, len(content), size):
+        yield content[index : index + size]
+
+
+def test_items():
+    items = [{"name": f"item {index}", "price": index / 3} for index in range(100)]
+    response = client.post("/items/", json=items)
+    assert response.status_code == 200, response.text
+    assert response.json() == [item["name"] for item in items]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_split_in_chunks(size):
+    content = ' [ {"name": "fö\\u00f6", "price": 1234.5e-1} ,{"name":"b"}\n] '
+    response = client.post("/items/", data=chunked(content.encode(), size))
+    assert response.status_code == 200, response.text
+    assert response.json() == ["föö", "b"]
+
+
+def test_empty_array():
+    response = client.post("/items/", data=b"[ ]")
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+def test_missing():
+    response = client.post("/items/")
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body"]
+    assert response.json()["detail"][0]["type"] == "value_error.missing"
+    response = client.post("/items/optional")
+    assert response.status_code == 200, response.text
+    assert response.json() is None
+
+
+def test_not_an_array():
+    response = client.post("/items/", json={"name": "foo"})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"] == [
+        {"loc": ["body"], "msg": "value is not a valid list", "type": "type_error.list"}
+    ]
+    response = client.post(
+        "/items/", data=b"[]", headers={"Content-Type": "text/plain"}
+    )
+    assert response.status_code == 422, response.text
+
+
+def test_invalid_item():
+    response = client.post("/items/", json=[{"name": "foo"}, {"price": "cheap"}])
+    assert response.status_code == 422, response.text
+    locs = [error["loc"] for error in response.json()["detail"]]
+    assert locs == [["body", 1, "name"], ["body", 1, "price"]]
+
+
+@pytest.mark.parametrize(
+    "content,pos",
+    [
+        (b'[{"name": "foo"}, {"name": ', 27),
+        (b'[{"name": "foo"} {"name": "bar"}]', 17),
+        (b'[{"name": "foo"},]', 17),
+        (b'[{"name": "foo"}] x', 18),
+        (b'[{"name": "foo', 10),
+    ],
+)
+def test_invalid_json(content, pos):
+    response = client.post("/items/", data=chunked(content, 4))
+    assert response.status_code == 422, response.text
+    (error,) = response.json()["detail"]
+    assert error["loc"] == ["body", pos]
+    assert error["type"] == "value_error.jsondecode"
+
+
+def test_invalid_json_far_from_the_end():
+    content = b'[{"name": "foo" "bar"}, ' + b'{"name": "foo"}, ' * 1000
+    response = client.post("/items/", data=chunked(content, 64))
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", 16]
+
+
+def test_large_item_in_small_chunks():
+    items = [{"name": "x" * 100_000}, {"name": "y"}]
+    response = client.post("/items/", data=chunked(json.dumps(items).encode(), 10))
+    assert response.status_code == 200, response.text
+    assert response.json() == ["x" * 100_000, "y"]
+
+
+def test_openapi_schema():
+    schema = app.openapi()
+    request_body = schema["paths"]["/items/"]["post"]["requestBody"]
+    assert request_body["content"]["application/json"]["schema"] == {
+        "title": "Items",
+        "type": "array",
+        "items": {"$ref": "#/components/schemas/Item"},
+    }
+
+
+def test_must_be_async_iterator():
+    with pytest.raises(AssertionError):
+
+        @app.post("/invalid")
+        async def invalid(items: List[Item] = Body(..., stream=True)):
+            pass  # pragma: no cover
+
+
+def test_must_be_only_body_param():
+    with pytest.raises(AssertionError):
+
+        @app.post("/invalid")
+        async def invalid(
+            items: AsyncIterator[Item] = Body(..., stream=True),
+            other: Item = Body(...),
+        ):
+            pass  # pragma: no cover
@@ -0,0 +1,119 @@
+from typing import List
+
+import anyio
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+app = FastAPI(concurrent_dependencies=True)
+sequential_app = FastAPI()
+
+calls: List[str] = []
+
+
+class Rendezvous:
+    def __init__(self) -> None:
+        self.first = anyio.Event()
+        self.second = anyio.Event()
+
+
+async def dep_rendezvous() -> Rendezvous:
+    return Rendezvous()
+
+
+async def dep_first(rendezvous: Rendezvous = Depends(dep_rendezvous)):
+    # Waits for dep_second, which would never start if run sequentially
+    calls.append("first")
+    rendezvous.first.set()
+    with anyio.fail_after(1):
+        await rendezvous.second.wait()
+    return "first"
+
+
+async def dep_second(rendezvous: Rendezvous = Depends(dep_rendezvous)):
+    calls.append("second")
+    rendezvous.second.set()
+    with anyio.fail_after(1):
+        await rendezvous.first.wait()
+    return "second"
+
+
+async def dep_both(
+    first: str = Depends(dep_first), second: str = Depends(dep_second)
+) -> str:
+    calls.append("both")
+    return f"{first}-{second}"
+
+
+def dep_sync() -> str:
+    calls.append("sync")
+    return "sync"
+
+
+async def dep_query(q: int) -> int:
+    calls.append("query")
+    return q
+
+
+async def dep_fail() -> None:
+    raise HTTPException(status_code=418, detail="teapot")
+
+
+@app.get("/concurrent/")
+async def get_concurrent(both: str = Depends(dep_both), sync: str = Depends(dep_sync)):
+    return {"both": both, "sync": sync}
+
+
+@app.get("/errors/")
+async def get_errors(query: int = Depends(dep_query), second: str = Depends(dep_sync)):
+    return {"query": query}  # pragma: no cover
+
+
+@app.get("/fail/")
+async def get_fail(fail: None = Depends(dep_fail), sync: str = Depends(dep_sync)):
+    return {}  # pragma: no cover
+
+
+@sequential_app.get("/order/")
+async def get_order(sync: str = Depends(dep_sync), query: int = Depends(dep_query)):
+    return {"calls": calls}
+
+
+client = TestClient(app)
+sequential_client = TestClient(sequential_app)
+
+
+def test_independent_dependencies_run_concurrently():
+    calls.clear()
+    response = client.get("/concurrent/")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"both": "first-second", "sync": "sync"}
+    assert calls.index("both") == 3
+
+
+def test_concurrent_validation_errors():
+    calls.clear()
+    response = client.get("/errors/")
+    assert response.status_code == 422, response.text
+    assert response.json() == {
+        "detail": [
+            {
+                "loc": ["query", "q"],
+                "msg": "field required",
+                "type": "value_error.missing",
+            }
+        ]
+    }
+    assert calls == ["sync"]
+
+
+def test_concurrent_dependency_exception():
+    response = client.get("/fail/")
+    assert response.status_code == 418, response.text
+    assert response.json() == {"detail": "teapot"}
+
+
+def test_sequential_dependencies_keep_declaration_order():
+    calls.clear()
+    response = sequential_client.get("/order/?q=2")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"calls": ["sync", "query"]}
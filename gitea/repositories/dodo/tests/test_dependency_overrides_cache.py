@@ -0,0 +1,93 @@
+from fastapi import Depends, FastAPI
+from fastapi.dependencies import utils
+from fastapi.testclient import TestClient
+
+app = FastAPI()
+
+
+def get_tenant() -> str:
+    return "default"
+
+
+def get_tenant_a(q: str = "a") -> str:
+    return q
+
+
+def get_tenant_b() -> str:
+    return "b"
+
+
+@app.get("/tenant/")
+def read_tenant(tenant: str = Depends(get_tenant)):
+    return {"tenant": tenant}
+
+
+client = TestClient(app)
+
+
+def test_override_dependant_is_reused(monkeypatch):
+    calls = []
+    get_dependant = utils.get_dependant
+
+    def counting_get_dependant(**kwargs):
+        calls.append(kwargs["call"])
+        return get_dependant(**kwargs)
+
+    monkeypatch.setattr(utils, "get_dependant", counting_get_dependant)
+    app.dependency_overrides[get_tenant] = get_tenant_a
+    for _ in range(3):
+        response = client.get("/tenant/")
+        assert response.json() == {"tenant": "a"}
+    response = client.get("/tenant/?q=other")
+    assert response.json() == {"tenant": "other"}
+    assert calls == [get_tenant_a]
+    app.dependency_overrides = {}
+
+
+def test_override_cache_invalidated_on_mutation():
+    app.dependency_overrides[get_tenant] = get_tenant_a
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    app.dependency_overrides[get_tenant] = get_tenant_b
+    assert client.get("/tenant/").json() == {"tenant": "b"}
+    app.dependency_overrides.update({get_tenant: get_tenant_a})
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    app.dependency_overrides.pop(get_tenant)
+    assert client.get("/tenant/").json() == {"tenant": "default"}
+    app.dependency_overrides.setdefault(get_tenant, get_tenant_b)
+    assert client.get("/tenant/").json() == {"tenant": "b"}
+    del app.dependency_overrides[get_tenant]
+    assert client.get("/tenant/").json() == {"tenant": "default"}
+    app.dependency_overrides = {get_tenant: get_tenant_a}
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    app.dependency_overrides.clear()
+    assert client.get("/tenant/").json() == {"tenant": "default"}
+    app.dependency_overrides[get_tenant] = get_tenant_b
+    app.dependency_overrides.popitem()
+    assert client.get("/tenant/").json() == {"tenant": "default"}
+    app.dependency_overrides = {}
+
+
+def test_assigned_dict_modified_directly():
+    overrides = {get_tenant: get_tenant_a}
+    app.dependency_overrides = overrides
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    overrides[get_tenant] = get_tenant_b
+    assert app.dependency_overrides[get_tenant] is get_tenant_b
+    assert client.get("/tenant/").json() == {"tenant": "b"}
+    overrides.clear()
+    assert client.get("/tenant/").json() == {"tenant": "default"}
+    overrides[get_tenant] = get_tenant_a
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    app.dependency_overrides = {}
+
+
+def test_overrides_saved_and_restored_with_copy():
+    assert isinstance(app.dependency_overrides, dict)
+    app.dependency_overrides[get_tenant] = get_tenant_a
+    saved = app.dependency_overrides.copy()
+    assert saved == {get_tenant: get_tenant_a}
+    app.dependency_overrides[get_tenant] = get_tenant_b
+    assert client.get("/tenant/").json() == {"tenant": "b"}
+    app.dependency_overrides = saved
+    assert client.get("/tenant/").json() == {"tenant": "a"}
+    app.dependency_overrides = {}
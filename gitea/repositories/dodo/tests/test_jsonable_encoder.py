@@ -187,3 +187,34 @@ def test_encode_model_with_path(model_with_path):
 def test_encode_root():
     model = ModelWithRoot(__root__="Foo")
     assert jsonable_encoder(model) == "Foo"
+
+
+def test_encode_deeply_nested():
+    obj = {"value": 0}
+    for _ in range(5000):
+        obj = {"child": [obj]}
+    encoded = jsonable_encoder(obj)
+    for _ in range(5000):
+        encoded = encoded["child"][0]
+    assert encoded == {"value": 0}
+
+
+def test_encode_duplicate_keys_last_wins():
+    class MyEnum(Enum):
+        foo = "foo"
+
+    obj = {MyEnum.foo: {"a": 1}, "foo": "bar", "baz": 1}
+    assert jsonable_encoder(obj) == {"foo": "bar", "baz": 1}
+    assert list(jsonable_encoder(obj)) == ["foo", "baz"]
+
+
+def test_custom_encoder_not_added_to_model_config():
+    class MyModel(BaseModel):
+        value: int
+
+        class Config:
+            json_encoders = {}
+
+    jsonable_encoder(MyModel(value=1), custom_encoder={int: str})
+    assert MyModel.__config__.json_encoders == {}
+    assert jsonable_encoder(MyModel(value=1)) == {"value": 1}
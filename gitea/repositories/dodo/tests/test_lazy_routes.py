@@ -0,0 +1,148 @@
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import fastapi.utils
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.exceptions import FastAPIError
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    name: str
+
+
+class NonPydanticModel:
+    pass
+
+
+router = APIRouter(lazy_routes=True)
+
+
+@router.get("/items/{item_id}", response_model=Item)
+def read_item(item_id: int):
+    return {"name": f"item {item_id}"}
+
+
+@router.get("/users/", response_model=Item)
+def read_users():
+    return {"name": "user"}
+
+
+def is_compiled(route):
+    return "app" in vars(route)
+
+
+def test_compiled_on_first_request():
+    app = FastAPI(lazy_routes=True)
+    app.include_router(router, prefix="/api")
+    item_route, users_route = app.routes[-2:]
+    assert not is_compiled(item_route)
+    client = TestClient(app)
+    response = client.get("/api/items/1")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "item 1"}
+    assert is_compiled(item_route)
+    assert not is_compiled(users_route)
+    # The routes of the included router are never used
+    assert not any(is_compiled(route) for route in router.routes)
+
+
+def test_compiled_for_openapi():
+    app = FastAPI(lazy_routes=True)
+    app.include_router(router)
+    schema = app.openapi()
+    assert "/items/{item_id}" in schema["paths"]
+    assert all(is_compiled(route) for route in app.router.routes[-2:])
+
+
+def test_compiled_on_startup():
+    app = FastAPI(lazy_routes=True, compile_routes_on_startup=True)
+    app.include_router(router)
+    with TestClient(app):
+        for thread in threading.enumerate():
+            if thread.name == "routes":
+                thread.join()
+        assert all(is_compiled(route) for route in app.router.routes[-2:])
+
+
+def test_invalid_response_model_raises_on_use():
+    app = FastAPI(lazy_routes=True)
+
+    @app.get("/", response_model=NonPydanticModel)
+    def read_root():
+        pass  # pragma: nocover
+
+    with pytest.raises(FastAPIError):
+        app.router.compile_routes()
+
+
+def test_cloned_models_shared():
+    app = FastAPI()
+    app.include_router(router)
+    item_route, users_route = app.routes[-2:]
+    assert (
+        item_route.secure_cloned_response_field.type_
+        is users_route.secure_cloned_response_field.type_
+    )
+    assert item_route.secure_cloned_response_field.type_ is not Item
+
+
+class Node(BaseModel):
+    name: str
+    edges: "List[Edge]" = []
+
+
+class Edge(BaseModel):
+    target: Optional[Node] = None
+
+
+Node.update_forward_refs()
+
+
+def test_cloned_models_cache_bounded(monkeypatch):
+    monkeypatch.setattr(fastapi.utils, "_cloned_types_cache", OrderedDict())
+    monkeypatch.setattr(fastapi.utils, "_cloned_types_cache_size", 1)
+    app = FastAPI()
+
+    # Recursive models with more types than the cache can hold
+    @app.get("/nodes/", response_model=Node)
+    def read_node():
+        return {"name": "a", "edges": [{"target": {"name": "b"}}]}
+
+    @app.get("/items/", response_model=Item)
+    def read_item():
+        return {"name": "item"}
+
+    assert list(fastapi.utils._cloned_types_cache) == [Item]
+    client = TestClient(app)
+    response = client.get("/nodes/")
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "name": "a",
+        "edges": [{"target": {"name": "b", "edges": []}}],
+    }
+
+
+class Other(BaseModel):
+    name: str
+
+
+class Third(BaseModel):
+    name: str
+
+
+def test_cloned_models_cache_least_recently_used(monkeypatch):
+    monkeypatch.setattr(fastapi.utils, "_cloned_types_cache", OrderedDict())
+    monkeypatch.setattr(fastapi.utils, "_cloned_types_cache_size", 2)
+    app = FastAPI()
+    app.get("/items/", response_model=Item)(read_item)
+    app.get("/other/", response_model=Other)(read_item)
+    cloned_item = fastapi.utils._cloned_types_cache[Item]
+    # Reused, so it's now the most recently used
+    app.get("/items/again", response_model=Item)(read_item)
+    assert app.routes[-1].secure_cloned_response_field.type_ is cloned_item
+    app.get("/third/", response_model=Third)(read_item)
+    assert list(fastapi.utils._cloned_types_cache) == [Item, Third]
@@ -0,0 +1,181 @@
+import gzip
+import os
+import subprocess
+import sys
+import uuid
+from typing import List, Set
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.utils import get_openapi_fingerprint
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    tags: Set[str] = {"a", "b", "c"}
+
+
+def make_app(**kwargs) -> FastAPI:
+    app = FastAPI(**kwargs)
+
+    @app.get("/items/", response_model=List[Item])
+    def read_items():
+        return []  # pragma: no cover
+
+    @app.post("/items/", response_model=Item)
+    def create_item(item: Item):
+        return item  # pragma: no cover
+
+    return app
+
+
+def fingerprint(app: FastAPI) -> str:
+    return get_openapi_fingerprint(
+        title=app.title, version=app.version, routes=app.routes
+    )
+
+
+def test_etag_and_not_modified():
+    app = make_app()
+    client = TestClient(app)
+    response = client.get("/openapi.json")
+    assert response.status_code == 200, response.text
+    assert response.json() == app.openapi()
+    etag = response.headers["etag"]
+    response = client.get("/openapi.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    response = client.get(
+        "/openapi.json", headers={"If-None-Match": f'"other", W/{etag}'}
+    )
+    assert response.status_code == 304
+    response = client.get("/openapi.json", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_gzip():
+    app = make_app()
+    body, gzip_body, etag = app.openapi_body()
+    assert gzip_body is not None
+    assert gzip.decompress(gzip_body) == body
+    client = TestClient(app)
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == app.openapi()
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.content == body
+
+
+def test_gzip_middleware_not_compressed_twice():
+    app = make_app()
+    app.add_middleware(GZipMiddleware)
+    client = TestClient(app)
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200, response.text
+    assert response.json() == app.openapi()
+    assert app.openapi_body()[1] is None
+
+
+def test_body_encoded_once():
+    app = make_app()
+    first = app.openapi_body()
+    assert app.openapi_body()[0] is first[0]
+    app.openapi_schema = None
+    assert app.openapi_body()[0] is not first[0]
+    assert app.openapi_body() == first
+
+
+def test_fingerprint():
+    assert fingerprint(make_app()) == fingerprint(make_app())
+    assert fingerprint(make_app()) != fingerprint(make_app(title="Other"))
+
+    class OtherItem(BaseModel):
+        name: str
+        price: int
+
+    app = FastAPI()
+
+    @app.post("/items/")
+    def create_item(item: OtherItem):
+        pass  # pragma: no cover
+
+    assert fingerprint(app) != fingerprint(make_app())
+
+
+def test_fingerprint_same_in_other_processes():
+    code = (
+        "from tests.test_openapi_cache import fingerprint, make_app;"
+        "print(fingerprint(make_app()))"
+    )
+    fingerprints = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout.strip()
+        for seed in (1, 2)
+    }
+    assert fingerprints == {fingerprint(make_app()).encode()}
+
+
+def test_cache_dir(tmp_path):
+    app = make_app(openapi_cache_dir=tmp_path)
+    schema = app.openapi()
+    (name,) = os.listdir(tmp_path)
+    assert name.startswith("openapi-")
+    path = tmp_path / name
+    body = path.read_bytes()
+    assert app.openapi_body()[0] == body
+
+    other_app = make_app(openapi_cache_dir=tmp_path)
+    # Loaded from the file instead of generated
+    path.write_bytes(body.replace(b"Read Items", b"From Cache"))
+    other_schema = other_app.openapi()
+    assert other_schema["paths"]["/items/"]["get"]["summary"] == "From Cache"
+    assert other_schema["info"] == schema["info"]
+
+
+def test_cache_dir_pruned(tmp_path):
+    make_app(openapi_cache_dir=tmp_path, version="1").openapi()
+    (old_name,) = os.listdir(tmp_path)
+    (tmp_path / "other.json").write_text("{}")
+    make_app(openapi_cache_dir=tmp_path, version="2").openapi()
+    names = os.listdir(tmp_path)
+    assert len(names) == 2
+    assert old_name not in names
+    assert "other.json" in names
+
+
+def test_cache_dir_invalid_file(tmp_path):
+    make_app(openapi_cache_dir=tmp_path).openapi()
+    (name,) = os.listdir(tmp_path)
+    path = tmp_path / name
+    path.write_text("{")
+    app = make_app(openapi_cache_dir=tmp_path)
+    assert app.openapi() == make_app().openapi()
+    assert path.read_bytes() == make_app().openapi_body()[0]
+
+
+def test_cache_dir_keeps_servers_shared(tmp_path):
+    make_app(openapi_cache_dir=tmp_path, servers=[{"url": "/"}]).openapi()
+    app = make_app(openapi_cache_dir=tmp_path, servers=[{"url": "/"}])
+    client = TestClient(app, root_path="/api")
+    response = client.get("/openapi.json")
+    assert response.json()["servers"] == [{"url": "/api"}, {"url": "/"}]
+
+
+def test_generate_on_startup():
+    app = make_app(generate_openapi_on_startup=True)
+    with TestClient(app) as client:
+        response = client.get("/openapi.json")
+        assert response.status_code == 200, response.text
+        assert response.json() == make_app().openapi()
@@ -0,0 +1,93 @@
+import inspect
+from typing import List, Optional
+
+import pytest
+from fastapi import Query
+from fastapi.dependencies.utils import (
+    extract_params,
+    get_param_extractor,
+    get_param_field,
+)
+from starlette.datastructures import QueryParams
+
+
+def make_extractor(annotation, default=inspect.Parameter.empty):
+    param = inspect.Parameter(
+        "p",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=annotation,
+        default=default,
+    )
+    field = get_param_field(param=param, param_name="p", default_field_info=Query)
+    return get_param_extractor(field)
+
+
+def validate(extractor, value):
+    v_, errors_ = extractor.field.validate(value, {}, loc=extractor.loc)
+    return (v_, None) if errors_ is None else (None, errors_)
+
+
+values = [
+    "0",
+    "42",
+    " 42 ",
+    "-7",
+    "1_000",
+    "4.5",
+    "1e3",
+    "nan",
+    "-inf",
+    "",
+    "abc",
+    "true",
+    "False",
+    "YES",
+    "off",
+    "t",
+    "2",
+    "1" * 5000,
+]
+
+
+@pytest.mark.parametrize("annotation", [int, float, bool, str, Optional[int]])
+@pytest.mark.parametrize("value", values)
+def test_converted_same_as_validated(annotation, value):
+    extractor = make_extractor(annotation)
+    assert extractor.convert is not None
+    expected, expected_error = validate(extractor, value)
+    result, errors = extract_params([extractor], QueryParams({"p": value}))
+    if expected_error is None:
+        assert errors == []
+        assert result["p"] == expected or (result["p"] != result["p"])
+        assert type(result["p"]) is type(expected)
+    else:
+        assert result == {}
+        assert [e.exc.__class__ for e in errors] == [expected_error.exc.__class__]
+
+
+def test_constrained_not_converted():
+    extractor = make_extractor(int, Query(..., gt=1))
+    assert extractor.convert is None
+    result, errors = extract_params([extractor], QueryParams({"p": "1"}))
+    assert result == {}
+    assert len(errors) == 1
+
+
+def test_sequence():
+    extractor = make_extractor(List[int], Query([]))
+    assert extractor.is_sequence
+    result, errors = extract_params([extractor], QueryParams([("p", "1"), ("p", "2")]))
+    assert result == {"p": [1, 2]}
+    assert errors == []
+
+
+def test_defaults():
+    immutable = make_extractor(Optional[int], None)
+    assert not immutable.copy_default
+    assert extract_params([immutable], QueryParams()) == ({"p": None}, [])
+    default = ["a"]
+    mutable = make_extractor(List[str], Query(default))
+    assert mutable.copy_default
+    result, errors = extract_params([mutable], QueryParams())
+    assert result == {"p": ["a"]}
+    assert result["p"] is not default
@@ -0,0 +1,112 @@
+from time import sleep
+
+from fastapi import Depends, FastAPI
+from fastapi.profiling import Histogram, Profiler
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+profiler = Profiler()
+app = FastAPI(profiler=profiler, profiler_url="/_profiler")
+
+
+class Item(BaseModel):
+    name: str
+
+
+def get_db():
+    sleep(0.01)
+    return "db"
+
+
+async def get_user(db: str = Depends(get_db)):
+    return "user"
+
+
+@app.post("/items/{item_id}", response_model=Item)
+def create_item(item: Item, item_id: int, user: str = Depends(get_user)):
+    sleep(0.02)
+    return item
+
+
+@app.get("/users/me")
+async def read_me(user: str = Depends(get_user)):
+    return {"user": user}
+
+
+client = TestClient(app)
+
+
+def setup_function():
+    profiler.reset()
+
+
+def test_routes():
+    response = client.post("/items/1", json={"name": "foo"})
+    assert response.status_code == 200, response.text
+    assert client.get("/users/me").json() == {"user": "user"}
+    statistics = client.get("/_profiler").json()
+    assert set(statistics["routes"]) == {"POST /items/{item_id}", "GET /users/me"}
+    phases = statistics["routes"]["POST /items/{item_id}"]
+    assert set(phases) == {
+        "total",
+        "body",
+        "dependencies",
+        "endpoint",
+        "serialize",
+        "threadpool_wait",
+    }
+    assert phases["total"]["count"] == 1
+    assert phases["endpoint"]["sum"] >= 0.02
+    assert phases["dependencies"]["sum"] >= 0.01
+    assert phases["endpoint"]["sum"] < phases["total"]["sum"]
+    assert phases["threadpool_wait"]["count"] == 1
+
+
+def test_dependencies():
+    client.get("/users/me")
+    client.get("/users/me")
+    dependencies = profiler.statistics()["dependencies"]
+    assert set(dependencies) == {
+        "tests.test_profiling.get_db",
+        "tests.test_profiling.get_user",
+    }
+    assert dependencies["tests.test_profiling.get_db"]["count"] == 2
+    assert dependencies["tests.test_profiling.get_db"]["sum"] >= 0.02
+
+
+def test_validation_error():
+    response = client.post("/items/foo", json={"name": "foo"})
+    assert response.status_code == 422, response.text
+    phases = profiler.statistics()["routes"]["POST /items/{item_id}"]
+    assert phases["total"]["count"] == 1
+    assert "endpoint" not in phases
+
+
+def test_disabled():
+    plain_app = FastAPI()
+
+    @plain_app.get("/")
+    def read_root():
+        return "root"
+
+    assert TestClient(plain_app).get("/").json() == "root"
+    assert profiler.statistics() == {"routes": {}, "dependencies": {}}
+
+
+def test_histogram():
+    histogram = Histogram()
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.5)
+    statistics = histogram.to_dict()
+    assert statistics["count"] == 100
+    assert statistics["max"] == 0.5
+    assert statistics["mean"] == statistics["sum"] / 100
+    assert 0.001 <= statistics["p50"] < 0.002
+    assert statistics["p90"] == statistics["p50"]
+    assert statistics["p99"] == 0.5
+    assert [count for _, count in statistics["buckets"]] == [90, 10]
+    histogram.record(1000)
+    assert histogram.to_dict()["buckets"][-1] == [None, 1]
+    assert histogram.quantile(1) == 1000
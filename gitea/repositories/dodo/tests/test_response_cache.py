@@ -0,0 +1,263 @@
+import anyio
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Response
+from fastapi.caching import CachePolicy, InMemoryCacheBackend, RedisCacheBackend
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+calls = []
+
+
+def get_user(x_user: str = Header("anonymous")):
+    return x_user
+
+
+items_cache = CachePolicy(ttl=60, namespace="items")
+user_cache = CachePolicy(vary_on=[Depends(get_user)], vary_headers=["Accept-Language"])
+
+app = FastAPI()
+router = APIRouter()
+
+
+@router.get("/items/{item_id}", cache=items_cache)
+def read_item(item_id: int, q: str = ""):
+    calls.append(item_id)
+    return {"item_id": item_id, "q": q, "call": len(calls)}
+
+
+@router.get("/me", cache=user_cache)
+async def read_me(user: str = Depends(get_user)):
+    calls.append(user)
+    return {"user": user, "call": len(calls)}
+
+
+@router.get("/missing", cache=items_cache)
+def read_missing(response: Response):
+    calls.append("missing")
+    response.status_code = 404
+    return {"call": len(calls)}
+
+
+def check_token(x_token: str = Header("")):
+    if x_token != "secret":
+        raise HTTPException(status_code=401)
+
+
+@router.get("/protected", cache=items_cache, dependencies=[Depends(check_token)])
+def read_protected():
+    calls.append("protected")
+    return {"secret": True}
+
+
+@router.head("/both", cache=items_cache)
+def head_both():
+    calls.append("head")
+    return Response(headers={"x-head": "1"})
+
+
+@router.get("/both", cache=items_cache)
+def read_both():
+    calls.append("get")
+    return {"call": len(calls)}
+
+
+@router.get("/stream", cache=items_cache)
+def read_stream():
+    calls.append("stream")
+    return StreamingResponse(iter([b"a", b"b"]))
+
+
+def set_request_headers(response: Response, x_status: int = Header(0)):
+    response.headers["x-request"] = str(len(calls))
+    response.set_cookie("seen", str(len(calls)))
+    if x_status:
+        response.status_code = x_status
+
+
+@router.get("/headers", cache=items_cache, dependencies=[Depends(set_request_headers)])
+def read_headers(response: Response):
+    calls.append("headers")
+    response.headers["x-endpoint"] = str(len(calls))
+    return {"call": len(calls)}
+
+
+app.include_router(router)
+client = TestClient(app)
+
+
+def setup_function():
+    calls.clear()
+
+
+def test_cached():
+    response = client.get("/items/1", params={"q": "a"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"item_id": 1, "q": "a", "call": 1}
+    etag = response.headers["etag"]
+    response = client.get("/items/1", params={"q": "a"})
+    assert response.json() == {"item_id": 1, "q": "a", "call": 1}
+    assert response.headers["etag"] == etag
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(response.content))
+    assert calls == [1]
+    response = client.get("/items/1", params={"q": "b"})
+    assert response.json() == {"item_id": 1, "q": "b", "call": 2}
+    response = client.get("/items/2", params={"q": "a"})
+    assert response.json() == {"item_id": 2, "q": "a", "call": 3}
+
+
+def test_query_order():
+    client.get("/items/3?q=a&x=1")
+    response = client.get("/items/3?x=1&q=a")
+    assert response.json()["call"] == 1
+
+
+def test_not_modified():
+    etag = client.get("/items/4").headers["etag"]
+    response = client.get("/items/4", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert calls == [4]
+
+
+def test_invalidate():
+    client.get("/items/5")
+    anyio.run(items_cache.invalidate)
+    response = client.get("/items/5")
+    assert response.json()["call"] == 2
+
+
+def test_vary():
+    assert client.get("/me", headers={"X-User": "a"}).json()["call"] == 1
+    assert client.get("/me", headers={"X-User": "a"}).json()["call"] == 1
+    assert client.get("/me", headers={"X-User": "b"}).json()["call"] == 2
+    response = client.get("/me", headers={"X-User": "a", "Accept-Language": "fr"})
+    assert response.json()["call"] == 3
+    assert response.headers["vary"] == "accept-language"
+    assert calls == ["a", "b", "a"]
+
+
+def test_vary_merged():
+    vary_app = FastAPI()
+
+    @vary_app.get("/", cache=CachePolicy(vary_headers=["Accept-Language"]))
+    def read_root(response: Response):
+        response.headers["vary"] = "Origin"
+        return {}
+
+    response = TestClient(vary_app).get("/")
+    assert response.headers["vary"] == "Origin, accept-language"
+
+
+def test_dependencies_solved_on_hit():
+    assert client.get("/protected").status_code == 401
+    response = client.get("/protected", headers={"X-Token": "secret"})
+    assert response.json() == {"secret": True}
+    assert client.get("/protected").status_code == 401
+    response = client.get("/protected", headers={"X-Token": "secret"})
+    assert response.json() == {"secret": True}
+    assert calls == ["protected"]
+
+
+def test_dependency_headers_on_hit():
+    response = client.get("/headers")
+    assert response.json() == {"call": 1}
+    assert response.headers["x-request"] == "0"
+    assert response.headers["x-endpoint"] == "1"
+    assert response.cookies["seen"] == "0"
+    calls.append("other")
+    response = client.get("/headers")
+    assert response.json() == {"call": 1}
+    # Set again by the dependencies, the endpoint's are the cached ones
+    assert response.headers["x-request"] == "2"
+    assert response.headers["x-endpoint"] == "1"
+    assert response.cookies["seen"] == "2"
+    response = client.get("/headers", headers={"X-Status": "202"})
+    assert response.status_code == 202
+    assert response.json() == {"call": 1}
+    assert calls == ["headers", "other"]
+
+
+def test_method_in_key():
+    assert client.head("/both").headers["x-head"] == "1"
+    response = client.get("/both")
+    assert response.json() == {"call": 2}
+    assert "x-head" not in response.headers
+    assert client.head("/both").headers["x-head"] == "1"
+    assert calls == ["head", "get"]
+
+
+def test_not_cacheable():
+    assert client.get("/missing").status_code == 404
+    assert client.get("/missing").json()["call"] == 2
+    assert client.get("/stream").content == b"ab"
+    assert client.get("/stream").content == b"ab"
+    assert calls == ["missing", "missing", "stream", "stream"]
+
+
+def test_in_memory_backend():
+    backend = InMemoryCacheBackend(max_entries=2)
+
+    async def main():
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        assert await backend.get("a") == b"1"
+        await backend.set("c", b"3")
+        # b was the least recently used
+        assert await backend.get("b") is None
+        assert await backend.get("a") == b"1"
+        await backend.set("d", b"4", ttl=0)
+        assert await backend.get("d") is None
+        assert await backend.incr("counter") == 1
+        assert await backend.incr("counter") == 2
+        assert await backend.get("counter") == b"2"
+        await backend.delete("a")
+        assert await backend.get("a") is None
+
+    anyio.run(main)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+        self.expires[key] = px
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+
+def test_redis_backend():
+    redis = FakeRedis()
+    redis_app = FastAPI()
+
+    @redis_app.get("/", cache=CachePolicy(ttl=1.5, backend=RedisCacheBackend(redis)))
+    def read_root():
+        calls.append("root")
+        return calls
+
+    redis_client = TestClient(redis_app)
+    assert redis_client.get("/").json() == ["root"]
+    assert redis_client.get("/").json() == ["root"]
+    assert list(redis.expires.values()) == [1500]
+
+
+def test_openapi():
+    operation = app.openapi()["paths"]["/items/{item_id}"]["get"]
+    assert operation["responses"]["200"]["headers"] == {
+        "ETag": {
+            "description": "Validator of the cached response",
+            "schema": {"type": "string"},
+        }
+    }
+    assert operation["responses"]["304"] == {"description": "Not Modified"}
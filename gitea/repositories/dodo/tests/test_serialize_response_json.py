@@ -0,0 +1,161 @@
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+app = FastAPI()
+
+
+class Color(Enum):
+    red = "red"
+
+
+class Item(BaseModel):
+    name: str
+    created: datetime
+    color: Color
+    tags: Dict[Any, Any] = {}
+
+
+class TrustedItem(BaseModel):
+    name: str
+    price: float
+
+    class Config:
+        validate_response = False
+
+
+class TrustedItemInDB(TrustedItem):
+    secret: str
+
+
+class SampleItem(BaseModel):
+    sample: str = Field(..., alias="_sample")
+    extra: Dict[str, Any] = {}
+
+
+def custom_dumps(content: Any, *, default: Any) -> str:
+    return json.dumps({"custom": content}, default=default)
+
+
+class CustomDumpsItem(BaseModel):
+    name: str
+
+    class Config:
+        json_dumps = custom_dumps
+
+
+item = Item(
+    name="föo",
+    created=datetime(2022, 1, 2, 3, 4, 5),
+    color=Color.red,
+    tags={"a": [1, 2.5, None], 1: "int key"},
+)
+
+
+@app.get("/items/", response_model=List[Item])
+def get_items():
+    return [item, item]
+
+
+@app.get("/items/uuid-keys", response_model=Item)
+def get_item_uuid_keys():
+    return item.copy(update={"tags": {UUID(int=1): "uuid key"}})
+
+
+@app.get("/items/orjson", response_model=Item, response_class=ORJSONResponse)
+def get_item_orjson():
+    return item.copy(update={"tags": {}})
+
+
+@app.get("/trusted/", response_model=List[TrustedItem])
+def get_trusted():
+    # Not valid, but trusted so it's not validated again
+    return [TrustedItem.construct(name="foo", price="cheap")]
+
+
+@app.get("/trusted/subclass", response_model=TrustedItem)
+def get_trusted_subclass():
+    return TrustedItemInDB(name="foo", price=1, secret="hunter2")
+
+
+@app.get("/custom-dumps", response_model=CustomDumpsItem)
+def get_custom_dumps():
+    return {"name": "foo"}
+
+
+@app.get("/sample", response_model=List[SampleItem])
+def get_sample():
+    return [
+        SampleItem(_sample="foo", extra={"nested": {"_sa_instance_state": 1, "a": 2}})
+    ]
+
+
+client = TestClient(app)
+
+
+def render(content: Any) -> bytes:
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def test_list_same_body_as_jsonable_encoder():
+    response = client.get("/items/")
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == render([item, item])
+
+
+def test_fallback_to_jsonable_encoder():
+    response = client.get("/items/uuid-keys")
+    assert response.status_code == 200, response.text
+    assert response.json()["tags"] == {
+        "00000000-0000-0000-0000-000000000001": "uuid key"
+    }
+
+
+def test_other_response_class():
+    response = client.get("/items/orjson")
+    assert response.status_code == 200, response.text
+    assert response.json() == jsonable_encoder(item.copy(update={"tags": {}}))
+
+
+def test_trusted_model_not_validated():
+    response = client.get("/trusted/")
+    assert response.status_code == 200, response.text
+    assert response.json() == [{"name": "foo", "price": "cheap"}]
+
+
+def test_trusted_model_subclass_validated():
+    response = client.get("/trusted/subclass")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "price": 1.0}
+
+
+def test_model_json_dumps_not_used():
+    response = client.get("/custom-dumps")
+    assert response.status_code == 200, response.text
+    # Same body as JSONResponse, the model's json_dumps is only for .json()
+    assert response.json() == {"name": "foo"}
+
+
+def test_sqlalchemy_keys_dropped():
+    response = client.get("/sample")
+    assert response.status_code == 200, response.text
+    # Same as jsonable_encoder(): "_sa" keys are dropped, even by-alias names
+    assert response.json() == [{"extra": {"nested": {"a": 2}}}]
+    assert response.content == render(
+        [SampleItem(_sample="foo", extra={"nested": {"_sa_instance_state": 1, "a": 2}})]
+    )
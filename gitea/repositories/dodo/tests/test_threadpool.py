@@ -0,0 +1,220 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import anyio
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.concurrency import Threadpool, contextmanager_in_threadpool
+from fastapi.exceptions import HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+queue_waits = []
+threadpool = Threadpool(max_workers=4, on_queue_wait=queue_waits.append)
+app = FastAPI(threadpool=threadpool)
+
+threads = {}
+
+
+class Item(BaseModel):
+    name: str
+
+
+def dep_a():
+    threads["a"] = threading.get_ident()
+    return "a"
+
+
+def dep_b(a: str = Depends(dep_a), q: str = "b"):
+    threads["b"] = threading.get_ident()
+    return a + q
+
+
+async def dep_async(b: str = Depends(dep_b)):
+    return b
+
+
+def dep_c(value: str = Depends(dep_async)):
+    threads["c"] = threading.get_ident()
+    return value + "c"
+
+
+def dep_gen():
+    threads["gen"] = threading.get_ident()
+    yield "gen"
+
+
+@app.get("/sync", response_model=Item)
+def get_sync(value: str = Depends(dep_b)):
+    threads["endpoint"] = threading.get_ident()
+    return {"name": value}
+
+
+@app.get("/mixed")
+def get_mixed(value: str = Depends(dep_c)):
+    return value
+
+
+@app.get("/gen")
+async def get_gen(value: str = Depends(dep_gen)):
+    return value
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_threadpool():
+    threads.clear()
+    queue_waits.clear()
+    threadpool.calls = 0
+    threadpool.queue_wait_total = 0.0
+    threadpool.queue_wait_max = 0.0
+
+
+def test_sync_dependencies_batched():
+    response = client.get("/sync", params={"q": "!"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "a!"}
+    assert threads["a"] == threads["b"]
+    # One hop for the dependencies, one for the endpoint and its response
+    stats = threadpool.statistics()
+    assert stats.calls == 2
+    assert stats.max_workers == 4
+    assert stats.busy == 0
+    assert stats.waiting == 0
+    assert len(queue_waits) == 2
+    assert stats.queue_wait_total == pytest.approx(sum(queue_waits))
+    assert stats.queue_wait_max == max(queue_waits)
+
+
+def test_async_dependency_splits_batch():
+    response = client.get("/mixed")
+    assert response.status_code == 200, response.text
+    assert response.json() == "abc"
+    assert threadpool.statistics().calls == 3
+
+
+def test_generator_dependency_uses_app_threadpool():
+    response = client.get("/gen")
+    assert response.status_code == 200, response.text
+    assert response.json() == "gen"
+    # Enter and exit
+    assert threadpool.statistics().calls == 2
+
+
+def test_max_queue():
+    threadpool = Threadpool(max_workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait()
+        return "done"
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(threadpool.run, block)
+            while not started.is_set():
+                await anyio.sleep(0.001)
+            try:
+                assert threadpool.statistics().busy == 1
+                with pytest.raises(HTTPException) as exc_info:
+                    await threadpool.run(block)
+                assert exc_info.value.status_code == 503
+            finally:
+                release.set()
+
+    anyio.run(main)
+    stats = threadpool.statistics()
+    assert stats.rejected == 1
+    assert stats.calls == 1
+    assert stats.busy == 0
+
+
+def test_max_queue_teardown_not_rejected():
+    threadpool = Threadpool(max_workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+    cleaned_up = []
+
+    def block():
+        started.set()
+        release.wait()
+
+    @contextmanager
+    def session():
+        yield "session"
+        cleaned_up.append(True)
+
+    async def release_later():
+        await anyio.sleep(0.05)
+        release.set()
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            try:
+                async with contextmanager_in_threadpool(session(), threadpool):
+                    tg.start_soon(threadpool.run, block)
+                    while not started.is_set():
+                        await anyio.sleep(0.001)
+                    tg.start_soon(release_later)
+            finally:
+                release.set()
+            # The exit waited for the busy worker instead of being rejected
+            assert cleaned_up == [True]
+
+    anyio.run(main)
+    assert threadpool.statistics().rejected == 0
+
+
+def test_limiter_per_event_loop():
+    threadpool = Threadpool(max_workers=1)
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(threadpool.run, threading.Event().wait, 0.01)
+        return threadpool.limiter
+
+    first = anyio.run(main)
+    second = anyio.run(main)
+    assert first is not second
+    assert threadpool.statistics().calls == 6
+
+
+request_id: ContextVar[str] = ContextVar("request_id", default="unset")
+context_app = FastAPI(threadpool=Threadpool(max_workers=4))
+
+
+@context_app.middleware("http")
+async def set_request_id(request: Request, call_next):
+    request_id.set("from middleware")
+    return await call_next(request)
+
+
+def dep_reads_request_id():
+    value = request_id.get()
+    request_id.set("from dependency")
+    return value
+
+
+def dep_reads_request_id_again(first: str = Depends(dep_reads_request_id)):
+    # Batched in the same thread, but must not see the value set by the other
+    return request_id.get()
+
+
+@context_app.get("/context")
+def get_context(
+    first: str = Depends(dep_reads_request_id),
+    second: str = Depends(dep_reads_request_id_again),
+):
+    return [first, second, request_id.get()]
+
+
+def test_contextvars_copied_to_threads():
+    response = TestClient(context_app).get("/context")
+    assert response.status_code == 200, response.text
+    assert response.json() == ["from middleware"] * 3
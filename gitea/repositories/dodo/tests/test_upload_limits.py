@@ -0,0 +1,133 @@
+import gc
+from typing import AsyncIterator, List
+
+import anyio
+import pytest
+from fastapi import FastAPI, File, Form, UploadFile
+from fastapi.formparsers import UploadSpool
+from fastapi.testclient import TestClient
+
+spool = UploadSpool(spool_max_size=100, memory_limit=150)
+app = FastAPI(max_form_size=200_000, upload_spool=spool)
+
+in_memory = []
+
+
+@app.post("/files/")
+async def create_file(
+    file: UploadFile = File(..., max_size=1000), name: str = Form("", max_size=10)
+):
+    in_memory.append(file._in_memory)
+    return {"name": name, "size": len(await file.read())}
+
+
+@app.post("/files/bytes")
+def create_files_bytes(files: List[bytes] = File(..., max_size=1000)):
+    return [len(file) for file in files]
+
+
+@app.post("/files/stream")
+async def create_file_stream(file: AsyncIterator[bytes] = File(..., stream=True)):
+    sizes = []
+    async for chunk in file:
+        sizes.append(len(chunk))
+    return sizes
+
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def release_uploads():
+    yield
+    in_memory.clear()
+    gc.collect()
+    assert spool.memory_used == 0
+
+
+def test_within_limits():
+    response = client.post(
+        "/files/", files={"file": ("a.txt", b"x" * 50)}, data={"name": "foo"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "foo", "size": 50}
+    assert in_memory == [True]
+
+
+def test_spooled_to_disk():
+    response = client.post("/files/", files={"file": ("a.txt", b"x" * 500)})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"name": "", "size": 500}
+    assert in_memory == [False]
+
+
+def test_file_too_large():
+    response = client.post("/files/", files={"file": ("a.txt", b"x" * 1001)})
+    assert response.status_code == 413, response.text
+    assert response.json() == {"detail": "Form field 'file' too large"}
+
+
+def test_form_field_too_large():
+    response = client.post(
+        "/files/", files={"file": ("a.txt", b"x")}, data={"name": "x" * 11}
+    )
+    assert response.status_code == 413, response.text
+    assert response.json() == {"detail": "Form field 'name' too large"}
+
+
+def test_request_too_large():
+    response = client.post("/files/", files={"file": ("a.txt", b"x" * 300_000)})
+    assert response.status_code == 413, response.text
+    assert response.json() == {"detail": "Request body too large"}
+
+
+def test_bytes_sequence():
+    response = client.post(
+        "/files/bytes",
+        files=[("files", ("a.txt", b"x" * 10)), ("files", ("b.txt", b"y" * 200))],
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == [10, 200]
+
+
+def test_stream():
+    response = client.post("/files/stream", files={"file": ("a.txt", b"x" * 100_000)})
+    assert response.status_code == 200, response.text
+    assert response.json() == [65536, 100_000 - 65536]
+
+
+def test_stream_not_a_file():
+    response = client.post("/files/stream", data={"file": "foo"})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["body", "file"]
+
+
+def test_memory_limit():
+    memory_spool = UploadSpool(spool_max_size=100, memory_limit=150)
+
+    async def main():
+        first = memory_spool.create_file("a.txt")
+        second = memory_spool.create_file("b.txt")
+        await first.write(b"x" * 90)
+        await second.write(b"y" * 50)
+        assert memory_spool.memory_used == 140
+        # Over the memory limit, rolled over to disk before its spool_max_size
+        await second.write(b"y" * 20)
+        assert not second._in_memory
+        assert memory_spool.memory_used == 90
+        await first.write(b"x" * 20)
+        assert not first._in_memory
+        assert memory_spool.memory_used == 0
+        await first.seek(0)
+        assert await first.read() == b"x" * 110
+        await second.seek(0)
+        assert await second.read() == b"y" * 70
+        third = memory_spool.create_file("c.txt")
+        await third.write(b"z" * 10)
+        assert memory_spool.memory_used == 10
+        await third.close()
+        assert memory_spool.memory_used == 0
+        await first.close()
+        await second.close()
+
+    anyio.run(main)
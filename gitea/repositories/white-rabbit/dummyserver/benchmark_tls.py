@@ -0,0 +1,101 @@
+"""Time and CPU spent by the client to set up new HTTPS connections to the dummyserver.
+
+Each request is sent on a new connection, as the server closes it after responding. The CA
+certificates of certifi, if it is installed, are added to the dummyserver CA to get a bundle of
+a realistic size.
+
+Run with: python -m dummyserver.benchmark_tls [number of connections]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Tuple
+
+from tornado import ioloop, web
+
+from dummyserver.handlers import TestingApp
+from dummyserver.server import (
+    DEFAULT_CA,
+    DEFAULT_CERTS,
+    run_loop_in_thread,
+    run_tornado_app,
+)
+from urllib3 import HTTPSConnectionPool, connection
+
+HOST = "localhost"
+
+
+def write_ca_bundle(path: str) -> None:
+    with open(path, "wb") as bundle:
+        try:
+            import certifi
+        except ImportError:
+            pass
+        else:
+            with open(certifi.where(), "rb") as f:
+                shutil.copyfileobj(f, bundle)
+        with open(DEFAULT_CA, "rb") as f:
+            shutil.copyfileobj(f, bundle)
+
+
+def new_pool_without_cache(port: int, ca_certs: str) -> HTTPSConnectionPool:
+    # As if each connection created and loaded its own SSLContext
+    connection._default_ssl_contexts.clear()
+    return HTTPSConnectionPool(HOST, port, ca_certs=ca_certs)
+
+
+def new_pool(port: int, ca_certs: str) -> HTTPSConnectionPool:
+    return HTTPSConnectionPool(HOST, port, ca_certs=ca_certs)
+
+
+def run(
+    port: int, number: int, get_pool: Callable[[], HTTPSConnectionPool]
+) -> Tuple[float, float, int]:
+    resumed = 0
+    start, start_cpu = time.perf_counter(), time.thread_time()
+    for _ in range(number):
+        pool = get_pool()
+        conn = pool._get_conn()
+        conn.request("GET", "/", headers={"Connection": "close"})
+        resumed += conn.sock.session_reused  # type: ignore[union-attr]
+        conn.getresponse().read()
+        conn.close()
+        pool._put_conn(conn)
+    elapsed, cpu = time.perf_counter() - start, time.thread_time() - start_cpu
+    return elapsed / number, cpu / number, resumed
+
+
+def main(number: int = 500) -> None:
+    io_loop = ioloop.IOLoop.current()
+    app = web.Application([(r".*", TestingApp)])
+    server, port = run_tornado_app(app, io_loop, DEFAULT_CERTS, "https", HOST)
+    server_thread = run_loop_in_thread(io_loop)
+
+    directory = tempfile.mkdtemp()
+    ca_certs = os.path.join(directory, "bundle.pem")
+    write_ca_bundle(ca_certs)
+
+    shared_pool = new_pool(port, ca_certs)
+    configs = [
+        ("SSLContext per connection", lambda: new_pool_without_cache(port, ca_certs)),
+        ("shared SSLContext", lambda: new_pool(port, ca_certs)),
+        ("shared SSLContext + resumption", lambda: shared_pool),
+    ]
+    try:
+        for name, get_pool in configs:
+            elapsed, cpu, resumed = run(port, number, get_pool)
+            print(
+                f"{name:32} {elapsed * 1000:6.2f} ms/conn  {cpu * 1000:6.2f} ms CPU/conn"
+                f"  {resumed}/{number} resumed"
+            )
+    finally:
+        io_loop.add_callback(server.stop)
+        io_loop.add_callback(io_loop.stop)
+        server_thread.join()
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -15,6 +15,7 @@ from typing import (
     Callable,
     Iterable,
     Mapping,
+    MutableMapping,
     NamedTuple,
     Optional,
     Tuple,
@@ -40,6 +41,7 @@ except (ImportError, AttributeError):  # Platform-specific: No SSL.
         pass
 
 
+from ._collections import RecentlyUsedContainer
 from ._version import __version__
 from .exceptions import (
     ConnectTimeoutError,
@@ -51,6 +53,7 @@ from .exceptions import (
 from .util import SKIP_HEADER, SKIPPABLE_HEADERS, connection, ssl_
 from .util.ssl_ import (
     _TYPE_PEER_CERT_RET,
+    _load_ssl_context_certs,
     assert_fingerprint,
     create_urllib3_context,
     resolve_cert_reqs,
@@ -76,6 +79,15 @@ _CONTAINS_CONTROL_CHAR_RE = re.compile(r"[^-!#$%&'*+.^_`|~0-9a-zA-Z]")
 
 
 _TYPE_BODY = Union[bytes, IO[Any], Iterable[bytes], str]
+_TYPE_TLS_SESSIONS = MutableMapping[
+    Tuple[str, Optional[int]], Tuple["ssl.SSLContext", "ssl.SSLSession"]
+]
+
+# The default SSLContexts with their certificates loaded, shared by the connections
+# with the same TLS settings so that the CA certificates are only parsed once.
+_default_ssl_contexts: RecentlyUsedContainer[
+    Tuple[Any, ...], "ssl.SSLContext"
+] = RecentlyUsedContainer(16)
 
 
 class ProxyConfig(NamedTuple):
@@ -119,6 +131,10 @@ class HTTPConnection(_HTTPConnection):
     #: Whether this connection verifies the host's certificate.
     is_verified: bool = False
 
+    #: When the connection was last put back in its pool, as given by
+    #: :func:`time.monotonic`.
+    released_at: Optional[float] = None
+
     source_address: Optional[Tuple[str, int]]
     socket_options: Optional[connection._TYPE_SOCKET_OPTIONS]
     _tunnel_host: Optional[str]
@@ -365,6 +381,11 @@ class HTTPSConnection(HTTPConnection):
     assert_fingerprint: Optional[str] = None
     tls_in_tls_required: bool = False
 
+    #: The last TLS session of each ``(server_hostname, port)``, along with its
+    #: SSLContext, which new sockets try to resume. Shared by the connections of a pool.
+    tls_sessions: Optional[_TYPE_TLS_SESSIONS] = None
+    _tls_session_key: Optional[Tuple[str, Optional[int]]] = None
+
     def __init__(
         self,
         host: str,
@@ -442,6 +463,7 @@ class HTTPSConnection(HTTPConnection):
         # Add certificate verification
         conn = self._new_conn()
         hostname: str = self.host
+        port = self.port
         tls_in_tls = False
 
         if self._is_using_tunnel():
@@ -462,6 +484,7 @@ class HTTPSConnection(HTTPConnection):
             hostname = cast(
                 str, self._tunnel_host
             )  # self._tunnel_host is not None, because self._is_using_tunnel() returned a truthy value.
+            port = self._tunnel_port  # type: ignore[attr-defined]
 
         server_hostname = hostname
         if self.server_hostname is not None:
@@ -477,55 +500,38 @@ class HTTPSConnection(HTTPConnection):
                 SystemTimeWarning,
             )
 
+        # Sessions are only saved for reuse once the certificate is verified
+        self._tls_session_key = None
+        tls_session_key = (server_hostname, port)
+
         # Wrap socket using verification with the root certs in
         # trusted_root_certs
-        default_ssl_context = False
         if self.ssl_context is None:
-            default_ssl_context = True
-            self.ssl_context = create_urllib3_context(
-                ssl_version=resolve_ssl_version(self.ssl_version),
-                ssl_minimum_version=self.ssl_minimum_version,
-                ssl_maximum_version=self.ssl_maximum_version,
-                cert_reqs=resolve_cert_reqs(self.cert_reqs),
+            # The shared default context already has the certificates loaded
+            context = self._get_default_ssl_context()
+            self.sock = ssl_wrap_socket(
+                sock=conn,
+                server_hostname=server_hostname,
+                ssl_context=context,
+                tls_in_tls=tls_in_tls,
+                session=self._get_tls_session(context, tls_session_key),
+            )
+        else:
+            context = self.ssl_context
+            context.verify_mode = resolve_cert_reqs(self.cert_reqs)
+            self.sock = ssl_wrap_socket(
+                sock=conn,
+                keyfile=self.key_file,
+                certfile=self.cert_file,
+                key_password=self.key_password,
+                ca_certs=self.ca_certs,
+                ca_cert_dir=self.ca_cert_dir,
+                ca_cert_data=self.ca_cert_data,
+                server_hostname=server_hostname,
+                ssl_context=context,
+                tls_in_tls=tls_in_tls,
+                session=self._get_tls_session(context, tls_session_key),
             )
-            # In some cases, we want to verify hostnames ourselves
-            if (
-                # `ssl` can't verify fingerprints or alternate hostnames
-                self.assert_fingerprint
-                or self.assert_hostname
-                # We still support OpenSSL 1.0.2, which prevents us from verifying
-                # hostnames easily: https://github.com/pyca/pyopenssl/pull/933
-                or ssl_.IS_PYOPENSSL
-                or not ssl_.HAS_NEVER_CHECK_COMMON_NAME
-            ):
-                self.ssl_context.check_hostname = False
-
-        context = self.ssl_context
-        context.verify_mode = resolve_cert_reqs(self.cert_reqs)
-
-        # Try to load OS default certs if none are given.
-        # Works well on Windows.
-        if (
-            not self.ca_certs
-            and not self.ca_cert_dir
-            and not self.ca_cert_data
-            and default_ssl_context
-            and hasattr(context, "load_default_certs")
-        ):
-            context.load_default_certs()
-
-        self.sock = ssl_wrap_socket(
-            sock=conn,
-            keyfile=self.key_file,
-            certfile=self.cert_file,
-            key_password=self.key_password,
-            ca_certs=self.ca_certs,
-            ca_cert_dir=self.ca_cert_dir,
-            ca_cert_data=self.ca_cert_data,
-            server_hostname=server_hostname,
-            ssl_context=context,
-            tls_in_tls=tls_in_tls,
-        )
         self._connecting_to_proxy = False
 
         if self.assert_fingerprint:
@@ -544,6 +550,95 @@ class HTTPSConnection(HTTPConnection):
             self.assert_fingerprint
         )
 
+        if not self.tls_in_tls_required:
+            self._tls_session_key = tls_session_key
+            self._save_tls_session()
+
+    def close(self) -> None:
+        # With TLS 1.3 the session tickets are only received after the handshake
+        self._save_tls_session()
+        super().close()
+
+    def _get_default_ssl_context(self) -> "ssl.SSLContext":
+        """
+        Returns the SSLContext shared by the connections with the same TLS
+        settings, creating it and loading its certificates on first use.
+        """
+        # In some cases, we want to verify hostnames ourselves
+        check_hostname = not (
+            # `ssl` can't verify fingerprints or alternate hostnames
+            self.assert_fingerprint
+            or self.assert_hostname
+            # We still support OpenSSL 1.0.2, which prevents us from verifying
+            # hostnames easily: https://github.com/pyca/pyopenssl/pull/933
+            or ssl_.IS_PYOPENSSL
+            or not ssl_.HAS_NEVER_CHECK_COMMON_NAME
+        )
+        cert_reqs = resolve_cert_reqs(self.cert_reqs)
+        # The files are identified by their modification time as well,
+        # so that new certificates are loaded once they are updated.
+        key = (
+            resolve_ssl_version(self.ssl_version),
+            self.ssl_minimum_version,
+            self.ssl_maximum_version,
+            cert_reqs,
+            check_hostname,
+            _file_identity(self.ca_certs),
+            self.ca_cert_dir,
+            self.ca_cert_data,
+            _file_identity(self.cert_file),
+            _file_identity(self.key_file),
+            self.key_password,
+        )
+
+        with _default_ssl_contexts.lock:
+            context = _default_ssl_contexts.get(key)
+            if context is None:
+                context = create_urllib3_context(
+                    ssl_version=resolve_ssl_version(self.ssl_version),
+                    ssl_minimum_version=self.ssl_minimum_version,
+                    ssl_maximum_version=self.ssl_maximum_version,
+                    cert_reqs=cert_reqs,
+                )
+                if not check_hostname:
+                    context.check_hostname = False
+                context.verify_mode = cert_reqs
+
+                # Try to load OS default certs if none are given.
+                # Works well on Windows.
+                _load_ssl_context_certs(
+                    context,
+                    keyfile=self.key_file,
+                    certfile=self.cert_file,
+                    key_password=self.key_password,
+                    ca_certs=self.ca_certs,
+                    ca_cert_dir=self.ca_cert_dir,
+                    ca_cert_data=self.ca_cert_data,
+                    load_default_certs=True,
+                )
+                _default_ssl_contexts[key] = context
+
+        return context
+
+    def _get_tls_session(
+        self, context: "ssl.SSLContext", key: Tuple[str, Optional[int]]
+    ) -> Optional["ssl.SSLSession"]:
+        # SSLTransport and the contrib modules can't resume sessions
+        if self.tls_sessions is None or self.tls_in_tls_required:
+            return None
+
+        saved = self.tls_sessions.get(key)
+        if saved is None or saved[0] is not context:
+            return None
+        return saved[1]
+
+    def _save_tls_session(self) -> None:
+        if self._tls_session_key is None or self.tls_sessions is None:
+            return
+        session = getattr(self.sock, "session", None)
+        if session is not None:
+            self.tls_sessions[self._tls_session_key] = (self.sock.context, session)
+
     def _connect_tls_proxy(self, hostname: str, conn: socket.socket) -> "ssl.SSLSocket":
         """
         Establish a TLS connection to the proxy using the provided SSL context.
@@ -583,6 +678,17 @@ class HTTPSConnection(HTTPConnection):
         )
 
 
+def _file_identity(path: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Loading the file raises the error, nothing is cached
+        return (path, 0, 0)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
 def _match_hostname(cert: _TYPE_PEER_CERT_RET, asserted_hostname: str) -> None:
     try:
         match_hostname(cert, asserted_hostname)
@@ -2,15 +2,18 @@ import errno
 import logging
 import queue
 import sys
+import time
 import warnings
 from http.client import HTTPResponse as _HttplibHTTPResponse
 from socket import timeout as SocketTimeout
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Mapping, Optional, Type, TypeVar, Union, overload
 
+from ._collections import RecentlyUsedContainer
 from ._request_methods import RequestMethods
 from .connection import (
     _TYPE_BODY,
+    _TYPE_TLS_SESSIONS,
     BaseSSLError,
     BrokenPipeError,
     DummyConnection,
@@ -152,6 +155,18 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
     :param retries:
         Retry configuration to use by default with requests in this pool.
 
+    :param idle_timeout:
+        Number of seconds after which a connection which stayed unused in the
+        pool is closed instead of being reused, so that connections likely to
+        have been closed by the server are not tried. ``None`` (the default)
+        means connections are kept until they are found to be dropped.
+
+    :param liveness_check_after:
+        Connections put back in the pool less than this number of seconds
+        ago are reused without checking whether they were dropped, which
+        saves a ``poll()`` system call for each request made in a row. It
+        defaults to ``0`` which means connections are always checked.
+
     :param _proxy:
         Parsed proxy URL, should not be used directly, instead, see
         :class:`urllib3.ProxyManager`
@@ -181,6 +196,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         _proxy: Optional[Url] = None,
         _proxy_headers: Optional[Mapping[str, str]] = None,
         _proxy_config: Optional[ProxyConfig] = None,
+        idle_timeout: Optional[float] = None,
+        liveness_check_after: float = 0.0,
         **conn_kw: Any,
     ):
         ConnectionPool.__init__(self, host, port)
@@ -197,6 +214,8 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         self.pool: Optional[queue.LifoQueue[Any]] = self.QueueCls(maxsize)
         self.block = block
+        self.idle_timeout = idle_timeout
+        self.liveness_check_after = liveness_check_after
 
         self.proxy = _proxy
         self.proxy_headers = _proxy_headers or {}
@@ -209,6 +228,12 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         # These are mostly for testing and debugging purposes.
         self.num_connections = 0
         self.num_requests = 0
+        # Connections taken from the pool, how many times it was empty so that
+        # the caller had to wait, and connections closed instead of being reused.
+        # Not synchronized, counts may be slightly off when shared by threads.
+        self.num_checkouts = 0
+        self.num_waits = 0
+        self.num_discarded = 0
         self.conn_kw = conn_kw
 
         if self.proxy:
@@ -257,8 +282,16 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
         if self.pool is None:
             raise ClosedPoolError(self, "Pool is closed.")
 
+        self.num_checkouts += 1
+
         try:
-            conn = self.pool.get(block=self.block, timeout=timeout)
+            try:
+                conn = self.pool.get(block=False)
+            except queue.Empty:
+                if not self.block:
+                    raise
+                self.num_waits += 1
+                conn = self.pool.get(block=True, timeout=timeout)
 
         except AttributeError:  # self.pool is None
             raise ClosedPoolError(self, "Pool is closed.") from None  # Defensive:
@@ -271,18 +304,71 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
                 ) from None
             pass  # Oh well, we'll create a new connection then
 
-        # If this is a persistent connection, check if it got disconnected
-        if conn and is_connection_dropped(conn):
-            log.debug("Resetting dropped connection: %s", self.host)
-            conn.close()
-            if getattr(conn, "auto_open", 1) == 0:
-                # This is a proxied connection that has been mutated by
-                # http.client._tunnel() and cannot be reused (since it would
-                # attempt to bypass the proxy)
-                conn = None
+        if conn:
+            idle_time = (
+                time.monotonic() - conn.released_at
+                if conn.released_at is not None
+                else None
+            )
+
+            if (
+                idle_time is not None
+                and self.idle_timeout is not None
+                and idle_time > self.idle_timeout
+            ):
+                log.debug("Closing idle connection: %s", self.host)
+                conn = self._reset_conn(conn)
+                # The ones released before it have been idle even longer
+                self._close_idle_conns()
+
+            # If this is a persistent connection, check if it got disconnected.
+            # The poll is skipped if it was put back in the pool a moment ago.
+            elif (
+                conn.sock is None
+                or idle_time is None
+                or idle_time >= self.liveness_check_after
+            ) and is_connection_dropped(conn):
+                log.debug("Resetting dropped connection: %s", self.host)
+                conn = self._reset_conn(conn)
 
         return conn or self._new_conn()
 
+    def _close_idle_conns(self) -> None:
+        """
+        Close the pooled connections idle for longer than :attr:`.idle_timeout`,
+        leaving their slots empty.
+        """
+        pool = self.pool
+        if pool is None or self.idle_timeout is None:
+            return
+        expired = []
+        now = time.monotonic()
+        with pool.mutex:
+            for i, conn in enumerate(pool.queue):
+                if (
+                    conn
+                    and conn.released_at is not None
+                    and now - conn.released_at > self.idle_timeout
+                ):
+                    expired.append(conn)
+                    pool.queue[i] = None
+        for conn in expired:
+            log.debug("Closing idle connection: %s", self.host)
+            self._reset_conn(conn)
+
+    def _reset_conn(self, conn: HTTPConnection) -> Optional[HTTPConnection]:
+        """
+        Close a pooled connection, returning it if it can be opened again.
+        """
+        self.num_discarded += 1
+        conn.close()
+        if getattr(conn, "auto_open", 1) == 0:
+            # This is a proxied connection that has been mutated by
+            # http.client._tunnel() and cannot be reused (since it would
+            # attempt to bypass the proxy)
+            return None
+        return conn
+
     def _put_conn(self, conn: Optional[HTTPConnection]) -> None:
         """
         Put a connection back into the pool.
@@ -297,6 +383,9 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         If the pool is closed, then the connection will be closed and discarded.
         """
+        if conn:
+            conn.released_at = time.monotonic()
+
         if self.pool is not None:
             try:
                 self.pool.put(conn, block=False)
@@ -323,6 +412,7 @@ class HTTPConnectionPool(ConnectionPool, RequestMethods):
 
         # Connection never got put back into the pool, close it.
         if conn:
+            self.num_discarded += 1
             conn.close()
 
     def _validate_conn(self, conn: HTTPConnection) -> None:
@@ -967,6 +1057,8 @@ class HTTPSConnectionPool(HTTPConnectionPool):
         self.ssl_maximum_version = ssl_maximum_version
         self.assert_hostname = assert_hostname
         self.assert_fingerprint = assert_fingerprint
+        # The last TLS sessions, so that new connections resume them
+        self._tls_sessions: _TYPE_TLS_SESSIONS = RecentlyUsedContainer(8)
 
     def _prepare_conn(self, conn: HTTPSConnection) -> HTTPConnection:
         """
@@ -988,6 +1080,7 @@ class HTTPSConnectionPool(HTTPConnectionPool):
             conn.ssl_version = self.ssl_version
             conn.ssl_minimum_version = self.ssl_minimum_version
             conn.ssl_maximum_version = self.ssl_maximum_version
+            conn.tls_sessions = self._tls_sessions
 
         return conn
 
@@ -99,6 +99,8 @@ class PoolKey(NamedTuple):
     key_assert_fingerprint: Optional[str]
     key_server_hostname: Optional[str]
     key_blocksize: Optional[int]
+    key_idle_timeout: Optional[float]
+    key_liveness_check_after: Optional[float]
 
 
 def _default_key_normalizer(
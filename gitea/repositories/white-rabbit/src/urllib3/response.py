@@ -1,3 +1,4 @@
+import collections
 import io
 import json as _json
 import logging
@@ -9,6 +10,7 @@ from socket import timeout as SocketTimeout
 from typing import (
     TYPE_CHECKING,
     Any,
+    Deque,
     Generator,
     Iterator,
     List,
@@ -51,6 +53,11 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Size of the compressed slices given to the decoder when the decoded size is
+# limited. Deflate expands at most ~1032:1, so a slice can't produce more than
+# about 16 MiB.
+DECOMPRESS_SLICE_SIZE = 2**14
+
 
 class ContentDecoder:
     def decompress(self, data: bytes) -> bytes:
@@ -182,6 +189,81 @@ def _get_decoder(mode: str) -> ContentDecoder:
     return DeflateDecoder()
 
 
+def _split_chunk(data: bytes, amt: Optional[int]) -> Iterator[bytes]:
+    """
+    Yields ``data`` in slices of at most ``amt`` bytes, nothing if it's empty.
+    """
+    if not amt or len(data) <= amt:
+        if data:
+            yield data
+        return
+    for start in range(0, len(data), amt):
+        yield data[start : start + amt]
+
+
+class BytesQueueBuffer:
+    """
+    Queue of bytes chunks used to return exactly the amount of decoded data
+    that was asked for, keeping the surplus of a decoded chunk for the next read.
+
+    Chunks are only copied when they have to be split or joined, a chunk of
+    the requested size is returned as is.
+    """
+
+    def __init__(self) -> None:
+        self.buffer: Deque[bytes] = collections.deque()
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, data: bytes) -> None:
+        if data:
+            self.buffer.append(data)
+            self._size += len(data)
+
+    def get(self, n: int) -> bytes:
+        """
+        Remove and return up to ``n`` bytes from the start of the buffer.
+        """
+        if n < 0:
+            raise ValueError("n should be >= 0")
+        n = min(n, self._size)
+        if n == 0:
+            return b""
+
+        first = self.buffer[0]
+        if len(first) == n:
+            self.buffer.popleft()
+            self._size -= n
+            return first
+
+        ret = bytearray(n)
+        self._copy_into(memoryview(ret))
+        return bytes(ret)
+
+    def get_into(self, b: memoryview) -> int:
+        """
+        Remove up to ``len(b)`` bytes from the start of the buffer and copy them
+        into ``b``, returns the number of bytes copied.
+        """
+        n = min(len(b), self._size)
+        self._copy_into(b[:n])
+        return n
+
+    def _copy_into(self, b: memoryview) -> None:
+        offset = 0
+        n = len(b)
+        while offset < n:
+            chunk = self.buffer.popleft()
+            size = min(len(chunk), n - offset)
+            b[offset : offset + size] = memoryview(chunk)[:size]
+            if size < len(chunk):
+                self.buffer.appendleft(chunk[size:])
+            offset += size
+        self._size -= n
+
+
 class BaseHTTPResponse(io.IOBase):
     CONTENT_DECODERS = ["gzip", "deflate"]
     if brotli is not None:
@@ -202,6 +284,7 @@ class BaseHTTPResponse(io.IOBase):
         decode_content: bool,
         request_url: Optional[str],
         retries: Optional[Retry] = None,
+        max_decoded_size: Optional[int] = None,
     ) -> None:
         if isinstance(headers, HTTPHeaderDict):
             self.headers = headers
@@ -222,6 +305,9 @@ class BaseHTTPResponse(io.IOBase):
             self.chunked = True
 
         self._decoder: Optional[ContentDecoder] = None
+        self._decoded_buffer = BytesQueueBuffer()
+        self.max_decoded_size = max_decoded_size
+        self._decoded_size = 0
 
     def get_redirect_location(self) -> Union[Optional[str], "Literal[False]"]:
         """
@@ -323,7 +409,10 @@ class BaseHTTPResponse(io.IOBase):
 
         try:
             if self._decoder:
-                data = self._decoder.decompress(data)
+                if self.max_decoded_size is None:
+                    data = self._decoder.decompress(data)
+                else:
+                    data = self._decompress_limited(data)
         except self.DECODER_ERROR_CLASSES as e:
             content_encoding = self.headers.get("content-encoding", "").lower()
             raise DecodeError(
@@ -336,13 +425,41 @@ class BaseHTTPResponse(io.IOBase):
 
         return data
 
+    def _decompress_limited(self, data: bytes) -> bytes:
+        """
+        Decompress the data by slices, so that a small compressed payload can't
+        be inflated into more than ``max_decoded_size`` bytes plus the output of
+        a single slice before DecodeError is raised.
+        """
+        assert self._decoder is not None and self.max_decoded_size is not None
+        decoded = []
+        for start in range(0, len(data), DECOMPRESS_SLICE_SIZE):
+            chunk = self._decoder.decompress(
+                data[start : start + DECOMPRESS_SLICE_SIZE]
+            )
+            self._add_decoded_size(len(chunk))
+            decoded.append(chunk)
+        return b"".join(decoded)
+
+    def _add_decoded_size(self, size: int) -> None:
+        assert self.max_decoded_size is not None
+        self._decoded_size += size
+        if self._decoded_size > self.max_decoded_size:
+            raise DecodeError(
+                "Decoded content is larger than max_decoded_size=%d bytes"
+                % self.max_decoded_size
+            )
+
     def _flush_decoder(self) -> bytes:
         """
         Flushes the decoder. Should only be called if the decoder is actually
         being used.
         """
         if self._decoder:
-            return self._decoder.decompress(b"") + self._decoder.flush()
+            data = self._decoder.decompress(b"") + self._decoder.flush()
+            if self.max_decoded_size is not None:
+                self._add_decoded_size(len(data))
+            return data
         return b""
 
     # Compatibility methods for `io` module
@@ -403,6 +520,12 @@ class HTTPResponse(BaseHTTPResponse):
     :param enforce_content_length:
         Enforce content length checking. Body returned by server must match
         value of Content-Length header, if present. Otherwise, raise error.
+
+    :param max_decoded_size:
+        Maximum number of bytes the body can be decoded into, if the body is
+        compressed. :class:`~urllib3.exceptions.DecodeError` is raised as soon
+        as decoding the body goes past it, to protect against decompression bombs.
+        ``None`` (the default) means no limit.
     """
 
     def __init__(
@@ -423,6 +546,7 @@ class HTTPResponse(BaseHTTPResponse):
         request_method: Optional[str] = None,
         request_url: Optional[str] = None,
         auto_close: bool = True,
+        max_decoded_size: Optional[int] = None,
     ) -> None:
         super().__init__(
             headers=headers,
@@ -432,6 +556,7 @@ class HTTPResponse(BaseHTTPResponse):
             decode_content=decode_content,
             request_url=request_url,
             retries=retries,
+            max_decoded_size=max_decoded_size,
         )
 
         self.enforce_content_length = enforce_content_length
@@ -622,6 +747,81 @@ class HTTPResponse(BaseHTTPResponse):
             if self._original_response and self._original_response.isclosed():
                 self.release_conn()
 
+    def _raw_read(self, amt: Optional[int] = None) -> bytes:
+        """
+        Reads ``amt`` bytes from the underlying file object, without decoding them.
+        """
+        if self._fp is None:
+            return None  # type: ignore[return-value]
+
+        fp_closed = getattr(self._fp, "closed", False)
+
+        with self._error_catcher():
+            if amt is None:
+                # cStringIO doesn't like amt=None
+                data = self._fp.read() if not fp_closed else b""
+            else:
+                data = self._fp.read(amt) if not fp_closed else b""
+                if amt != 0 and not data:
+                    self._on_eof()
+
+        self._count_raw_bytes(len(data))
+        return data
+
+    def _raw_readinto(self, b: memoryview) -> int:
+        """
+        Reads up to ``len(b)`` bytes from the underlying file object straight
+        into ``b``, without decoding them.
+        """
+        assert self._fp is not None
+        fp_closed = getattr(self._fp, "closed", False)
+
+        with self._error_catcher():
+            n = self._fp.readinto(b) if not fp_closed else 0
+            if len(b) != 0 and not n:
+                self._on_eof()
+
+        self._count_raw_bytes(n)
+        return n
+
+    def _on_eof(self) -> None:
+        # Platform-specific: Buggy versions of Python.
+        # Close the connection when no data is returned
+        #
+        # This is redundant to what httplib/http.client _should_
+        # already do.  However, versions of python released before
+        # December 15, 2012 (http://bugs.python.org/issue16298) do
+        # not properly close the connection in all cases. There is
+        # no harm in redundantly calling close.
+        self._fp.close()  # type: ignore[union-attr]
+        if (
+            self.enforce_content_length
+            and self.length_remaining is not None
+            and self.length_remaining != 0
+        ):
+            # This is an edge case that httplib failed to cover due
+            # to concerns of backward compatibility. We're
+            # addressing it here to make sure IncompleteRead is
+            # raised during streaming, so all calls with incorrect
+            # Content-Length are caught.
+            raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+
+    def _count_raw_bytes(self, n: int) -> None:
+        self._fp_bytes_read += n
+        if self.length_remaining is not None:
+            self.length_remaining -= n
+
+    def _fill_decoded_buffer(self, amt: int, decode_content: bool) -> None:
+        """
+        Reads and decodes chunks of ``amt`` bytes until the decoded buffer holds
+        at least ``amt`` bytes or the end of the body is reached.
+        """
+        while len(self._decoded_buffer) < amt:
+            data = self._raw_read(amt)
+            if not data:
+                break
+            self._decoded_buffer.put(self._decode(data, decode_content, False))
+
     def read(
         self,
         amt: Optional[int] = None,
@@ -633,9 +833,10 @@ class HTTPResponse(BaseHTTPResponse):
         parameters: ``decode_content`` and ``cache_content``.
 
         :param amt:
-            How much of the content to read. If specified, caching is skipped
-            because it doesn't make sense to cache partial content as the full
-            response.
+            How much of the content to read. Exactly ``amt`` bytes are returned,
+            after decoding if the content is decoded, unless the end of the body
+            is reached. If specified, caching is skipped because it doesn't make
+            sense to cache partial content as the full response.
 
         :param decode_content:
             If True, will attempt to decode the body based on the
@@ -655,53 +856,41 @@ class HTTPResponse(BaseHTTPResponse):
         if self._fp is None:
             return None  # type: ignore[return-value]
 
-        flush_decoder = False
-        fp_closed = getattr(self._fp, "closed", False)
-
-        with self._error_catcher():
-            if amt is None:
-                # cStringIO doesn't like amt=None
-                data = self._fp.read() if not fp_closed else b""
-                flush_decoder = True
-            else:
-                cache_content = False
-                data = self._fp.read(amt) if not fp_closed else b""
-                if (
-                    amt != 0 and not data
-                ):  # Platform-specific: Buggy versions of Python.
-                    # Close the connection when no data is returned
-                    #
-                    # This is redundant to what httplib/http.client _should_
-                    # already do.  However, versions of python released before
-                    # December 15, 2012 (http://bugs.python.org/issue16298) do
-                    # not properly close the connection in all cases. There is
-                    # no harm in redundantly calling close.
-                    self._fp.close()
-                    flush_decoder = True
-                    if (
-                        self.enforce_content_length
-                        and self.length_remaining is not None
-                        and self.length_remaining != 0
-                    ):
-                        # This is an edge case that httplib failed to cover due
-                        # to concerns of backward compatibility. We're
-                        # addressing it here to make sure IncompleteRead is
-                        # raised during streaming, so all calls with incorrect
-                        # Content-Length are caught.
-                        raise IncompleteRead(self._fp_bytes_read, self.length_remaining)
+        if amt is not None:
+            # Decoded chunks rarely have the requested size: read and decode
+            # until there is enough, and keep the surplus for the next read.
+            self._fill_decoded_buffer(amt, decode_content)
+            return self._decoded_buffer.get(amt)
 
+        data = self._raw_read()
         if data:
-            self._fp_bytes_read += len(data)
-            if self.length_remaining is not None:
-                self.length_remaining -= len(data)
-
-            data = self._decode(data, decode_content, flush_decoder)
+            data = self._decode(data, decode_content, True)
+        if self._decoded_buffer:
+            data = self._decoded_buffer.get(len(self._decoded_buffer)) + data
 
-            if cache_content:
-                self._body = data
+        if data and cache_content:
+            self._body = data
 
         return data
 
+    def readinto(self, b: bytearray) -> int:
+        """
+        Reads up to ``len(b)`` bytes into ``b`` and returns the number of bytes
+        read. Undecoded content is read straight into ``b``, decoded content is
+        copied from the decoded buffer without intermediate bytes objects.
+        """
+        self._init_decoder()
+        if self._fp is None:
+            return 0
+
+        view = memoryview(b).cast("B")
+        decoding = self.decode_content and self._decoder is not None
+        if not decoding and not self._decoded_buffer and hasattr(self._fp, "readinto"):
+            return self._raw_readinto(view)
+
+        self._fill_decoded_buffer(len(view), self.decode_content)
+        return self._decoded_buffer.get_into(view)
+
     def stream(
         self, amt: Optional[int] = 2**16, decode_content: Optional[bool] = None
     ) -> Generator[bytes, None, None]:
@@ -711,10 +900,12 @@ class HTTPResponse(BaseHTTPResponse):
         connection is closed.
 
         :param amt:
-            How much of the content to read. The generator will return up to
-            much data per iteration, but may return less. This is particularly
-            likely when using compressed data. However, the empty string will
-            never be returned.
+            How much of the content to read. The generator will return exactly
+            this much data per iteration, after decoding, except for the last
+            one which may be shorter. Chunked responses are the exception: the
+            data of each chunk is returned as soon as it's received, split in
+            parts of at most ``amt`` bytes. However, the empty string will never
+            be returned.
 
         :param decode_content:
             If True, will attempt to decode the body based on the
@@ -723,7 +914,7 @@ class HTTPResponse(BaseHTTPResponse):
         if self.chunked and self.supports_chunked_reads():
             yield from self.read_chunked(amt, decode_content=decode_content)
         else:
-            while not is_fp_closed(self._fp):
+            while not is_fp_closed(self._fp) or self._decoded_buffer:
                 data = self.read(amt=amt, decode_content=decode_content)
 
                 if data:
@@ -861,6 +1052,8 @@ class HTTPResponse(BaseHTTPResponse):
             'content-encoding' header.
         """
         self._init_decoder()
+        if decode_content is None:
+            decode_content = self.decode_content
         # FIXME: Rewrite this method and make it a class with a better structured logic.
         if not self.chunked:
             raise ResponseNotChunked(
@@ -884,6 +1077,11 @@ class HTTPResponse(BaseHTTPResponse):
             if self._fp.fp is None:  # type: ignore[union-attr]
                 return None
 
+            # Left over by previous calls to read(amt)
+            if self._decoded_buffer:
+                buffered = self._decoded_buffer.get(len(self._decoded_buffer))
+                yield from _split_chunk(buffered, amt)
+
             while True:
                 self._update_chunk_length()
                 if self.chunk_left == 0:
@@ -892,8 +1090,9 @@ class HTTPResponse(BaseHTTPResponse):
                 decoded = self._decode(
                     chunk, decode_content=decode_content, flush_decoder=False
                 )
-                if decoded:
-                    yield decoded
+                # Not held back until there are amt bytes: the next chunk may
+                # only be sent much later, e.g. with server-sent events
+                yield from _split_chunk(decoded, amt)
 
             if decode_content:
                 # On CPython and PyPy, we should never need to flush the
@@ -901,7 +1100,7 @@ class HTTPResponse(BaseHTTPResponse):
                 # lets defensively do it anyway.
                 decoded = self._flush_decoder()
                 if decoded:  # Platform-specific: Jython.
-                    yield decoded
+                    yield from _split_chunk(decoded, amt)
 
             # Chunk content ends with \r\n: discard it.
             while self._fp is not None:
@@ -429,6 +429,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = ...,
     ca_cert_data: Union[None, str, bytes] = ...,
     tls_in_tls: "Literal[False]" = ...,
+    session: Optional["ssl.SSLSession"] = ...,
 ) -> "ssl.SSLSocket": ...
 
 
@@ -447,6 +448,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = ...,
     ca_cert_data: Union[None, str, bytes] = ...,
     tls_in_tls: bool = ...,
+    session: Optional["ssl.SSLSession"] = ...,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]: ...
 
 
@@ -464,6 +466,7 @@ def ssl_wrap_socket(
     key_password: Optional[str] = None,
     ca_cert_data: Union[None, str, bytes] = None,
     tls_in_tls: bool = False,
+    session: Optional["ssl.SSLSession"] = None,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]:
     """
     All arguments except for server_hostname, ssl_context, and ca_cert_dir have
@@ -487,6 +490,9 @@ def ssl_wrap_socket(
         passing as the cadata parameter to SSLContext.load_verify_locations()
     :param tls_in_tls:
         Use SSLTransport to wrap the existing socket.
+    :param session:
+        A previous :class:`ssl.SSLSession` of ``ssl_context`` to resume.
+        Not supported with ``tls_in_tls``.
     """
     context = ssl_context
     if context is None:
@@ -494,27 +500,16 @@ def ssl_wrap_socket(
         # We should consider deprecating and removing this code.
         context = create_urllib3_context(ssl_version, cert_reqs, ciphers=ciphers)
 
-    if ca_certs or ca_cert_dir or ca_cert_data:
-        try:
-            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
-        except OSError as e:
-            raise SSLError(e) from e
-
-    elif ssl_context is None and hasattr(context, "load_default_certs"):
-        # try to load OS default certs; works well on Windows.
-        context.load_default_certs()
-
-    # Attempt to detect if we get the goofy behavior of the
-    # keyfile being encrypted and OpenSSL asking for the
-    # passphrase via the terminal and instead error out.
-    if keyfile and key_password is None and _is_key_file_encrypted(keyfile):
-        raise SSLError("Client private key is encrypted, password is required")
-
-    if certfile:
-        if key_password is None:
-            context.load_cert_chain(certfile, keyfile)
-        else:
-            context.load_cert_chain(certfile, keyfile, key_password)
+    _load_ssl_context_certs(
+        context,
+        keyfile=keyfile,
+        certfile=certfile,
+        key_password=key_password,
+        ca_certs=ca_certs,
+        ca_cert_dir=ca_cert_dir,
+        ca_cert_data=ca_cert_data,
+        load_default_certs=ssl_context is None,
+    )
 
     try:
         if hasattr(context, "set_alpn_protocols"):
@@ -534,10 +529,52 @@ def ssl_wrap_socket(
             SNIMissingWarning,
         )
 
-    ssl_sock = _ssl_wrap_socket_impl(sock, context, tls_in_tls, server_hostname)
+    ssl_sock = _ssl_wrap_socket_impl(
+        sock, context, tls_in_tls, server_hostname, session
+    )
     return ssl_sock
 
 
+def _load_ssl_context_certs(
+    context: "ssl.SSLContext",
+    keyfile: Optional[str] = None,
+    certfile: Optional[str] = None,
+    key_password: Optional[str] = None,
+    ca_certs: Optional[str] = None,
+    ca_cert_dir: Optional[str] = None,
+    ca_cert_data: Union[None, str, bytes] = None,
+    load_default_certs: bool = False,
+) -> None:
+    """
+    Loads the CA certificates and the client certificate into an SSLContext.
+    Arguments have the same meaning as for :func:`ssl_wrap_socket`.
+
+    :param load_default_certs:
+        Whether to load the OS default CA certificates if none are given.
+    """
+    if ca_certs or ca_cert_dir or ca_cert_data:
+        try:
+            context.load_verify_locations(ca_certs, ca_cert_dir, ca_cert_data)
+        except OSError as e:
+            raise SSLError(e) from e
+
+    elif load_default_certs and hasattr(context, "load_default_certs"):
+        # try to load OS default certs; works well on Windows.
+        context.load_default_certs()
+
+    # Attempt to detect if we get the goofy behavior of the
+    # keyfile being encrypted and OpenSSL asking for the
+    # passphrase via the terminal and instead error out.
+    if keyfile and key_password is None and _is_key_file_encrypted(keyfile):
+        raise SSLError("Client private key is encrypted, password is required")
+
+    if certfile:
+        if key_password is None:
+            context.load_cert_chain(certfile, keyfile)
+        else:
+            context.load_cert_chain(certfile, keyfile, key_password)
+
+
 def is_ipaddress(hostname: Union[str, bytes]) -> bool:
     """Detects whether the hostname given is an IPv4 or IPv6 address.
     Also detects IPv6 addresses with Zone IDs.
@@ -567,6 +604,7 @@ def _ssl_wrap_socket_impl(
     ssl_context: "ssl.SSLContext",
     tls_in_tls: bool,
     server_hostname: Optional[str] = None,
+    session: Optional["ssl.SSLSession"] = None,
 ) -> Union["ssl.SSLSocket", "SSLTransportType"]:
     if tls_in_tls:
         if not SSLTransport:
@@ -578,4 +616,8 @@ def _ssl_wrap_socket_impl(
         SSLTransport._validate_ssl_context_for_tls_in_tls(ssl_context)
         return SSLTransport(sock, ssl_context, server_hostname)
 
+    if session is not None:
+        return ssl_context.wrap_socket(
+            sock, server_hostname=server_hostname, session=session
+        )
     return ssl_context.wrap_socket(sock, server_hostname=server_hostname)
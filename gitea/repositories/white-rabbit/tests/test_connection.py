@@ -0,0 +1,72 @@
+import os
+import shutil
+import ssl
+from pathlib import Path
+
+import pytest
+
+from dummyserver.server import DEFAULT_CA
+from dummyserver.testcase import HTTPSDummyServerTestCase
+from urllib3 import HTTPSConnectionPool
+from urllib3.connection import HTTPSConnection
+from urllib3.exceptions import SSLError
+
+
+class TestTLSSessionsTestCase(HTTPSDummyServerTestCase):
+    def new_conn(self, pool: HTTPSConnectionPool) -> HTTPSConnection:
+        conn = pool._get_conn()
+        assert isinstance(conn, HTTPSConnection)
+        return conn
+
+    def request(self, pool: HTTPSConnectionPool) -> bool:
+        conn = self.new_conn(pool)
+        conn.request("GET", "/", headers={"Connection": "close"})
+        resumed = conn.sock.session_reused  # type: ignore[union-attr]
+        assert conn.getresponse().read() == b"Dummy server!"
+        conn.close()
+        pool._put_conn(conn)
+        return resumed  # type: ignore[no-any-return]
+
+    def test_default_context_shared(self, tmp_path: Path) -> None:
+        ca_certs = str(tmp_path / "cacert.pem")
+        shutil.copy(DEFAULT_CA, ca_certs)
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=ca_certs) as pool:
+            context = self.new_conn(pool)._get_default_ssl_context()
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=ca_certs) as pool:
+            assert self.new_conn(pool)._get_default_ssl_context() is context
+
+        with HTTPSConnectionPool(
+            self.host, self.port, ca_certs=ca_certs, cert_reqs="CERT_NONE"
+        ) as pool:
+            other = self.new_conn(pool)._get_default_ssl_context()
+            assert other is not context
+            assert other.verify_mode == ssl.CERT_NONE
+
+        # Loaded again once the file is updated
+        stat = os.stat(ca_certs)
+        os.utime(ca_certs, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=ca_certs) as pool:
+            assert self.new_conn(pool)._get_default_ssl_context() is not context
+
+    def test_session_resumed(self) -> None:
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=DEFAULT_CA) as pool:
+            assert not self.request(pool)
+            assert self.request(pool)
+            assert self.request(pool)
+
+        # Not shared between pools
+        with HTTPSConnectionPool(self.host, self.port, ca_certs=DEFAULT_CA) as pool:
+            assert not self.request(pool)
+
+    def test_session_not_saved_when_not_verified(self) -> None:
+        with HTTPSConnectionPool(
+            self.host,
+            self.port,
+            cert_reqs="CERT_NONE",
+            assert_fingerprint="AA" * 32,
+        ) as pool:
+            conn = self.new_conn(pool)
+            with pytest.raises(SSLError, match="Fingerprints did not match"):
+                conn.connect()
+            conn.close()
+            assert len(pool._tls_sessions) == 0
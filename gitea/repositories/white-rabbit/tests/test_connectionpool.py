@@ -0,0 +1,98 @@
+import time
+from typing import Any, List
+
+import pytest
+
+from urllib3 import HTTPConnectionPool, connectionpool
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import EmptyPoolError
+
+
+class MockConnection(HTTPConnection):
+    def __init__(self) -> None:
+        super().__init__("localhost")
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def mock_pool(**kwargs: Any) -> HTTPConnectionPool:
+    pool = HTTPConnectionPool("localhost", **kwargs)
+    pool._new_conn = MockConnection  # type: ignore[assignment]
+    return pool
+
+
+def get_conn(pool: HTTPConnectionPool) -> MockConnection:
+    conn = pool._get_conn()
+    assert isinstance(conn, MockConnection)
+    return conn
+
+
+@pytest.fixture
+def dropped_checks(monkeypatch: pytest.MonkeyPatch) -> List[HTTPConnection]:
+    checked: List[HTTPConnection] = []
+
+    def is_connection_dropped(conn: HTTPConnection) -> bool:
+        checked.append(conn)
+        return False
+
+    monkeypatch.setattr(connectionpool, "is_connection_dropped", is_connection_dropped)
+    return checked
+
+
+class TestConnectionPool:
+    def test_idle_conns_closed(self, dropped_checks: List[HTTPConnection]) -> None:
+        with mock_pool(maxsize=3, idle_timeout=10) as pool:
+            older, old, recent = (get_conn(pool) for _ in range(3))
+            pool._put_conn(older)
+            pool._put_conn(old)
+            pool._put_conn(recent)
+            now = time.monotonic()
+            older.released_at = now - 30
+            old.released_at = now - 20
+
+            assert pool._get_conn() is recent
+            assert not recent.closed
+            # Closed, and opened again by the request made with it
+            assert pool._get_conn() is old
+            assert old.closed
+            # The older one is closed along with it, not reused later
+            assert older.closed
+            assert pool._get_conn() is not older
+            assert pool.num_discarded == 2
+            assert dropped_checks == [recent]
+
+    def test_liveness_check_skipped(self, dropped_checks: List[HTTPConnection]) -> None:
+        with mock_pool(liveness_check_after=5) as pool:
+            conn = get_conn(pool)
+            conn.sock = object()
+            pool._put_conn(conn)
+            assert pool._get_conn() is conn
+            assert dropped_checks == []
+
+            pool._put_conn(conn)
+            conn.released_at = time.monotonic() - 10
+            assert pool._get_conn() is conn
+            assert dropped_checks == [conn]
+
+    def test_counters(self, dropped_checks: List[HTTPConnection]) -> None:
+        with mock_pool(maxsize=1, block=True) as pool:
+            conn = get_conn(pool)
+            assert (pool.num_checkouts, pool.num_waits) == (1, 0)
+            with pytest.raises(EmptyPoolError):
+                pool._get_conn(timeout=0.01)
+            assert (pool.num_checkouts, pool.num_waits) == (2, 1)
+            pool._put_conn(conn)
+            assert pool._get_conn() is conn
+            assert (pool.num_checkouts, pool.num_waits) == (3, 1)
+
+        with mock_pool(maxsize=1) as pool:
+            conn = get_conn(pool)
+            other = get_conn(pool)
+            pool._put_conn(conn)
+            assert pool.num_discarded == 0
+            # The pool is full
+            pool._put_conn(other)
+            assert other.closed
+            assert pool.num_discarded == 1
@@ -0,0 +1,153 @@
+import io
+import zlib
+from http.client import HTTPResponse as httplib_HTTPResponse
+from typing import List
+
+import brotli
+import pytest
+
+from urllib3.exceptions import DecodeError
+from urllib3.response import ContentDecoder, HTTPResponse
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == "deflate":
+        return zlib.compress(data)
+    return brotli.compress(data)  # type: ignore[no-any-return]
+
+
+class MockSock:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def makefile(self, mode: str) -> io.BytesIO:
+        return io.BytesIO(self.data)
+
+
+def chunked_response(
+    chunks: List[bytes], headers: dict = {}, **kwargs: object
+) -> HTTPResponse:
+    body = b"".join(b"%x\r\n%s\r\n" % (len(chunk), chunk) for chunk in chunks)
+    sock = MockSock(
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + body + b"0\r\n\r\n"
+    )
+    r = httplib_HTTPResponse(sock, method="GET")  # type: ignore[arg-type]
+    r.begin()
+    return HTTPResponse(
+        r,
+        headers={"transfer-encoding": "chunked", **headers},
+        preload_content=False,
+        original_response=r,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class FlushingDecoder(ContentDecoder):
+    """Only returns the decoded data when flushed."""
+
+    def __init__(self) -> None:
+        self.data = b""
+
+    def decompress(self, data: bytes) -> bytes:
+        self.data += data
+        return b""
+
+    def flush(self) -> bytes:
+        return self.data * 10
+
+
+class TestResponse:
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate", "br"])
+    def test_read_exact_amt(self, encoding: str) -> None:
+        data = bytes(range(256)) * 40
+        fp = io.BytesIO(compress(data, encoding))
+        r = HTTPResponse(
+            fp, headers={"content-encoding": encoding}, preload_content=False
+        )
+        parts = [r.read(100) for _ in range(len(data) // 100)]
+        assert all(len(part) == 100 for part in parts)
+        assert b"".join(parts) + r.read() == data
+        assert r.read(100) == b""
+
+    def test_stream_exact_amt(self) -> None:
+        data = b"foo" * 1000
+        fp = io.BytesIO(compress(data, "gzip"))
+        r = HTTPResponse(
+            fp, headers={"content-encoding": "gzip"}, preload_content=False
+        )
+        parts = list(r.stream(7))
+        assert [len(part) for part in parts[:-1]] == [7] * (len(parts) - 1)
+        assert 0 < len(parts[-1]) <= 7
+        assert b"".join(parts) == data
+
+    def test_readinto(self) -> None:
+        data = b"foo" * 1000
+        fp = io.BytesIO(compress(data, "deflate"))
+        r = HTTPResponse(
+            fp, headers={"content-encoding": "deflate"}, preload_content=False
+        )
+        b = bytearray(10)
+        assert r.readinto(b) == 10
+        assert b == data[:10]
+        assert io.BufferedReader(r).read() == data[10:]  # type: ignore[arg-type]
+
+    def test_readinto_not_decoded(self) -> None:
+        r = HTTPResponse(io.BytesIO(b"foobar"), preload_content=False)
+        b = bytearray(4)
+        assert r.readinto(b) == 4
+        assert b == b"foob"
+        assert r.readinto(b) == 2
+        assert b[:2] == b"ar"
+        assert r.readinto(b) == 0
+
+    def test_max_decoded_size(self) -> None:
+        fp = io.BytesIO(compress(b"\0" * 100000, "gzip"))
+        r = HTTPResponse(
+            fp,
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+            max_decoded_size=1000,
+        )
+        with pytest.raises(DecodeError, match="max_decoded_size=1000"):
+            r.read()
+
+    def test_max_decoded_size_counts_flush(self) -> None:
+        r = HTTPResponse(
+            io.BytesIO(b"x" * 100),
+            headers={"content-encoding": "gzip"},
+            preload_content=False,
+            max_decoded_size=500,
+        )
+        r._decoder = FlushingDecoder()
+        with pytest.raises(DecodeError, match="max_decoded_size=500"):
+            r.read()
+
+    def test_chunked_not_held_back(self) -> None:
+        r = chunked_response([b"hello", b"world"])
+        # Each chunk as soon as it's received, even if shorter than amt
+        assert list(r.read_chunked(100)) == [b"hello", b"world"]
+
+    def test_chunked_split_at_amt(self) -> None:
+        r = chunked_response([b"hello", b"world"])
+        assert list(r.stream(3)) == [b"hel", b"lo", b"wor", b"ld"]
+
+    def test_chunked_decode_content_default(self) -> None:
+        data = compress(b"foo" * 100, "gzip")
+        headers = {"content-encoding": "gzip"}
+
+        r = chunked_response([data[:10], data[10:]], headers, decode_content=False)
+        assert b"".join(r.read_chunked()) == data
+
+        r = chunked_response([data[:10], data[10:]], headers)
+        assert b"".join(r.read_chunked()) == b"foo" * 100
+
+    def test_chunked_max_decoded_size(self) -> None:
+        data = compress(b"\0" * 100000, "gzip")
+        r = chunked_response(
+            [data], {"content-encoding": "gzip"}, max_decoded_size=1000
+        )
+        with pytest.raises(DecodeError, match="max_decoded_size=1000"):
+            list(r.read_chunked())